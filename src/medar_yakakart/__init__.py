@@ -1,2 +1,7 @@
 __all__ = ['app']
 __version__ = '3.0.0'
+
+import time as _time
+
+# Başlangıç süresi ölçümü için (pencere hazır olduğunda loga yazılır)
+STARTED_AT = _time.perf_counter()
@@ -16,144 +16,34 @@ Yeni Özellikler:
 """
 
 from pathlib import Path
-from io import BytesIO
 import threading
 import os
-import sys
-import math
-import zipfile
-import shutil
-import json
+import time
+import multiprocessing
+from collections import deque, OrderedDict
 from datetime import datetime
-from typing import List, Tuple, Optional, Dict, Any
-
-import fitz  # PyMuPDF
-from docx import Document
-from docx.shared import Cm
-from docx.enum.section import WD_SECTION
-from PIL import Image, ImageTk
+from typing import List, Tuple, Dict, Optional
 
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
-import subprocess
-
-# ================== GENEL AYARLAR ==================
-
-if getattr(sys, "frozen", False):
-    BASE_DIR = Path(sys.executable).resolve().parent
-else:
-    BASE_DIR = Path(__file__).resolve().parent
-
-# Yapılandırma dosyaları
-CONFIG_FILE = BASE_DIR / "config.json"
-PROFILES_FILE = BASE_DIR / "profiles.json"
-STATS_FILE = BASE_DIR / "stats.json"
-
-# 7-Zip desteği
-SEVEN_ZIP_SUPPORT = False
-SEVEN_ZIP_PATH = None
-
-def find_7zip():
-    """7-Zip'i sistemde bul"""
-    global SEVEN_ZIP_SUPPORT, SEVEN_ZIP_PATH
-    
-    possible_paths = [
-        BASE_DIR / "7z.exe",
-        Path("C:/Program Files/7-Zip/7z.exe"),
-        Path("C:/Program Files (x86)/7-Zip/7z.exe"),
-    ]
-    
-    for path in possible_paths:
-        if path.exists():
-            SEVEN_ZIP_PATH = str(path)
-            SEVEN_ZIP_SUPPORT = True
-            return True
-    
-    seven_zip_cmd = shutil.which("7z.exe")
-    if seven_zip_cmd:
-        SEVEN_ZIP_PATH = seven_zip_cmd
-        SEVEN_ZIP_SUPPORT = True
-        return True
-    
-    return False
-
-find_7zip()
-
-try:
-    import rarfile
-    RAR_SUPPORT = True
-except ImportError:
-    RAR_SUPPORT = False
-
-# Sürükle-bırak desteği
-try:
-    from tkinterdnd2 import DND_FILES, TkinterDnD
-    DND_SUPPORT = True
-except ImportError:
-    DND_SUPPORT = False
 
-ICON_PATH = BASE_DIR / "medar.ico"
+# Arayüzden bağımsız işlemler core modülündedir. Tamamı buradan da erişilebilir
+# kalır; eski içe aktarmalar (medar_yakakart.app.generate_doc_from_pdfs vb.) bozulmaz.
+from .core import *  # noqa: F401,F403
+from . import STARTED_AT
 
-# ================== VARSAYILAN AYARLAR ==================
 
-DEFAULT_CONFIG = {
-    "card_height_cm": 5.81,
-    "card_width_cm": 9.2,
-    "front_margins": {
-        "top": 1.27,
-        "bottom": 1.27,
-        "left": 1.27,
-        "right": 1.27
-    },
-    "back_margins": {
-        "top": 1.27,
-        "bottom": 1.27,
-        "left": 0.7,
-        "right": 1.27
-    },
-    "render_dpi": 300,
-    "cards_per_page": 8,
-    "card_spacing_cm": 0.0,
-    "output_dir": str(BASE_DIR / "output"),
-    "output_format": "docx",  # docx, pdf, both
-    "filename_template": "kartlar_{date}_{time}",
-    "theme": "light",
-    "last_profile": "Varsayılan"
-}
+def _load_image_tk():
+    from PIL import ImageTk
+    return ImageTk
 
-DEFAULT_PROFILES = {
-    "Varsayılan": {
-        "card_height_cm": 5.81,
-        "card_width_cm": 9.2,
-        "front_margins": {"top": 1.27, "bottom": 1.27, "left": 1.27, "right": 1.27},
-        "back_margins": {"top": 1.27, "bottom": 1.27, "left": 0.7, "right": 1.27},
-        "render_dpi": 300,
-        "cards_per_page": 8
-    },
-    "Personel Kartı": {
-        "card_height_cm": 5.5,
-        "card_width_cm": 8.5,
-        "front_margins": {"top": 1.0, "bottom": 1.0, "left": 1.0, "right": 1.0},
-        "back_margins": {"top": 1.0, "bottom": 1.0, "left": 0.8, "right": 1.0},
-        "render_dpi": 300,
-        "cards_per_page": 8
-    },
-    "Ziyaretçi Kartı": {
-        "card_height_cm": 5.0,
-        "card_width_cm": 8.0,
-        "front_margins": {"top": 1.5, "bottom": 1.5, "left": 1.5, "right": 1.5},
-        "back_margins": {"top": 1.5, "bottom": 1.5, "left": 1.2, "right": 1.5},
-        "render_dpi": 250,
-        "cards_per_page": 8
-    }
-}
 
-DEFAULT_STATS = {
-    "total_cards": 0,
-    "total_sessions": 0,
-    "last_session_date": None,
-    "last_session_cards": 0
-}
+ImageTk = LazyImport("PIL.ImageTk", _load_image_tk)
+
+# Sürükle-bırak desteği (tkinterdnd2, pencere oluşturulurken create_root içinde yüklenir)
+DND_SUPPORT = False
+
+ICON_PATH = BASE_DIR / "medar.ico"
 
 # ================== TEMA TANIMLARI ==================
 
@@ -204,362 +94,98 @@ THEMES = {
     }
 }
 
-# ================== YARDIMCI FONKSİYONLAR ==================
-
-def load_config() -> Dict[str, Any]:
-    """Yapılandırmayı yükle"""
-    try:
-        if CONFIG_FILE.exists():
-            with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-                # Eksik anahtarları varsayılanlarla doldur
-                for key, value in DEFAULT_CONFIG.items():
-                    if key not in config:
-                        config[key] = value
-                return config
-    except Exception:
-        pass
-    return DEFAULT_CONFIG.copy()
-
-
-def save_config(config: Dict[str, Any]):
-    """Yapılandırmayı kaydet"""
-    try:
-        with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
-    except Exception as e:
-        print(f"Config kaydetme hatası: {e}")
-
-
-def load_profiles() -> Dict[str, Dict]:
-    """Profilleri yükle"""
-    try:
-        if PROFILES_FILE.exists():
-            with open(PROFILES_FILE, 'r', encoding='utf-8') as f:
-                profiles = json.load(f)
-                # Varsayılan profilleri ekle
-                for name, profile in DEFAULT_PROFILES.items():
-                    if name not in profiles:
-                        profiles[name] = profile
-                return profiles
-    except Exception:
-        pass
-    return DEFAULT_PROFILES.copy()
-
-
-def save_profiles(profiles: Dict[str, Dict]):
-    """Profilleri kaydet"""
-    try:
-        with open(PROFILES_FILE, 'w', encoding='utf-8') as f:
-            json.dump(profiles, f, indent=2, ensure_ascii=False)
-    except Exception as e:
-        print(f"Profil kaydetme hatası: {e}")
-
-
-def load_stats() -> Dict[str, Any]:
-    """İstatistikleri yükle"""
-    try:
-        if STATS_FILE.exists():
-            with open(STATS_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
-    except Exception:
-        pass
-    return DEFAULT_STATS.copy()
+# ================== ÖNİZLEME SERVİSİ ==================
 
+class PreviewService:
+    """Önizleme küçük resimlerini arka plan thread'inde üreten servis
 
-def save_stats(stats: Dict[str, Any]):
-    """İstatistikleri kaydet"""
-    try:
-        with open(STATS_FILE, 'w', encoding='utf-8') as f:
-            json.dump(stats, f, indent=2, ensure_ascii=False)
-    except Exception as e:
-        print(f"İstatistik kaydetme hatası: {e}")
-
-
-def update_stats(cards_created: int):
-    """İstatistikleri güncelle"""
-    stats = load_stats()
-    stats["total_cards"] += cards_created
-    stats["total_sessions"] += 1
-    stats["last_session_date"] = datetime.now().strftime("%Y-%m-%d %H:%M")
-    stats["last_session_cards"] = cards_created
-    save_stats(stats)
-    return stats
-
-
-# ================== ARŞİV ÇIKARMA FONKSİYONLARI ==================
+    Son kullanılan küçük resimler bellekte (LRU) tutulur. Yeni bir istek
+    geldiğinde bekleyen eski istekler iptal edilir; o sırada render edilen
+    dosyanın sonucu yalnızca belleğe yazılır, ekrana gönderilmez. Sonuçlar
+    Tk ana thread'ine root.after ile teslim edilir.
+    """
 
-TEMP_EXTRACT_DIR = BASE_DIR / "temp_extracted"
-
-
-def extract_with_7zip(archive_path: Path, extract_to: Path):
-    """7-Zip kullanarak arşivi çıkar"""
-    if not SEVEN_ZIP_SUPPORT:
-        return None
-    
-    try:
-        cmd = [
-            SEVEN_ZIP_PATH, 'x', str(archive_path),
-            f'-o{extract_to}', '-y', '*.pdf',
-        ]
-        
-        result = subprocess.run(
-            cmd, capture_output=True, text=True,
-            creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
-        )
-        
-        if result.returncode == 0:
-            return list(extract_to.glob('**/*.pdf'))
-        else:
-            raise RuntimeError(f"7-Zip hata kodu: {result.returncode}")
-    except Exception as e:
-        raise RuntimeError(f"7-Zip ile çıkarma hatası: {str(e)}")
-
-
-def extract_with_zipfile(archive_path: Path, extract_to: Path):
-    """Python zipfile ile ZIP çıkar"""
-    extracted_pdfs = []
-    
-    with zipfile.ZipFile(archive_path, 'r') as zip_ref:
-        for file_info in zip_ref.namelist():
-            if file_info.lower().endswith('.pdf'):
-                safe_name = Path(file_info).name
-                extract_path = extract_to / safe_name
-                
-                with zip_ref.open(file_info) as source:
-                    with open(extract_path, 'wb') as target:
-                        shutil.copyfileobj(source, target)
-                
-                extracted_pdfs.append(extract_path)
-    
-    return extracted_pdfs
-
-
-def extract_with_rarfile(archive_path: Path, extract_to: Path):
-    """rarfile ile RAR çıkar"""
-    if not RAR_SUPPORT:
-        raise RuntimeError("rarfile modülü yüklü değil")
-    
-    extracted_pdfs = []
-    
-    with rarfile.RarFile(archive_path, 'r') as rar_ref:
-        for file_info in rar_ref.namelist():
-            if file_info.lower().endswith('.pdf'):
-                safe_name = Path(file_info).name
-                extract_path = extract_to / safe_name
-                
-                with rar_ref.open(file_info) as source:
-                    with open(extract_path, 'wb') as target:
-                        shutil.copyfileobj(source, target)
-                
-                extracted_pdfs.append(extract_path)
-    
-    return extracted_pdfs
-
-
-def extract_archive(archive_path: Path, extract_to: Path):
-    """Arşivi çıkar"""
-    archive_path = Path(archive_path)
-    extract_to = Path(extract_to)
-    extract_to.mkdir(parents=True, exist_ok=True)
-    
-    try:
-        if SEVEN_ZIP_SUPPORT:
-            extracted = extract_with_7zip(archive_path, extract_to)
-            if extracted:
-                return extracted
-        
-        if archive_path.suffix.lower() == '.zip':
-            return extract_with_zipfile(archive_path, extract_to)
-        
-        elif archive_path.suffix.lower() == '.rar':
-            if RAR_SUPPORT:
-                return extract_with_rarfile(archive_path, extract_to)
-            else:
-                raise RuntimeError("RAR desteği yok! 7-Zip kurun.")
-        
-        else:
-            raise ValueError(f"Desteklenmeyen format: {archive_path.suffix}")
-    
-    except Exception as e:
-        raise RuntimeError(f"{archive_path.name} çıkarılırken hata: {str(e)}")
-
-
-def clear_temp_directory():
-    """Geçici klasörü temizle"""
-    if TEMP_EXTRACT_DIR.exists():
-        shutil.rmtree(TEMP_EXTRACT_DIR)
-    TEMP_EXTRACT_DIR.mkdir(parents=True, exist_ok=True)
-
-
-# ================== PDF İŞLEME FONKSİYONLARI ==================
-
-def pdf_to_front_back(pdf_path: Path, dpi: int = 300) -> Tuple[Image.Image, Image.Image]:
-    """PDF'den ön ve arka görüntüleri al"""
-    doc = fitz.open(str(pdf_path))
-    if len(doc) < 2:
-        doc.close()
-        raise ValueError(f"{pdf_path.name} içinde 2 sayfa yok.")
-
-    zoom = dpi / 72
-    mat = fitz.Matrix(zoom, zoom)
-
-    def page_to_image(page):
-        pix = page.get_pixmap(matrix=mat, alpha=False)
-        return Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-
-    front = page_to_image(doc[0])
-    back = page_to_image(doc[1])
-    doc.close()
-    return front, back
-
-
-def get_pdf_preview(pdf_path: Path, max_size: Tuple[int, int] = (200, 150)) -> Optional[Image.Image]:
-    """PDF'in önizleme görüntüsünü al"""
-    try:
-        doc = fitz.open(str(pdf_path))
-        if len(doc) < 1:
-            doc.close()
-            return None
-        
-        page = doc[0]
-        pix = page.get_pixmap(matrix=fitz.Matrix(0.5, 0.5), alpha=False)
-        img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-        doc.close()
-        
-        # Boyutlandır
-        img.thumbnail(max_size, Image.Resampling.LANCZOS)
-        return img
-    except Exception:
-        return None
-
-
-def pil_to_stream(img: Image.Image) -> BytesIO:
-    """PIL Image'ı BytesIO stream'e çevir"""
-    buf = BytesIO()
-    img.save(buf, format="PNG")
-    buf.seek(0)
-    return buf
-
-
-def add_grid_page(doc: Document, images: List[Image.Image], rotate_degrees: int,
-                  card_height_cm: float, card_width_cm: float,
-                  cards_per_row: int = 2, reverse_rows: bool = False):
-    """Görüntüleri grid halinde sayfaya ekle"""
-    if not images:
-        return
-
-    max_cols = cards_per_row
-    total = len(images)
-    rows = math.ceil(total / max_cols)
-
-    table = doc.add_table(rows=rows, cols=max_cols)
-    table.autofit = False
-
-    col_width = Cm(card_width_cm + 0.5)
-    for row in table.rows:
-        for cell in row.cells:
-            cell.width = col_width
-
-    idx = 0
-    for r in range(rows):
-        col_range = range(max_cols - 1, -1, -1) if reverse_rows else range(max_cols)
-        
-        for c in col_range:
-            if idx >= total:
-                break
-
-            img = images[idx].rotate(rotate_degrees, expand=True)
-            cell = table.rows[r].cells[c]
-            paragraph = cell.paragraphs[0]
-            run = paragraph.add_run()
-            stream = pil_to_stream(img)
-            run.add_picture(stream, height=Cm(card_height_cm))
-            idx += 1
-
-
-def generate_doc_from_pdfs(pdf_paths: List[Path], card_height_cm: float, card_width_cm: float,
-                           front_margins: Tuple, back_margins: Tuple,
-                           render_dpi: int = 300, cards_per_page: int = 8,
-                           output_path: Path = None,
-                           progress_callback=None, status_callback=None) -> Path:
-    """PDF'lerden Word dosyası oluştur"""
-    
-    if status_callback:
-        status_callback("PDF'ler okunuyor...")
-
-    output_dir = output_path.parent if output_path else BASE_DIR / "output"
-    output_dir.mkdir(exist_ok=True, parents=True)
-    
-    if not output_path:
-        output_path = output_dir / "kartlar.docx"
-
-    # PDF'lerden görüntüleri al
-    person_cards = []
-    total_pdfs = len(pdf_paths)
-    
-    for i, pdf in enumerate(pdf_paths):
-        try:
-            front, back = pdf_to_front_back(pdf, dpi=render_dpi)
-            person_cards.append((front, back))
-            
-            if progress_callback:
-                progress_callback((i + 1) / total_pdfs * 50)  # İlk %50
-            if status_callback:
-                status_callback(f"Yüklendi: {pdf.name} ({i+1}/{total_pdfs})")
-        except Exception as e:
-            if status_callback:
-                status_callback(f"HATA: {pdf.name} → {e}")
-
-    if not person_cards:
-        raise RuntimeError("Hiç geçerli PDF işlenemedi.")
-
-    if status_callback:
-        status_callback("Word dosyası oluşturuluyor...")
-
-    doc = Document()
-
-    # İlk section
-    front_section = doc.sections[0]
-    front_section.top_margin = Cm(front_margins[0])
-    front_section.bottom_margin = Cm(front_margins[1])
-    front_section.left_margin = Cm(front_margins[2])
-    front_section.right_margin = Cm(front_margins[3])
-
-    first_group = True
-    total_groups = math.ceil(len(person_cards) / cards_per_page)
-
-    for group_idx, i in enumerate(range(0, len(person_cards), cards_per_page)):
-        group = person_cards[i:i + cards_per_page]
-
-        # ÖN YÜZ
-        if not first_group:
-            front_section = doc.add_section(WD_SECTION.NEW_PAGE)
-            front_section.top_margin = Cm(front_margins[0])
-            front_section.bottom_margin = Cm(front_margins[1])
-            front_section.left_margin = Cm(front_margins[2])
-            front_section.right_margin = Cm(front_margins[3])
-
-        front_images = [f for (f, _) in group]
-        add_grid_page(doc, front_images, 90, card_height_cm, card_width_cm, reverse_rows=False)
-
-        # ARKA YÜZ
-        back_section = doc.add_section(WD_SECTION.NEW_PAGE)
-        back_section.top_margin = Cm(back_margins[0])
-        back_section.bottom_margin = Cm(back_margins[1])
-        back_section.left_margin = Cm(back_margins[2])
-        back_section.right_margin = Cm(back_margins[3])
-
-        back_images = [b for (_, b) in group]
-        add_grid_page(doc, back_images, 270, card_height_cm, card_width_cm, reverse_rows=True)
-
-        first_group = False
-        
-        if progress_callback:
-            progress_callback(50 + (group_idx + 1) / total_groups * 50)  # Son %50
+    def __init__(self, root, cache=None, size: Tuple[int, int] = (180, 120), max_items: int = 128):
+        self.root = root
+        self.cache = cache
+        self.size = size
+        self.max_items = max_items
+
+        self._thumbnails = OrderedDict()
+        self._queue = deque()
+        self._cond = threading.Condition()
+        self._generation = 0
+
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def _remember(self, key, thumbnails):
+        with self._cond:
+            self._thumbnails[key] = thumbnails
+            self._thumbnails.move_to_end(key)
+            while len(self._thumbnails) > self.max_items:
+                self._thumbnails.popitem(last=False)
+
+    def _lookup(self, key):
+        with self._cond:
+            thumbnails = self._thumbnails.get(key)
+            if thumbnails is not None:
+                self._thumbnails.move_to_end(key)
+            return thumbnails
+
+    def request(self, pdf_path: Path, callback, prefetch: List[Path] = ()):
+        """Önizleme iste; callback(pdf_path, (ön, arka) veya None, hata) ana thread'de çağrılır
+
+        prefetch içindeki dosyalar (ör. listedeki komşular) sonradan hızlı
+        gösterilebilmesi için arka planda hazırlanır.
+        """
+        with self._cond:
+            self._generation += 1
+            generation = self._generation
+            self._queue.clear()
+
+            thumbnails = self._thumbnails.get(pdf_path)
+            if thumbnails is None:
+                self._queue.append((generation, pdf_path, callback))
+            for neighbour in prefetch:
+                if neighbour not in self._thumbnails:
+                    self._queue.append((generation, neighbour, None))
+            self._cond.notify()
+
+        if thumbnails is not None:
+            callback(pdf_path, thumbnails, None)
+
+    def cancel(self):
+        """Bekleyen istekleri iptal et"""
+        with self._cond:
+            self._generation += 1
+            self._queue.clear()
+
+    def _deliver(self, generation: int, callback, pdf_path: Path, thumbnails, error):
+        # Ana thread'de: seçim bu arada değiştiyse sonucu gösterme
+        if generation == self._generation:
+            callback(pdf_path, thumbnails, error)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._queue:
+                    self._cond.wait()
+                generation, pdf_path, callback = self._queue.popleft()
+
+            if callback is not None and generation != self._generation:
+                continue
+
+            thumbnails = self._lookup(pdf_path)
+            error = None
+            if thumbnails is None:
+                try:
+                    thumbnails = get_card_thumbnails(pdf_path, self.size, self.cache)
+                    self._remember(pdf_path, thumbnails)
+                except Exception as e:
+                    error = e
 
-    doc.save(output_path)
-    return output_path
+            if callback is not None:
+                self.root.after(0, self._deliver, generation, callback, pdf_path, thumbnails, error)
 
 
 # ================== ANA UYGULAMA ==================
@@ -572,10 +198,28 @@ class YakaKartApp:
         self.root.minsize(900, 700)
 
         # Veri
-        self.selected_files: List[Path] = []
+        self.selected_files = SourceList()
+        # Boyut/sayfa bilgisi istenmiş satırlar (yalnızca görünen satırlar için okunur)
+        self.file_details_requested = set()
+        self.file_details_queue = deque()
+        self.file_details_lock = threading.Lock()
+        self.file_details_running = False
+        self.file_details_after = None
         self.config = load_config()
         self.profiles = load_profiles()
         self.stats = load_stats()
+        self.render_cache = create_render_cache(self.config)
+        self.preview_service = PreviewService(root, self.render_cache)
+        self.duplicate_index = DuplicateIndex()
+        self.job_queue = JobQueue(
+            max_running=self.config.get("max_concurrent_jobs", 1),
+            cache=self.render_cache,
+            on_change=lambda job: self.root.after(0, self.refresh_queue_view),
+            on_finished=lambda job, error: self.root.after(0, self.on_job_finished, job, error)
+        )
+        self.closing = False
+        self.folder_watcher = None
+        self.watch_dialog = None
         self.current_theme = self.config.get("theme", "light")
         self.preview_image = None
 
@@ -594,6 +238,72 @@ class YakaKartApp:
         if last_profile in self.profiles:
             self.load_profile(last_profile)
 
+        # Kapatırken çalışan işi iptal et (iş kaydı korunur, sonra devam edilir)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
+        # Pencere çizildikten sonra arşiv araçlarını yokla, ağır modülleri yükle
+        self.root.after_idle(self.on_window_ready)
+
+    def on_window_ready(self):
+        """Pencere etkileşime hazır: başlangıç süresini yaz, arka plan hazırlığını başlat"""
+        self.add_log(f"🚀 Pencere hazır: {(time.perf_counter() - STARTED_AT) * 1000:.0f} ms")
+
+        def worker():
+            tools = probe_archive_tools()
+            if tools["seven_zip"]:
+                self.thread_safe_log(f"✅ 7-Zip: {tools['seven_zip']}")
+            else:
+                self.thread_safe_log("⚠️ 7-Zip bulunamadı (RAR/7Z için gerekli)")
+
+            warm_up_imports()
+            loaded = " | ".join(f"{name} {seconds * 1000:.0f} ms"
+                                for name, seconds in LAZY_IMPORT_TIMES.items())
+            self.thread_safe_log(f"📦 Arka planda yüklendi: {loaded}")
+
+            jobs = list_resumable_jobs()
+            if jobs:
+                self.root.after(0, self.offer_resume, jobs)
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def offer_resume(self, jobs: List[GenerationJob]):
+        """Önceki oturumdan kalan işleri yeniden kuyruğa almayı öner"""
+        lines = "\n".join(f"• {job.describe()}" for job in jobs[:5])
+        if len(jobs) > 5:
+            lines += f"\n… ve {len(jobs) - 5} iş daha"
+
+        if messagebox.askyesno(
+            "Yarıda Kalan İşler",
+            f"Önceki oturumdan tamamlanmamış {len(jobs)} iş var:\n\n{lines}\n\n"
+            f"Kuyruğa alınıp kaldıkları yerden devam edilsin mi?\n(Hayır: iş kayıtları silinir)"
+        ):
+            for job in reversed(jobs):  # en eskisi önce
+                self.job_queue.submit(job)
+            self.add_log(f"▶️ {len(jobs)} iş yeniden kuyruğa alındı")
+        else:
+            for job in jobs:
+                job.discard()
+            self.add_log(f"🗑️ {len(jobs)} iş kaydı silindi")
+
+    def on_close(self):
+        """Pencere kapatılıyor: çalışan işleri iptal et"""
+        if self.job_queue.active():
+            if not messagebox.askyesno(
+                "Çıkış",
+                "Kuyrukta süren işler var. Çıkılsın mı?\n\n"
+                "Tamamlanan sayfalar kaydedilir; bir sonraki açılışta kaldıkları yerden devam edebilirsiniz."
+            ):
+                return
+            # İş kayıtları "iptal edildi" olarak yazıldıktan sonra on_job_finished pencereyi kapatır
+            self.closing = True
+            self.set_status("Kapatılıyor...")
+            self.job_queue.cancel_all()
+            if self.job_queue.running():
+                return
+        if self.folder_watcher is not None:
+            self.folder_watcher.stop()
+        self.root.destroy()
+
     def apply_theme(self):
         """Temayı uygula"""
         theme = THEMES.get(self.current_theme, THEMES["light"])
@@ -615,6 +325,15 @@ class YakaKartApp:
         style.configure("TProgressbar",
                        background=theme["accent"],
                        troughcolor=theme["entry_bg"])
+
+        # Dosya listesi ve iş kuyruğu tabloları
+        style.configure("Treeview",
+                       background=theme["listbox_bg"],
+                       fieldbackground=theme["listbox_bg"],
+                       foreground=theme["listbox_fg"])
+        style.map("Treeview",
+                 background=[("selected", theme["listbox_select_bg"])],
+                 foreground=[("selected", theme["listbox_select_fg"])])
         
         self.theme = theme
         self.root.configure(bg=theme["bg"])
@@ -622,6 +341,7 @@ class YakaKartApp:
     def setup_dnd(self):
         """Sürükle-bırak ayarla"""
         if DND_SUPPORT:
+            from tkinterdnd2 import DND_FILES
             self.root.drop_target_register(DND_FILES)
             self.root.dnd_bind('<<Drop>>', self.on_drop)
 
@@ -635,14 +355,14 @@ class YakaKartApp:
             path = Path(f)
             if path.suffix.lower() == '.pdf':
                 pdf_files.append(path)
-            elif path.suffix.lower() in ['.zip', '.rar', '.7z']:
+            elif path.suffix.lower() in ARCHIVE_SUFFIXES:
                 archive_files.append(path)
         
         if pdf_files:
             self.add_files_to_list(pdf_files)
         
         if archive_files:
-            self.extract_and_add_archives(archive_files)
+            self.add_archives(archive_files)
 
     def create_ui(self):
         """Ana arayüzü oluştur"""
@@ -692,6 +412,21 @@ class YakaKartApp:
         )
         self.btn_theme.pack(side="right", padx=5)
 
+        # Sıcak klasör izleme
+        self.btn_watch = tk.Button(
+            settings_frame,
+            text="📂 Klasör İzle",
+            command=self.open_watch_dialog,
+            bg=theme["accent"],
+            fg=theme["button_fg"],
+            font=("Arial", 9, "bold"),
+            relief="flat",
+            cursor="hand2",
+            padx=10,
+            pady=5
+        )
+        self.btn_watch.pack(side="right", padx=5)
+
         # ========== ANA İÇERİK ==========
         main_frame = tk.Frame(self.root, bg=theme["bg"])
         main_frame.pack(fill="both", expand=True, padx=15, pady=10)
@@ -708,6 +443,7 @@ class YakaKartApp:
         # ----- SOL PANEL İÇERİĞİ -----
         self.create_file_section(left_panel)
         self.create_preview_section(left_panel)
+        self.create_queue_section(left_panel)
         self.create_log_section(left_panel)
 
         # ----- SAĞ PANEL İÇERİĞİ -----
@@ -756,7 +492,7 @@ class YakaKartApp:
         self.btn_select_archive = tk.Button(
             btn_container,
             text="📦 ZIP/RAR Aç",
-            command=self.select_and_extract_archives,
+            command=self.select_archives,
             bg="#9C27B0",
             fg=theme["button_fg"],
             font=("Arial", 9, "bold"),
@@ -800,23 +536,32 @@ class YakaKartApp:
         scrollbar = tk.Scrollbar(list_frame)
         scrollbar.pack(side="right", fill="y")
 
-        self.file_listbox = tk.Listbox(
-            list_frame,
-            height=8,
-            font=("Consolas", 9),
-            bg=theme["listbox_bg"],
-            fg=theme["listbox_fg"],
-            selectbackground=theme["listbox_select_bg"],
-            selectforeground=theme["listbox_select_fg"],
-            yscrollcommand=scrollbar.set,
-            selectmode=tk.EXTENDED
-        )
-        self.file_listbox.pack(side="left", fill="both", expand=True)
-        scrollbar.config(command=self.file_listbox.yview)
-
-        # Listbox event'leri
-        self.file_listbox.bind('<<ListboxSelect>>', self.on_file_select)
-        self.file_listbox.bind('<Delete>', lambda e: self.remove_selected_files())
+        # Satır kimliği source_key'dir; boyut ve sayfa sayısı yalnızca görünen satırlar için okunur
+        columns = ("name", "size", "pages", "status")
+        self.file_tree = ttk.Treeview(list_frame, columns=columns, show="headings",
+                                      height=8, selectmode="extended")
+        for column, title, width, anchor in (
+            ("name", "Dosya", 260, "w"),
+            ("size", "Boyut", 70, "e"),
+            ("pages", "Sayfa", 50, "e"),
+            ("status", "Durum", 90, "w"),
+        ):
+            self.file_tree.heading(column, text=title)
+            self.file_tree.column(column, width=width, anchor=anchor,
+                                  stretch=(column == "name"))
+
+        def on_scroll(first, last):
+            scrollbar.set(first, last)
+            self.schedule_file_details()
+
+        self.file_tree.configure(yscrollcommand=on_scroll)
+        self.file_tree.pack(side="left", fill="both", expand=True)
+        scrollbar.config(command=self.file_tree.yview)
+
+        # Liste event'leri
+        self.file_tree.bind('<<TreeviewSelect>>', self.on_file_select)
+        self.file_tree.bind('<Delete>', lambda e: self.remove_selected_files())
+        self.file_tree.bind('<Configure>', lambda e: self.schedule_file_details())
 
         # Liste kontrol butonları
         list_btn_frame = tk.Frame(file_frame, bg=theme["frame_bg"])
@@ -940,6 +685,71 @@ class YakaKartApp:
         )
         self.lbl_preview_name.pack()
 
+    def create_queue_section(self, parent):
+        """İş kuyruğu bölümü"""
+        theme = self.theme
+
+        queue_frame = tk.LabelFrame(
+            parent,
+            text=" ⏳ İş Kuyruğu ",
+            font=("Arial", 10, "bold"),
+            bg=theme["frame_bg"],
+            fg=theme["fg"],
+            padx=10,
+            pady=5
+        )
+        queue_frame.pack(fill="x", pady=(0, 10))
+
+        columns = ("name", "cards", "state", "progress", "message")
+        self.queue_tree = ttk.Treeview(queue_frame, columns=columns, show="headings",
+                                       height=4, selectmode="browse")
+        for column, title, width, anchor in (
+            ("name", "Çıktı", 170, "w"),
+            ("cards", "Kart", 50, "e"),
+            ("state", "Durum", 90, "w"),
+            ("progress", "İlerleme", 60, "e"),
+            ("message", "Son durum", 220, "w"),
+        ):
+            self.queue_tree.heading(column, text=title)
+            self.queue_tree.column(column, width=width, anchor=anchor,
+                                   stretch=(column == "message"))
+        self.queue_tree.pack(fill="x")
+
+        queue_btn_frame = tk.Frame(queue_frame, bg=theme["frame_bg"])
+        queue_btn_frame.pack(fill="x", pady=(5, 0))
+
+        for text, command, bg, fg in (
+            ("⬆️", lambda: self.move_job(-1), theme["tab_bg"], theme["fg"]),
+            ("⬇️", lambda: self.move_job(1), theme["tab_bg"], theme["fg"]),
+            ("⏹ İptal", self.cancel_selected_job, theme["error"], theme["button_fg"]),
+            ("↻ Yeniden Kuyruğa", self.requeue_selected_job, theme["accent"], theme["button_fg"]),
+            ("🧹 Bitenleri Temizle", self.clear_finished_jobs, theme["tab_bg"], theme["fg"]),
+        ):
+            tk.Button(
+                queue_btn_frame,
+                text=text,
+                command=command,
+                bg=bg,
+                fg=fg,
+                font=("Arial", 8),
+                relief="flat",
+                padx=8,
+                pady=2
+            ).pack(side="left", padx=(0, 5))
+
+        self.max_jobs_var = tk.StringVar(value=str(self.job_queue.max_running))
+        max_jobs_combo = ttk.Combobox(
+            queue_btn_frame,
+            textvariable=self.max_jobs_var,
+            values=["1", "2", "3", "4"],
+            width=3,
+            state="readonly"
+        )
+        max_jobs_combo.pack(side="right")
+        max_jobs_combo.bind("<<ComboboxSelected>>", self.on_max_jobs_change)
+        tk.Label(queue_btn_frame, text="Eşzamanlı:", bg=theme["frame_bg"],
+                 fg=theme["fg"], font=("Arial", 9)).pack(side="right", padx=(0, 5))
+
     def create_log_section(self, parent):
         """Log bölümü"""
         theme = self.theme
@@ -1068,17 +878,24 @@ class YakaKartApp:
         self.entry_width.grid(row=1, column=1, padx=5, pady=2)
         self.entry_width.insert(0, str(self.config["card_width_cm"]))
 
+        tk.Label(size_frame, text="Aralık (cm):", bg=theme["frame_bg"],
+                fg=theme["fg"], font=("Arial", 9)).grid(row=2, column=0, sticky="w", pady=2)
+        self.entry_spacing = tk.Entry(size_frame, width=10, font=("Arial", 9),
+                                      bg=theme["entry_bg"], fg=theme["entry_fg"])
+        self.entry_spacing.grid(row=2, column=1, padx=5, pady=2)
+        self.entry_spacing.insert(0, str(self.config.get("card_spacing_cm", 0.0)))
+
         # Gelişmiş ayarlar
         advanced_frame = tk.Frame(card_frame, bg=theme["frame_bg"])
         advanced_frame.pack(fill="x", pady=(10, 0))
 
         tk.Label(advanced_frame, text="DPI Kalitesi:", bg=theme["frame_bg"],
                 fg=theme["fg"], font=("Arial", 9)).grid(row=0, column=0, sticky="w", pady=2)
-        self.dpi_var = tk.StringVar(value=str(self.config.get("render_dpi", 300)))
+        self.dpi_var = tk.StringVar(value=self.dpi_to_text(self.config.get("render_dpi", 300)))
         dpi_combo = ttk.Combobox(
             advanced_frame,
             textvariable=self.dpi_var,
-            values=["150", "200", "250", "300", "350", "400"],
+            values=["Otomatik"] + [str(dpi) for dpi in DPI_CHOICES],
             width=8,
             state="readonly"
         )
@@ -1086,16 +903,132 @@ class YakaKartApp:
 
         tk.Label(advanced_frame, text="Sayfa başı kart:", bg=theme["frame_bg"],
                 fg=theme["fg"], font=("Arial", 9)).grid(row=1, column=0, sticky="w", pady=2)
-        self.cards_per_page_var = tk.StringVar(value=str(self.config.get("cards_per_page", 8)))
+        self.cards_per_page_var = tk.StringVar(
+            value=self.cards_per_page_to_text(self.config.get("cards_per_page", 8)))
         cards_combo = ttk.Combobox(
             advanced_frame,
             textvariable=self.cards_per_page_var,
-            values=["4", "6", "8"],
+            values=["Otomatik"] + [str(n) for n in CARDS_PER_PAGE_CHOICES],
             width=8,
             state="readonly"
         )
         cards_combo.grid(row=1, column=1, padx=5, pady=2)
 
+        tk.Label(advanced_frame, text="Paralel işlem:", bg=theme["frame_bg"],
+                fg=theme["fg"], font=("Arial", 9)).grid(row=2, column=0, sticky="w", pady=2)
+        self.workers_var = tk.StringVar(value=self.workers_to_text(self.config.get("workers", 0)))
+        workers_combo = ttk.Combobox(
+            advanced_frame,
+            textvariable=self.workers_var,
+            values=["Otomatik", "1", "2", "4", "6", "8"],
+            width=8,
+            state="readonly"
+        )
+        workers_combo.grid(row=2, column=1, padx=5, pady=2)
+
+        # Görüntü kodlama
+        tk.Label(advanced_frame, text="Görüntü biçimi:", bg=theme["frame_bg"],
+                fg=theme["fg"], font=("Arial", 9)).grid(row=3, column=0, sticky="w", pady=2)
+        self.image_format_var = tk.StringVar(value=self.config.get("image_format", "png"))
+        ttk.Combobox(
+            advanced_frame,
+            textvariable=self.image_format_var,
+            values=list(IMAGE_FORMATS),
+            width=8,
+            state="readonly"
+        ).grid(row=3, column=1, padx=5, pady=2)
+
+        tk.Label(advanced_frame, text="PNG sıkıştırma:", bg=theme["frame_bg"],
+                fg=theme["fg"], font=("Arial", 9)).grid(row=4, column=0, sticky="w", pady=2)
+        self.png_level_var = tk.StringVar(value=str(self.config.get("png_compress_level", 6)))
+        ttk.Combobox(
+            advanced_frame,
+            textvariable=self.png_level_var,
+            values=["1", "3", "6", "9"],
+            width=8,
+            state="readonly"
+        ).grid(row=4, column=1, padx=5, pady=2)
+
+        tk.Label(advanced_frame, text="JPEG kalite:", bg=theme["frame_bg"],
+                fg=theme["fg"], font=("Arial", 9)).grid(row=5, column=0, sticky="w", pady=2)
+        self.jpeg_quality_var = tk.StringVar(value=str(self.config.get("jpeg_quality", 90)))
+        ttk.Combobox(
+            advanced_frame,
+            textvariable=self.jpeg_quality_var,
+            values=["75", "85", "90", "95"],
+            width=8,
+            state="readonly"
+        ).grid(row=5, column=1, padx=5, pady=2)
+
+        tk.Label(advanced_frame, text="JPEG renk örnekleme:", bg=theme["frame_bg"],
+                fg=theme["fg"], font=("Arial", 9)).grid(row=6, column=0, sticky="w", pady=2)
+        self.jpeg_subsampling_var = tk.StringVar(value=self.config.get("jpeg_subsampling", "4:2:0"))
+        ttk.Combobox(
+            advanced_frame,
+            textvariable=self.jpeg_subsampling_var,
+            values=list(JPEG_SUBSAMPLINGS),
+            width=8,
+            state="readonly"
+        ).grid(row=6, column=1, padx=5, pady=2)
+
+        tk.Label(advanced_frame, text="Yazıcı DPI (otomatik):", bg=theme["frame_bg"],
+                fg=theme["fg"], font=("Arial", 9)).grid(row=7, column=0, sticky="w", pady=2)
+        self.printer_dpi_var = tk.StringVar(
+            value=str(self.config.get("printer_dpi", DEFAULT_PRINTER_DPI)))
+        ttk.Combobox(
+            advanced_frame,
+            textvariable=self.printer_dpi_var,
+            values=[str(dpi) for dpi in PRINTER_DPI_CHOICES],
+            width=8,
+            state="readonly"
+        ).grid(row=7, column=1, padx=5, pady=2)
+
+    @staticmethod
+    def workers_to_text(workers: int) -> str:
+        """İşçi sayısını combobox metnine çevir"""
+        return str(workers) if workers and workers > 0 else "Otomatik"
+
+    def get_workers(self) -> int:
+        """Seçili işçi sayısını al (0 = otomatik)"""
+        value = self.workers_var.get()
+        return int(value) if value.isdigit() else 0
+
+    @staticmethod
+    def dpi_to_text(render_dpi) -> str:
+        """render_dpi ayarını combobox metnine çevir"""
+        return "Otomatik" if str(render_dpi) == AUTO_DPI else str(render_dpi)
+
+    def get_render_dpi(self):
+        """Seçili render DPI'ı (sayı ya da "auto")"""
+        value = self.dpi_var.get()
+        return int(value) if value.isdigit() else AUTO_DPI
+
+    @staticmethod
+    def cards_per_page_to_text(cards_per_page) -> str:
+        """cards_per_page ayarını combobox metnine çevir"""
+        return "Otomatik" if str(cards_per_page) == AUTO_LAYOUT else str(cards_per_page)
+
+    def get_cards_per_page(self):
+        """Seçili sayfa başı kart (sayı ya da "auto")"""
+        value = self.cards_per_page_var.get()
+        return int(value) if value.isdigit() else AUTO_LAYOUT
+
+    def get_card_spacing(self) -> float:
+        """Kartlar arası boşluk (cm)"""
+        value = float(self.entry_spacing.get().replace(",", ".") or 0)
+        if value < 0:
+            raise ValueError("Kart aralığı negatif olamaz")
+        return value
+
+    def get_codec_settings(self) -> Dict:
+        """Seçili görüntü kodlama ayarlarını al"""
+        return codec_from_settings({
+            "image_format": self.image_format_var.get(),
+            "png_compress_level": int(self.png_level_var.get()),
+            "jpeg_quality": int(self.jpeg_quality_var.get()),
+            "jpeg_subsampling": self.jpeg_subsampling_var.get(),
+        })
+
     def create_margin_section(self, parent):
         """Kenar boşlukları bölümü"""
         theme = self.theme
@@ -1213,6 +1146,56 @@ class YakaKartApp:
             font=("Arial", 7, "italic")
         ).pack(side="left")
 
+        # Çıktı biçimi
+        format_frame = tk.Frame(output_frame, bg=theme["frame_bg"])
+        format_frame.pack(fill="x", pady=(5, 0))
+
+        tk.Label(format_frame, text="Biçim:", bg=theme["frame_bg"],
+                fg=theme["fg"], font=("Arial", 9)).pack(side="left")
+
+        self.output_format_var = tk.StringVar(value=self.config.get("output_format", "docx"))
+        format_combo = ttk.Combobox(
+            format_frame,
+            textvariable=self.output_format_var,
+            values=list(OUTPUT_FORMATS),
+            width=8,
+            state="readonly"
+        )
+        format_combo.pack(side="left", padx=5)
+        format_combo.bind('<<ComboboxSelected>>', self.on_output_format_change)
+
+        tk.Label(
+            format_frame,
+            text="pdf: vektörel, raster yok",
+            bg=theme["frame_bg"],
+            fg=theme["fg"],
+            font=("Arial", 7, "italic")
+        ).pack(side="left")
+
+        # İz dosyası (Chrome trace)
+        self.trace_var = tk.BooleanVar(value=self.config.get("write_trace", False))
+        tk.Checkbutton(
+            output_frame,
+            text="İz dosyası yaz (.trace.json, chrome://tracing)",
+            variable=self.trace_var,
+            command=self.on_trace_toggle,
+            bg=theme["frame_bg"],
+            fg=theme["fg"],
+            selectcolor=theme["entry_bg"],
+            activebackground=theme["frame_bg"],
+            font=("Arial", 8)
+        ).pack(anchor="w", pady=(5, 0))
+
+    def on_output_format_change(self, event=None):
+        """Çıktı biçimi değiştiğinde"""
+        self.config["output_format"] = self.output_format_var.get()
+        save_config(self.config)
+
+    def on_trace_toggle(self):
+        """İz dosyası seçeneği değiştiğinde"""
+        self.config["write_trace"] = self.trace_var.get()
+        save_config(self.config)
+
     def create_stats_section(self, parent):
         """İstatistik bölümü"""
         theme = self.theme
@@ -1271,7 +1254,7 @@ class YakaKartApp:
         # Ana buton
         self.btn_run = tk.Button(
             bottom_frame,
-            text="🚀 Kimlikleri Oluştur",
+            text="🚀 Kimlikleri Oluştur (Kuyruğa Ekle)",
             command=self.run_generation,
             bg=theme["success"],
             fg=theme["button_fg"],
@@ -1308,9 +1291,9 @@ class YakaKartApp:
         if files:
             self.add_files_to_list([Path(f) for f in files])
 
-    def select_and_extract_archives(self):
-        """Arşiv dosyalarını seç ve çıkar"""
-        if not SEVEN_ZIP_SUPPORT and not RAR_SUPPORT:
+    def select_archives(self):
+        """Arşiv dosyalarını seç ve içlerindeki PDF'leri ekle"""
+        if not seven_zip_supported() and not rar_supported():
             messagebox.showwarning(
                 "Uyarı",
                 "Arşiv desteği için 7-Zip kurulu olmalı.\n"
@@ -1330,32 +1313,33 @@ class YakaKartApp:
         )
 
         if files:
-            self.extract_and_add_archives([Path(f) for f in files])
+            self.add_archives([Path(f) for f in files])
 
-    def extract_and_add_archives(self, archive_files: List[Path]):
-        """Arşivleri çıkar ve ekle"""
-        self.add_log("📦 Arşiv çıkarma başladı...")
-        self.set_status("Arşivler çıkarılıyor...")
+    def add_archives(self, archive_files: List[Path]):
+        """Arşivlerdeki PDF'leri çıkarmadan listeye ekle (render sırasında arşivden okunur)"""
+        self.add_log("📦 Arşivler okunuyor...")
+        self.set_status("Arşivler okunuyor...")
         self.disable_buttons()
 
         def worker():
             try:
-                clear_temp_directory()
-                all_extracted = []
-
-                for archive_path in archive_files:
-                    self.thread_safe_log(f"📂 Açılıyor: {archive_path.name}")
-                    try:
-                        extracted = extract_archive(archive_path, TEMP_EXTRACT_DIR)
-                        all_extracted.extend(extracted)
-                        self.thread_safe_log(f"  ✓ {len(extracted)} PDF çıkarıldı")
-                    except Exception as e:
-                        self.thread_safe_log(f"  ✗ HATA: {str(e)}")
-
-                if all_extracted:
-                    self.root.after(0, lambda: self.add_files_to_list(all_extracted))
-                    self.thread_safe_log(f"✅ Toplam {len(all_extracted)} PDF eklendi")
-                    self.thread_safe_status("Arşivler çıkarıldı")
+                all_members = []
+                stage_times = StageTimes()
+
+                self.thread_safe_log(f"📂 {len(archive_files)} arşiv açılıyor...")
+                for archive_path, members, error in iter_archive_members(
+                        archive_files, stage_times=stage_times):
+                    if error is None:
+                        all_members.extend(members)
+                        self.thread_safe_log(f"  ✓ {archive_path.name}: {len(members)} PDF bulundu")
+                    else:
+                        self.thread_safe_log(f"  ✗ HATA: {str(error)}")
+
+                self.thread_safe_log(f"⏱️ {stage_times.summary()}")
+                if all_members:
+                    self.root.after(0, lambda: self.add_files_to_list(all_members))
+                    self.thread_safe_log(f"✅ Toplam {len(all_members)} PDF eklendi")
+                    self.thread_safe_status("Arşivler okundu")
                 else:
                     self.thread_safe_log("⚠️ Hiç PDF bulunamadı")
                     self.thread_safe_status("Hazır")
@@ -1368,28 +1352,220 @@ class YakaKartApp:
 
         threading.Thread(target=worker, daemon=True).start()
 
+    FILE_STATUS_TEXT = {
+        "pending": "⏳ Taranıyor",
+        "ready": "✓ Hazır",
+        "duplicate": "♻️ Kopya",
+        "error": "⚠️ Okunamadı",
+    }
+    # Logda adı tek tek yazılan en fazla dosya sayısı
+    FILE_LOG_LIMIT = 5
+
     def add_files_to_list(self, files: List[Path]):
-        """Dosyaları listeye ekle"""
-        for f in files:
-            if f not in self.selected_files:
-                self.selected_files.append(f)
-                self.file_listbox.insert(tk.END, f.name)
-                self.add_log(f"✓ Eklendi: {f.name}")
+        """Dosyaları listeye ekle (listede olanlar atlanır)"""
+        added = self.selected_files.add(files)
+        pending = self.FILE_STATUS_TEXT["pending"]
+        for key, source in added:
+            self.file_tree.insert("", tk.END, iid=key, values=(source_label(source), "", "", pending))
+
+        for _, source in added[:self.FILE_LOG_LIMIT]:
+            self.add_log(f"✓ Eklendi: {source_label(source)}")
+        if len(added) > self.FILE_LOG_LIMIT:
+            self.add_log(f"✓ ... ve {len(added) - self.FILE_LOG_LIMIT} dosya daha eklendi")
+        skipped = len(files) - len(added)
+        if skipped:
+            self.add_log(f"↷ {skipped} dosya listede zaten vardı")
 
         self.update_file_count()
-
-    def remove_selected_files(self):
-        """Seçili dosyaları sil"""
-        selected = list(self.file_listbox.curselection())
-        if not selected:
+        if added:
+            self.index_files([source for _, source in added])
+            self.schedule_file_details()
+
+    def set_file_status(self, source, status: str):
+        key = source_key(source)
+        if self.file_tree.exists(key):
+            self.file_tree.set(key, "status", self.FILE_STATUS_TEXT[status])
+
+    def schedule_file_details(self):
+        """Görünen satırların bilgisini kaydırma durulunca iste"""
+        if self.file_details_after is not None:
+            self.root.after_cancel(self.file_details_after)
+        self.file_details_after = self.root.after(100, self.request_file_details)
+
+    def request_file_details(self):
+        """Görünen ve henüz okunmamış satırların boyut/sayfa bilgisini arka planda oku"""
+        self.file_details_after = None
+        count = len(self.selected_files)
+        if not count:
             return
+        first, last = self.file_tree.yview()
+        start = int(first * count)
+        end = min(count, int(last * count) + 1)
+
+        wanted = []
+        for index in range(start, end):
+            key = self.selected_files.key_at(index)
+            if key not in self.file_details_requested:
+                self.file_details_requested.add(key)
+                wanted.append((key, self.selected_files.get(key)))
+        if not wanted:
+            return
+
+        with self.file_details_lock:
+            self.file_details_queue.extend(wanted)
+            if self.file_details_running:
+                return
+            self.file_details_running = True
+        threading.Thread(target=self.read_file_details, daemon=True).start()
+
+    def read_file_details(self):
+        """Kuyruktaki kaynakların bilgisini oku, sonuçları toplu halde arayüze gönder"""
+        while True:
+            with self.file_details_lock:
+                if not self.file_details_queue:
+                    self.file_details_running = False
+                    return
+                batch = list(self.file_details_queue)
+                self.file_details_queue.clear()
+            results = []
+            for key, source in batch:
+                try:
+                    results.append((key, source_details(source)))
+                except Exception:
+                    results.append((key, None))
+            self.root.after(0, self.show_file_details, results)
+
+    def show_file_details(self, results):
+        for key, details in results:
+            if not self.file_tree.exists(key):
+                continue
+            if details is None:
+                self.file_tree.set(key, "pages", "?")
+                continue
+            size, pages = details
+            self.file_tree.set(key, "size", f"{size / 1024:.0f} KB")
+            self.file_tree.set(key, "pages", pages)
+
+    def index_files(self, files: list):
+        """Yeni dosyaların içerik özetlerini arka planda çıkar (yinelenen kart tespiti)"""
+        workers = resolve_worker_count(self.get_workers())
+
+        def worker():
+            results = list(iter_fingerprints(files, workers))
+            self.root.after(0, self.on_files_indexed, results)
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def on_files_indexed(self, results):
+        """Özetleri dizine ekle, yinelenen kart varsa kullanıcıya sor"""
+        duplicates = []
+        for source, fingerprint, error in results:
+            # Özet çıkarılırken listeden silinenler atlanır
+            if source not in self.selected_files:
+                continue
+            if error is not None:
+                self.set_file_status(source, "error")
+                continue
+            match = self.duplicate_index.add(source, fingerprint)
+            if match is not None:
+                duplicates.append((source, *match))
+                self.set_file_status(source, "duplicate")
+            else:
+                self.set_file_status(source, "ready")
 
-        for idx in reversed(selected):
-            self.file_listbox.delete(idx)
-            del self.selected_files[idx]
+        if duplicates:
+            self.add_log(f"♻️ {len(duplicates)} yinelenen kart bulundu")
+            self.show_duplicates_dialog(duplicates)
+
+    def show_duplicates_dialog(self, duplicates: list):
+        """Yinelenen kartları listele; seçilenler listeden çıkarılır, kalanlar tutulur"""
+        theme = self.theme
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Yinelenen Kartlar")
+        dialog.configure(bg=theme["bg"])
+        dialog.transient(self.root)
+
+        tk.Label(
+            dialog,
+            text=f"{len(duplicates)} kart listede zaten var (kopya ⇐ asıl).\n"
+                 "Seçili kopyalar listeden çıkarılır; tutmak istediklerinizin seçimini kaldırın.",
+            bg=theme["bg"],
+            fg=theme["fg"],
+            justify="left",
+            font=("Arial", 9)
+        ).pack(fill="x", padx=10, pady=(10, 5))
+
+        listbox = tk.Listbox(
+            dialog,
+            width=90,
+            height=min(15, len(duplicates)),
+            font=("Consolas", 9),
+            bg=theme["listbox_bg"],
+            fg=theme["listbox_fg"],
+            selectbackground=theme["listbox_select_bg"],
+            selectforeground=theme["listbox_select_fg"],
+            selectmode=tk.MULTIPLE
+        )
+        for source, original, reason in duplicates:
+            listbox.insert(tk.END, f"{source_label(source)}  ⇐  {source_label(original)}  ({reason})")
+        listbox.selection_set(0, tk.END)
+        listbox.pack(fill="both", expand=True, padx=10)
+
+        def drop_selected():
+            dropped = [duplicates[i][0] for i in listbox.curselection()]
+            self.remove_files(dropped)
+            kept = len(duplicates) - len(dropped)
+            self.add_log(f"♻️ {len(dropped)} kopya çıkarıldı, {kept} kopya tutuldu")
+            dialog.destroy()
+
+        def keep_all():
+            self.add_log(f"♻️ {len(duplicates)} kopya listede tutuldu")
+            dialog.destroy()
+
+        btn_frame = tk.Frame(dialog, bg=theme["bg"])
+        btn_frame.pack(fill="x", padx=10, pady=10)
+        tk.Button(
+            btn_frame,
+            text="Seçilenleri Çıkar",
+            command=drop_selected,
+            bg=theme["error"],
+            fg=theme["button_fg"],
+            relief="flat",
+            padx=12
+        ).pack(side="right", padx=(5, 0))
+        tk.Button(
+            btn_frame,
+            text="Hepsini Tut",
+            command=keep_all,
+            relief="flat",
+            padx=12
+        ).pack(side="right")
+        dialog.protocol("WM_DELETE_WINDOW", keep_all)
+
+    def remove_files(self, files: list):
+        """Verilen dosyaları listeden ve yinelenen dizininden çıkar"""
+        self.remove_file_keys([source_key(source) for source in files])
+
+    def remove_file_keys(self, keys: list):
+        """Anahtarları verilen satırları listeden, tablodan ve yinelenen dizininden toplu çıkar"""
+        removed = self.selected_files.remove(keys)
+        if not removed:
+            return
+        shown = [key for key in keys if self.file_tree.exists(key)]
+        if shown:
+            self.file_tree.delete(*shown)
+        self.file_details_requested.difference_update(keys)
+        self.duplicate_index.discard_many(removed)
 
         self.update_file_count()
         self.clear_preview()
+        self.schedule_file_details()
+
+    def remove_selected_files(self):
+        """Seçili dosyaları sil"""
+        selected = self.file_tree.selection()
+        if selected:
+            self.remove_file_keys(list(selected))
 
     def clear_file_list(self):
         """Tüm dosyaları temizle"""
@@ -1398,40 +1574,32 @@ class YakaKartApp:
 
         if messagebox.askyesno("Onay", f"{len(self.selected_files)} dosya silinecek. Emin misiniz?"):
             self.selected_files.clear()
-            self.file_listbox.delete(0, tk.END)
+            self.duplicate_index.clear()
+            self.file_details_requested.clear()
+            self.file_tree.delete(*self.file_tree.get_children())
             self.update_file_count()
             self.clear_preview()
             self.add_log("🗑️ Liste temizlendi")
 
-    def move_file_up(self):
-        """Seçili dosyayı yukarı taşı"""
-        selected = self.file_listbox.curselection()
-        if not selected or selected[0] == 0:
+    def move_files(self, offset: int):
+        """Seçili dosyaları bir sıra (−1 yukarı, +1 aşağı) taşı"""
+        selected = self.file_tree.selection()
+        if not selected:
             return
 
-        idx = selected[0]
-        self.selected_files[idx], self.selected_files[idx-1] = \
-            self.selected_files[idx-1], self.selected_files[idx]
+        # Her takasta yukarı çıkan satır taşınır; seçim satırlarla birlikte kalır
+        for key, index in self.selected_files.move(selected, offset):
+            self.file_tree.move(key, "", index)
+        edge = min if offset < 0 else max
+        self.file_tree.see(edge(selected, key=self.selected_files.index))
 
-        text = self.file_listbox.get(idx)
-        self.file_listbox.delete(idx)
-        self.file_listbox.insert(idx-1, text)
-        self.file_listbox.selection_set(idx-1)
+    def move_file_up(self):
+        """Seçili dosyaları yukarı taşı"""
+        self.move_files(-1)
 
     def move_file_down(self):
-        """Seçili dosyayı aşağı taşı"""
-        selected = self.file_listbox.curselection()
-        if not selected or selected[0] >= len(self.selected_files) - 1:
-            return
-
-        idx = selected[0]
-        self.selected_files[idx], self.selected_files[idx+1] = \
-            self.selected_files[idx+1], self.selected_files[idx]
-
-        text = self.file_listbox.get(idx)
-        self.file_listbox.delete(idx)
-        self.file_listbox.insert(idx+1, text)
-        self.file_listbox.selection_set(idx+1)
+        """Seçili dosyaları aşağı taşı"""
+        self.move_files(1)
 
     def update_file_count(self):
         """Dosya sayısını güncelle"""
@@ -1443,33 +1611,32 @@ class YakaKartApp:
 
     def on_file_select(self, event):
         """Dosya seçildiğinde önizleme göster"""
-        selected = self.file_listbox.curselection()
+        selected = self.file_tree.selection()
         if not selected:
             return
 
-        idx = selected[0]
-        pdf_path = self.selected_files[idx]
-        self.show_preview(pdf_path)
+        files = self.selected_files
+        # Çoklu seçimde önizleme son tıklanan satırındır
+        key = self.file_tree.focus()
+        if key not in selected:
+            key = selected[0]
+        pdf_path = files.get(key)
+        idx = files.index(key)
+        neighbours = [files.get(files.key_at(i)) for i in (idx + 1, idx - 1)
+                      if 0 <= i < len(files)]
+
+        self.lbl_preview_name.config(text=f"{source_label(pdf_path)} (yükleniyor...)")
+        self.preview_service.request(pdf_path, self.show_preview, prefetch=neighbours)
+
+    def show_preview(self, pdf_path: Path, thumbnails, error=None):
+        """PDF önizlemesi göster (PreviewService tarafından ana thread'de çağrılır)"""
+        if error is not None:
+            self.lbl_preview_name.config(text=source_label(pdf_path))
+            self.add_log(f"Önizleme hatası: {error}")
+            return
 
-    def show_preview(self, pdf_path: Path):
-        """PDF önizlemesi göster"""
         try:
-            doc = fitz.open(str(pdf_path))
-            if len(doc) < 2:
-                doc.close()
-                return
-
-            # Ön yüz
-            front_pix = doc[0].get_pixmap(matrix=fitz.Matrix(0.3, 0.3), alpha=False)
-            front_img = Image.frombytes("RGB", [front_pix.width, front_pix.height], front_pix.samples)
-            front_img.thumbnail((180, 120), Image.Resampling.LANCZOS)
-
-            # Arka yüz
-            back_pix = doc[1].get_pixmap(matrix=fitz.Matrix(0.3, 0.3), alpha=False)
-            back_img = Image.frombytes("RGB", [back_pix.width, back_pix.height], back_pix.samples)
-            back_img.thumbnail((180, 120), Image.Resampling.LANCZOS)
-
-            doc.close()
+            front_img, back_img = thumbnails
 
             # Canvas'a çiz
             self.front_photo = ImageTk.PhotoImage(front_img)
@@ -1481,13 +1648,14 @@ class YakaKartApp:
             self.front_canvas.create_image(90, 60, image=self.front_photo)
             self.back_canvas.create_image(90, 60, image=self.back_photo)
 
-            self.lbl_preview_name.config(text=pdf_path.name)
+            self.lbl_preview_name.config(text=source_label(pdf_path))
 
         except Exception as e:
             self.add_log(f"Önizleme hatası: {e}")
 
     def clear_preview(self):
         """Önizlemeyi temizle"""
+        self.preview_service.cancel()
         self.front_canvas.delete("all")
         self.back_canvas.delete("all")
         self.lbl_preview_name.config(text="Dosya seçin")
@@ -1514,8 +1682,16 @@ class YakaKartApp:
         self.entry_width.insert(0, str(profile.get("card_width_cm", 9.2)))
 
         # DPI ve sayfa başı kart
-        self.dpi_var.set(str(profile.get("render_dpi", 300)))
-        self.cards_per_page_var.set(str(profile.get("cards_per_page", 8)))
+        self.dpi_var.set(self.dpi_to_text(profile.get("render_dpi", 300)))
+        self.printer_dpi_var.set(str(profile.get("printer_dpi", DEFAULT_PRINTER_DPI)))
+        self.cards_per_page_var.set(self.cards_per_page_to_text(profile.get("cards_per_page", 8)))
+        self.entry_spacing.delete(0, tk.END)
+        self.entry_spacing.insert(0, str(profile.get("card_spacing_cm", self.config.get("card_spacing_cm", 0.0))))
+        self.workers_var.set(self.workers_to_text(profile.get("workers", 0)))
+        self.image_format_var.set(profile.get("image_format", DEFAULT_CODEC["image_format"]))
+        self.png_level_var.set(str(profile.get("png_compress_level", DEFAULT_CODEC["png_compress_level"])))
+        self.jpeg_quality_var.set(str(profile.get("jpeg_quality", DEFAULT_CODEC["jpeg_quality"])))
+        self.jpeg_subsampling_var.set(profile.get("jpeg_subsampling", DEFAULT_CODEC["jpeg_subsampling"]))
 
         # Kenar boşlukları
         front_margins = profile.get("front_margins", {})
@@ -1547,8 +1723,12 @@ class YakaKartApp:
         profile = {
             "card_height_cm": float(self.entry_height.get().replace(",", ".")),
             "card_width_cm": float(self.entry_width.get().replace(",", ".")),
-            "render_dpi": int(self.dpi_var.get()),
-            "cards_per_page": int(self.cards_per_page_var.get()),
+            "render_dpi": self.get_render_dpi(),
+            "printer_dpi": int(self.printer_dpi_var.get()),
+            "cards_per_page": self.get_cards_per_page(),
+            "card_spacing_cm": self.get_card_spacing(),
+            "workers": self.get_workers(),
+            **self.get_codec_settings(),
             "front_margins": {
                 key: float(entry.get().replace(",", "."))
                 for key, entry in self.front_margin_entries.items()
@@ -1600,17 +1780,7 @@ class YakaKartApp:
 
     def get_output_path(self) -> Path:
         """Çıktı dosya yolunu oluştur"""
-        output_dir = Path(self.output_dir_var.get())
-        output_dir.mkdir(parents=True, exist_ok=True)
-
-        template = self.filename_var.get()
-        now = datetime.now()
-
-        filename = template.replace("{date}", now.strftime("%Y%m%d"))
-        filename = filename.replace("{time}", now.strftime("%H%M%S"))
-        filename = f"{filename}.docx"
-
-        return output_dir / filename
+        return build_output_path(Path(self.output_dir_var.get()), self.filename_var.get())
 
     # ========== İSTATİSTİKLER ==========
 
@@ -1721,6 +1891,12 @@ class YakaKartApp:
             messagebox.showerror("Hata", "Kart boyutları pozitif sayı olmalıdır.")
             return
 
+        try:
+            spacing = self.get_card_spacing()
+        except ValueError:
+            messagebox.showerror("Hata", "Kart aralığı pozitif sayı olmalıdır.")
+            return
+
         try:
             front_margins = self.get_margin_values(self.front_margin_entries)
             back_margins = self.get_margin_values(self.back_margin_entries)
@@ -1728,70 +1904,333 @@ class YakaKartApp:
             messagebox.showerror("Hata", str(e))
             return
 
-        dpi = int(self.dpi_var.get())
-        cards_per_page = int(self.cards_per_page_var.get())
-        output_path = self.get_output_path()
+        settings = {
+            "card_height_cm": h,
+            "card_width_cm": w,
+            "front_margins": list(front_margins),
+            "back_margins": list(back_margins),
+            "render_dpi": self.get_render_dpi(),
+            "printer_dpi": int(self.printer_dpi_var.get()),
+            "cards_per_page": self.get_cards_per_page(),
+            "card_spacing_cm": spacing,
+            "output_path": str(self.get_output_path()),
+            "output_format": self.output_format_var.get(),
+            "workers": self.get_workers(),
+            "codec": self.get_codec_settings(),
+            "write_trace": bool(self.trace_var.get()),
+        }
+        try:
+            job = GenerationJob.create(self.selected_files.sources(), settings)
+        except OSError as e:
+            messagebox.showerror("Hata", f"İş kaydı oluşturulamadı: {e}")
+            return
 
-        self.disable_buttons()
-        self.set_status("İşleniyor...")
-        self.set_progress(0)
+        self.job_queue.submit(job)
+        position = len(self.job_queue.active())
+        self.add_log(f"➕ Kuyruğa eklendi: {Path(job.settings['output_path']).name} "
+                     f"({len(job.sources)} kart, sırada {position}. iş)")
 
-        def worker():
+    # ========== İŞ KUYRUĞU ==========
+
+    JOB_STATE_TEXT = {
+        JOB_QUEUED: "⏳ Sırada",
+        JOB_RUNNING: "▶️ Çalışıyor",
+        JOB_DONE: "✅ Bitti",
+        JOB_CANCELLED: "⏹ İptal",
+        JOB_FAILED: "❌ Hata",
+    }
+
+    def refresh_queue_view(self):
+        """Kuyruk tablosunu ve genel ilerlemeyi işlerin son durumuyla eşitle"""
+        jobs = list(self.job_queue.jobs)
+        known = set(self.queue_tree.get_children())
+        for index, job in enumerate(jobs):
+            values = (
+                Path(job.settings["output_path"]).name,
+                len(job.sources),
+                self.JOB_STATE_TEXT.get(job.status, job.status),
+                f"%{job.percent:.0f}",
+                job.message,
+            )
+            if job.job_id in known:
+                self.queue_tree.item(job.job_id, values=values)
+                self.queue_tree.move(job.job_id, "", index)
+            else:
+                self.queue_tree.insert("", index, iid=job.job_id, values=values)
+        for iid in known - {job.job_id for job in jobs}:
+            self.queue_tree.delete(iid)
+
+        running = [job for job in jobs if job.status == JOB_RUNNING]
+        if running:
+            self.set_progress(sum(job.percent for job in running) / len(running))
+            waiting = len(self.job_queue.active()) - len(running)
+            self.set_status(f"{len(running)} iş çalışıyor, {waiting} iş sırada — {running[-1].message}")
+
+    def selected_job(self) -> Optional[GenerationJob]:
+        selection = self.queue_tree.selection()
+        return self.job_queue.find(selection[0]) if selection else None
+
+    def move_job(self, offset: int):
+        job = self.selected_job()
+        if job is not None and self.job_queue.move(job.job_id, offset):
+            self.refresh_queue_view()
+
+    def cancel_selected_job(self):
+        """Seçili işi iptal et (sıradaysa başlatılmaz, çalışıyorsa durdurulur)"""
+        job = self.selected_job()
+        if job is None:
+            messagebox.showinfo("Bilgi", "İptal etmek için kuyruktan bir iş seçin.")
+            return
+        self.job_queue.cancel(job.job_id)
+
+    def requeue_selected_job(self):
+        """İptal edilen ya da hata veren işi kaldığı yerden sürdürmek üzere kuyruğa al"""
+        job = self.selected_job()
+        if job is None or not self.job_queue.resubmit(job.job_id):
+            messagebox.showinfo("Bilgi", "Yalnızca iptal edilen ya da hata veren işler yeniden kuyruğa alınabilir.")
+            return
+        self.add_log(f"↻ Yeniden kuyrukta: {Path(job.settings['output_path']).name}")
+
+    def clear_finished_jobs(self):
+        self.job_queue.remove_finished()
+        self.refresh_queue_view()
+
+    def on_max_jobs_change(self, event=None):
+        value = int(self.max_jobs_var.get())
+        self.config["max_concurrent_jobs"] = value
+        save_config(self.config)
+        self.job_queue.set_max_running(value)
+
+    def on_job_finished(self, job: GenerationJob, error):
+        """Kuyruktaki bir iş bitti (ana thread)"""
+        name = Path(job.settings["output_path"]).name
+        if self.closing:
+            if not self.job_queue.running():
+                self.root.destroy()
+            return
+
+        if isinstance(error, GenerationCancelled):
+            done, total = job.progress["groups_done"], job.progress["groups_total"]
+            self.add_log(f"⏹ İptal edildi: {name} ({done}/{total} sayfa grubu hazır). "
+                         f"'Yeniden Kuyruğa' ile ya da sonraki açılışta devam edilebilir.")
+        elif error is not None:
+            self.add_log(f"❌ Hata: {name}: {error} (iş kaydı saklandı: {job.job_id})")
+            messagebox.showerror("❌ Hata", f"{name}\n\n{error}")
+        else:
+            self.add_log(f"✅ Tamamlandı: {name}")
+            self.add_log(f"🖼️ {job.encode_stats.summary()}")
+            self.add_log(f"⏱️ {job.stage_times.summary()}")
+            if isinstance(job.stage_times, Tracer):
+                trace_path = job.stage_times.write_chrome_trace(trace_path_for(job.outputs[0]))
+                self.add_log(f"🧭 İz dosyası: {trace_path.name}")
+
+            # İstatistikleri güncelle
+            update_stats(len(job.sources))
+            self.update_stats_display()
+
+        if self.job_queue.active():
+            return
+
+        # Kuyruk boşaldı
+        self.set_progress(100 if error is None else self.progress_var.get())
+        self.set_status("Tamamlandı! ✓" if error is None else "Kuyruk boş")
+        if error is None:
+            files_text = "\n".join(f"📁 Dosya: {path}" for path in job.outputs)
+            messagebox.showinfo(
+                "✅ İşlem Tamamlandı",
+                f"Kimlikler başarıyla oluşturuldu!\n\n"
+                f"{files_text}\n\n"
+                f"🖨️ Yazıcı Ayarları:\n"
+                f"  ✓ Dupleks: Long Edge\n"
+                f"  ✓ Ölçek: %100\n"
+                f"  ✓ Kağıt: A4\n\n"
+                f"📋 {len(job.sources)} kart oluşturuldu"
+            )
+
+            # Klasörü aç
             try:
-                generate_doc_from_pdfs(
-                    self.selected_files,
-                    card_height_cm=h,
-                    card_width_cm=w,
-                    front_margins=front_margins,
-                    back_margins=back_margins,
-                    render_dpi=dpi,
-                    cards_per_page=cards_per_page,
-                    output_path=output_path,
-                    progress_callback=self.thread_safe_progress,
-                    status_callback=self.thread_safe_status
-                )
-
-                # İstatistikleri güncelle
-                cards_created = len(self.selected_files)
-                update_stats(cards_created)
-                self.root.after(0, self.update_stats_display)
-
-                self.thread_safe_progress(100)
-                self.thread_safe_status("Tamamlandı! ✓")
-
-                self.root.after(0, lambda: messagebox.showinfo(
-                    "✅ İşlem Tamamlandı",
-                    f"Kimlikler başarıyla oluşturuldu!\n\n"
-                    f"📁 Dosya: {output_path}\n\n"
-                    f"🖨️ Yazıcı Ayarları:\n"
-                    f"  ✓ Dupleks: Long Edge\n"
-                    f"  ✓ Ölçek: %100\n"
-                    f"  ✓ Kağıt: A4\n\n"
-                    f"📋 {cards_created} kart oluşturuldu"
-                ))
-
-                # Klasörü aç
-                try:
-                    os.startfile(output_path.parent)
-                except:
-                    pass
+                os.startfile(job.outputs[0].parent)
+            except:
+                pass
 
-            except Exception as e:
-                self.thread_safe_status("Hata oluştu!")
-                self.root.after(0, lambda: messagebox.showerror("❌ Hata", str(e)))
-            finally:
-                self.root.after(0, self.enable_buttons)
+    # ========== KLASÖR İZLEME ==========
 
-        threading.Thread(target=worker, daemon=True).start()
+    def open_watch_dialog(self):
+        """Sıcak klasör ayarları ve başlat/durdur penceresi"""
+        if self.watch_dialog is not None and self.watch_dialog.winfo_exists():
+            self.watch_dialog.lift()
+            return
+
+        theme = self.theme
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Klasör İzleme")
+        dialog.configure(bg=theme["frame_bg"], padx=15, pady=15)
+        dialog.transient(self.root)
+        dialog.resizable(False, False)
+        self.watch_dialog = dialog
+
+        tk.Label(
+            dialog,
+            text="Klasöre bırakılan PDF'ler yazımı bitince toplanır; yeterince birikince\n"
+                 "ya da bekleme süresi dolunca seçili profille Word dosyasına dönüştürülür.\n"
+                 "İşlenen PDF'ler done/, işlenemeyenler failed/ klasörüne taşınır.",
+            bg=theme["frame_bg"],
+            fg=theme["fg"],
+            font=("Arial", 9),
+            justify="left"
+        ).grid(row=0, column=0, columnspan=3, sticky="w", pady=(0, 10))
+
+        self.watch_dir_var = tk.StringVar(value=self.config.get("watch_dir", ""))
+        self.watch_profile_var = tk.StringVar(value=self.config.get("watch_profile", "Varsayılan"))
+        self.watch_batch_var = tk.StringVar(value=str(self.config.get("watch_batch_size", 50)))
+        self.watch_timeout_var = tk.StringVar(value=str(self.config.get("watch_batch_timeout_s", 60)))
+
+        def label(row, text):
+            tk.Label(dialog, text=text, bg=theme["frame_bg"], fg=theme["fg"],
+                     font=("Arial", 9)).grid(row=row, column=0, sticky="w", pady=2)
+
+        label(1, "Klasör:")
+        tk.Entry(dialog, textvariable=self.watch_dir_var, width=40).grid(row=1, column=1, padx=5, pady=2)
+        tk.Button(
+            dialog,
+            text="📁",
+            command=lambda: self.watch_dir_var.set(
+                filedialog.askdirectory(title="İzlenecek Klasör", initialdir=self.watch_dir_var.get())
+                or self.watch_dir_var.get()),
+            relief="flat",
+            cursor="hand2"
+        ).grid(row=1, column=2)
+
+        label(2, "Profil:")
+        ttk.Combobox(
+            dialog,
+            textvariable=self.watch_profile_var,
+            values=list(self.profiles.keys()),
+            width=37,
+            state="readonly"
+        ).grid(row=2, column=1, padx=5, pady=2, sticky="w")
+
+        label(3, "Toplu iş boyutu (kart):")
+        tk.Entry(dialog, textvariable=self.watch_batch_var, width=8).grid(row=3, column=1, padx=5, pady=2, sticky="w")
+
+        label(4, "En fazla bekleme (sn):")
+        tk.Entry(dialog, textvariable=self.watch_timeout_var, width=8).grid(row=4, column=1, padx=5, pady=2, sticky="w")
+
+        self.lbl_watch_state = tk.Label(dialog, bg=theme["frame_bg"], fg=theme["fg"],
+                                        font=("Arial", 9, "bold"))
+        self.lbl_watch_state.grid(row=5, column=0, columnspan=3, sticky="w", pady=(10, 5))
+
+        self.btn_watch_toggle = tk.Button(
+            dialog,
+            command=self.toggle_watch,
+            fg=theme["button_fg"],
+            font=("Arial", 10, "bold"),
+            relief="flat",
+            cursor="hand2",
+            padx=20,
+            pady=6
+        )
+        self.btn_watch_toggle.grid(row=6, column=0, columnspan=3)
+        self.update_watch_state()
+
+    def update_watch_state(self):
+        """İzleme durumunu başlık butonuna ve (açıksa) izleme penceresine yansıt"""
+        theme = self.theme
+        watcher = self.folder_watcher
+        self.btn_watch.config(text="📂 İzleniyor" if watcher else "📂 Klasör İzle",
+                              bg=theme["success"] if watcher else theme["accent"])
+        if self.watch_dialog is None or not self.watch_dialog.winfo_exists():
+            return
+        if watcher:
+            self.lbl_watch_state.config(
+                text=f"İzleniyor: {watcher.directory} — {watcher.batches} toplu iş, "
+                     f"{watcher.processed} kart, {watcher.failed} hatalı")
+            self.btn_watch_toggle.config(text="⏹ Durdur", bg=theme["error"])
+        else:
+            self.lbl_watch_state.config(text="Durduruldu")
+            self.btn_watch_toggle.config(text="▶️ Başlat", bg=theme["success"])
+
+    def toggle_watch(self):
+        if self.folder_watcher is not None:
+            self.folder_watcher.stop()
+            self.lbl_watch_state.config(text="Durduruluyor (süren toplu iş bitince)...")
+            return
+
+        directory = Path(self.watch_dir_var.get())
+        if not self.watch_dir_var.get() or not directory.is_dir():
+            messagebox.showerror("Hata", "İzlenecek klasör bulunamadı.", parent=self.watch_dialog)
+            return
+        try:
+            batch_size = int(self.watch_batch_var.get())
+            timeout = float(self.watch_timeout_var.get().replace(",", "."))
+            if batch_size <= 0 or timeout < 0:
+                raise ValueError()
+        except ValueError:
+            messagebox.showerror("Hata", "Toplu iş boyutu ve bekleme süresi pozitif sayı olmalıdır.",
+                                 parent=self.watch_dialog)
+            return
+
+        profile_name = self.watch_profile_var.get()
+        self.config.update({
+            "watch_dir": str(directory),
+            "watch_profile": profile_name,
+            "watch_batch_size": batch_size,
+            "watch_batch_timeout_s": timeout,
+        })
+        save_config(self.config)
+
+        self.folder_watcher = FolderWatcher(
+            directory,
+            profile_generation_settings(self.profiles[profile_name]),
+            output_dir=Path(self.output_dir_var.get()),
+            filename_template=self.config.get("filename_template", "kartlar_{date}_{time}"),
+            batch_size=batch_size,
+            batch_timeout_s=timeout,
+            stable_s=self.config.get("watch_stable_s", 5),
+            poll_s=self.config.get("watch_poll_s", 2),
+            cache=self.render_cache,
+            on_event=lambda event, **fields: self.root.after(0, self.on_watch_event, event, fields)
+        )
+        threading.Thread(target=self.folder_watcher.run, daemon=True).start()
+        self.update_watch_state()
+
+    def on_watch_event(self, event: str, fields: Dict):
+        """Klasör izleyicisinden gelen olay (ana thread)"""
+        if event == "watch":
+            self.add_log(f"📂 Klasör izleniyor: {fields['path']}")
+        elif event == "batch":
+            self.add_log(f"📂 Toplu iş başladı: {fields['pdfs']} PDF → {Path(fields['output']).name}")
+        elif event == "batch_done":
+            if fields["error"]:
+                self.add_log(f"❌ Toplu iş başarısız: {fields['error']}")
+            else:
+                created = fields["pdfs"] - len(fields["failed"])
+                self.add_log(f"✅ Toplu iş bitti: {Path(fields['output']).name} "
+                             f"({created} kart, {fields['elapsed_s']:.1f} sn)")
+                update_stats(created)
+                self.update_stats_display()
+            for name in fields["failed"]:
+                self.add_log(f"⚠️ İşlenemedi (failed/ klasöründe): {name}")
+        elif event == "warning":
+            self.add_log(f"⚠️ {fields['path']}: {fields['message']}")
+        elif event == "stopped":
+            self.add_log(f"📂 Klasör izleme durdu ({fields['batches']} toplu iş, "
+                         f"{fields['processed']} kart, {fields['failed']} hatalı)")
+            self.folder_watcher = None
+        self.update_watch_state()
 
 
 # ================== BAŞLATMA ==================
 
-def main():
-    # Sürükle-bırak desteği varsa TkinterDnD kullan
-    if DND_SUPPORT:
+def create_root():
+    """Ana pencereyi oluştur (tkinterdnd2 varsa sürükle-bırak destekli)"""
+    global DND_SUPPORT
+
+    try:
+        from tkinterdnd2 import TkinterDnD
         root = TkinterDnD.Tk()
-    else:
+        DND_SUPPORT = True
+    except ImportError:
         root = tk.Tk()
 
     # simpledialog import (profil kaydetme için)
@@ -1802,17 +2241,20 @@ def main():
         root.iconbitmap(str(ICON_PATH))
     except:
         pass
+    return root
 
-    # Başlangıç mesajları
+
+def main():
+    # PyInstaller tek dosya derlemesinde işçi süreçleri için gerekli
+    multiprocessing.freeze_support()
+
+    root = create_root()
+
+    # Başlangıç mesajları (7-Zip durumu pencere açıldıktan sonra loga yazılır)
     print("=" * 50)
     print("Medar Yaka Kart Otomasyonu v3.0")
     print("=" * 50)
 
-    if SEVEN_ZIP_SUPPORT:
-        print(f"✅ 7-Zip: {SEVEN_ZIP_PATH}")
-    else:
-        print("⚠️ 7-Zip bulunamadı")
-
     if DND_SUPPORT:
         print("✅ Sürükle-bırak desteği aktif")
     else:
@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+"""
+Medar Yaka Kart Otomasyonu - Performans Ölçümü
+==============================================
+Yerelde sentetik iki sayfalı kart PDF'leri üretir (fotoğraflı ve yalnızca
+vektörel) ve tam üretim hattını her kart sayısı / DPI için çalıştırır:
+
+    python -m medar_yakakart.bench --cards 10 100 --dpi 150 300 -o bench.json
+
+Her ölçüm ayrı bir alt süreçte yapılır; böylece tepe bellek (peak RSS)
+ölçümleri ve süreç içi kodlama belleği ölçümler arasında karışmaz.
+Sonuç JSON olarak yazılır; gerilemeleri yakalamak için taban çizgisi olarak
+saklanabilir. Gerçek personel verisi kullanılmaz.
+"""
+
+import argparse
+import json
+import multiprocessing
+import platform
+import random
+import sys
+import tempfile
+import time
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+try:
+    import resource  # Windows'ta yok; tepe bellek o zaman raporlanmaz
+except ImportError:
+    resource = None
+
+from .core import (
+    fitz, Image, DEFAULT_PROFILES, DPI_CHOICES, OUTPUT_FORMATS,
+    codec_from_settings, generate_outputs, parse_render_dpi, EncodeStats, StageTimes,
+)
+
+# Ölçülen kart sayıları ve PDF türleri (varsayılan)
+CARD_COUNTS = (10, 100, 1000, 5000)
+FIXTURE_KINDS = ("vector", "photo")
+BENCH_PROFILE = "Varsayılan"
+
+# Kart sayfası (dikey, pt); sayfada 90° döndürülerek yerleştirilir
+CARD_PAGE_WIDTH_PT = 5.81 / 2.54 * 72
+CARD_PAGE_HEIGHT_PT = 9.2 / 2.54 * 72
+
+
+# ================== SENTETİK KARTLAR ==================
+
+def _synthetic_photo(index: int) -> bytes:
+    """Kart numarasından türetilen, her çalıştırmada aynı 'fotoğraf' (JPEG)"""
+    rng = random.Random(index)
+    noise = Image.frombytes("L", (60, 80), rng.randbytes(60 * 80))
+    noise = noise.resize((240, 320), Image.Resampling.BICUBIC)
+    gradient = Image.radial_gradient("L").resize((240, 320))
+    ramp = Image.linear_gradient("L").resize((240, 320))
+    photo = Image.merge("RGB", (noise, Image.blend(gradient, noise, 0.5), ramp))
+
+    buf = BytesIO()
+    photo.save(buf, format="JPEG", quality=90)
+    return buf.getvalue()
+
+
+def make_card_pdf(path: Path, index: int, kind: str):
+    """Ön yüzü kişiye özel, arka yüzü ortak iki sayfalı kart PDF'i oluştur"""
+    width, height = CARD_PAGE_WIDTH_PT, CARD_PAGE_HEIGHT_PT
+    doc = fitz.open()
+
+    front = doc.new_page(width=width, height=height)
+    front.draw_rect(fitz.Rect(5, 5, width - 5, 45), color=(0, 0, 0.6), fill=(0.8, 0.85, 1))
+    front.insert_text((12, 32), "MEDAR", fontsize=16, color=(0, 0, 0.6))
+    if kind == "photo":
+        front.insert_image(fitz.Rect(25, 55, width - 25, height * 0.62),
+                           stream=_synthetic_photo(index))
+    else:
+        for line in range(8):
+            y = 60 + line * 12
+            front.draw_line(fitz.Point(12, y), fitz.Point(width - 12, y), color=(0.7, 0.7, 0.8))
+    front.insert_text((12, height * 0.72), f"Kişi {index:05d}", fontsize=14)
+    front.insert_text((12, height * 0.80), f"Sicil: {100000 + index}", fontsize=10)
+
+    back = doc.new_page(width=width, height=height)
+    back.insert_text((12, 40), "ARKA YÜZ", fontsize=14)
+    back.draw_rect(fitz.Rect(10, height * 0.5, width - 10, height - 10),
+                   color=(0.6, 0, 0), fill=(1, 0.92, 0.92))
+
+    doc.save(str(path))
+    doc.close()
+
+
+def make_fixtures(directory: Path, kind: str, count: int) -> List[Path]:
+    """kind türünde count adet kart PDF'i hazırla (önceden üretilenler yeniden kullanılır)"""
+    directory = Path(directory) / kind
+    directory.mkdir(parents=True, exist_ok=True)
+
+    paths = []
+    for index in range(count):
+        path = directory / f"kart_{index:05d}.pdf"
+        if not path.exists():
+            make_card_pdf(path, index, kind)
+        paths.append(path)
+    return paths
+
+
+# ================== ÖLÇÜM ==================
+
+def peak_rss_mb(who: int) -> Optional[float]:
+    """Tepe bellek kullanımı (MB); resource modülü yoksa None"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(who).ru_maxrss
+    # Linux'ta KB, macOS'ta bayt
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 1)
+
+
+def run_case(pdf_paths: List[Path], dpi: int, workers: int, output_path: Path,
+             output_format: str = "docx") -> Dict[str, Any]:
+    """Üretim hattını bir kez çalıştır; süreleri ve çıktı boyutunu döndür"""
+    profile = DEFAULT_PROFILES[BENCH_PROFILE]
+
+    def margins(key: str):
+        values = profile[key]
+        return tuple(values[side] for side in ("top", "bottom", "left", "right"))
+
+    stage_times = StageTimes()
+    encode_stats = EncodeStats()
+    started = time.perf_counter()
+    outputs = generate_outputs(
+        pdf_paths,
+        card_height_cm=profile["card_height_cm"],
+        card_width_cm=profile["card_width_cm"],
+        front_margins=margins("front_margins"),
+        back_margins=margins("back_margins"),
+        render_dpi=dpi,
+        cards_per_page=profile["cards_per_page"],
+        output_path=output_path,
+        output_format=output_format,
+        workers=workers,
+        cache=None,
+        codec=codec_from_settings(profile),
+        encode_stats=encode_stats,
+        stage_times=stage_times,
+    )
+    wall = time.perf_counter() - started
+
+    result = {
+        "wall_s": round(wall, 3),
+        "cards_per_s": round(len(pdf_paths) / wall, 2) if wall else None,
+        "stages": stage_times.as_dict(),
+        "encode": encode_stats.by_format(),
+        "output_bytes": sum(path.stat().st_size for path in outputs),
+    }
+    auto_dpi = encode_stats.auto_dpi()
+    if auto_dpi:
+        result["auto_dpi"] = auto_dpi
+    return result
+
+
+def _case_process(conn, pdf_paths, dpi, workers, output_path, output_format):
+    """Alt süreç girişi: ölçümü yap, sonucu boru üzerinden gönder"""
+    try:
+        result = run_case(pdf_paths, dpi, workers, output_path, output_format)
+        if resource is not None:
+            result["peak_rss_mb"] = peak_rss_mb(resource.RUSAGE_SELF)
+            if workers > 1:
+                result["worker_peak_rss_mb"] = peak_rss_mb(resource.RUSAGE_CHILDREN)
+        conn.send(result)
+    except Exception as e:
+        conn.send({"error": str(e)})
+    finally:
+        conn.close()
+
+
+def run_case_isolated(pdf_paths: List[Path], dpi: int, workers: int, output_path: Path,
+                      output_format: str = "docx") -> Dict[str, Any]:
+    """run_case'i temiz bir alt süreçte çalıştır"""
+    ctx = multiprocessing.get_context("spawn")
+    parent_conn, child_conn = ctx.Pipe(duplex=False)
+    process = ctx.Process(target=_case_process,
+                          args=(child_conn, pdf_paths, dpi, workers, output_path, output_format))
+    process.start()
+    child_conn.close()
+    try:
+        result = parent_conn.recv()
+    except EOFError:
+        result = {"error": f"Ölçüm süreci beklenmedik şekilde sonlandı (kod {process.exitcode})"}
+    process.join()
+    return result
+
+
+def environment() -> Dict[str, Any]:
+    """Sonuçların karşılaştırılabilmesi için ortam bilgisi"""
+    import docx
+    import PIL
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": multiprocessing.cpu_count(),
+        "pymupdf": getattr(fitz, "VersionBind", None),
+        "python_docx": getattr(docx, "__version__", None),
+        "pillow": PIL.__version__,
+    }
+
+
+def run_benchmarks(card_counts, kinds, dpis, workers: int, fixtures_dir: Path,
+                   output_format: str = "docx", log=None) -> Dict[str, Any]:
+    """Tüm tür × kart sayısı × DPI kombinasyonlarını ölç"""
+    cases = []
+    with tempfile.TemporaryDirectory(prefix="yakakart_bench_") as tmp:
+        for kind in kinds:
+            all_paths = make_fixtures(fixtures_dir, kind, max(card_counts))
+            for count in card_counts:
+                for dpi in dpis:
+                    if log:
+                        log(f"{kind} × {count} kart @ {dpi} DPI ...")
+                    output_path = Path(tmp) / f"{kind}_{count}_{dpi}.docx"
+                    result = run_case_isolated(all_paths[:count], dpi, workers,
+                                               output_path, output_format)
+                    case = {"kind": kind, "cards": count, "dpi": dpi, "workers": workers,
+                            "format": output_format}
+                    case.update(result)
+                    cases.append(case)
+                    if log:
+                        log(f"  → {result.get('wall_s', result.get('error'))}")
+
+    return {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "environment": environment(),
+        "profile": BENCH_PROFILE,
+        "cases": cases,
+    }
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m medar_yakakart.bench",
+        description="Sentetik kartlarla üretim hattının süre/bellek/boyut ölçümü"
+    )
+    parser.add_argument("--cards", type=int, nargs="+", default=list(CARD_COUNTS),
+                        help="Kart sayıları (varsayılan: %(default)s)")
+    parser.add_argument("--kinds", nargs="+", choices=FIXTURE_KINDS, default=list(FIXTURE_KINDS),
+                        help="PDF türleri (varsayılan: hepsi)")
+    parser.add_argument("--dpi", type=parse_render_dpi, nargs="+", default=list(DPI_CHOICES),
+                        help="DPI değerleri, 'auto' dahil (varsayılan: arayüzdeki seçenekler)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Paralel işçi sayısı (varsayılan: 1, aşama süreleri ayrışsın diye)")
+    parser.add_argument("--format", choices=OUTPUT_FORMATS, default="docx",
+                        help="Çıktı biçimi")
+    parser.add_argument("--fixtures", type=Path,
+                        help="Sentetik PDF klasörü (verilirse sonraki çalıştırmalarda yeniden kullanılır)")
+    parser.add_argument("-o", "--output", help="Sonuç JSON dosyası (varsayılan: stdout)")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    def log(text: str):
+        print(text, file=sys.stderr, flush=True)
+
+    if args.fixtures:
+        report = run_benchmarks(args.cards, args.kinds, args.dpi, args.workers,
+                                args.fixtures, args.format, log)
+    else:
+        with tempfile.TemporaryDirectory(prefix="yakakart_fixtures_") as fixtures:
+            report = run_benchmarks(args.cards, args.kinds, args.dpi, args.workers,
+                                    Path(fixtures), args.format, log)
+
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        Path(args.output).write_text(text, encoding="utf-8")
+        log(f"Sonuçlar yazıldı: {args.output}")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
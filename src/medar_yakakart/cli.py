@@ -0,0 +1,576 @@
+# -*- coding: utf-8 -*-
+"""
+Medar Yaka Kart Otomasyonu - Komut Satırı
+=========================================
+Argümansız çalıştırıldığında masaüstü uygulamasını açar. ``batch`` komutu
+ise pencere açmadan (tkinter içe aktarılmadan) toplu üretim yapar:
+
+    medar-yakakart batch kartlar/ ek.zip --profile "Personel Kartı" -o out.docx
+
+``watch`` komutu bir klasörü izler ve bırakılan PDF'leri toplu işler halinde
+üretir (sıcak klasör). Ctrl+C ile kesilen iş kaydedilir ve ``resume`` komutuyla kaldığı yerden
+sürdürülür. İlerleme stdout'a satır başına bir JSON nesnesi olarak yazılır; böylece
+zamanlayıcılar ve betikler çıktıyı kolayca izleyebilir.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional
+
+# Çıkış kodları
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_USAGE = 2
+EXIT_NO_INPUT = 3
+EXIT_CANCELLED = 4
+EXIT_PARTIAL = 5  # çıktı üretildi ama bazı kartlar atlandı
+
+
+def emit(event: str, **fields):
+    """Makine tarafından okunabilir bir olay satırı yaz"""
+    record = {"event": event, "time": round(time.time(), 3)}
+    record.update(fields)
+    print(json.dumps(record, ensure_ascii=False), flush=True)
+
+
+def describe_source(source) -> str:
+    """Olaylarda kaynağın yolu (arşiv üyeleri için "arşiv › üye")"""
+    if isinstance(source, Path):
+        return str(source)
+    from .core import source_label
+    return source_label(source)
+
+
+def collect_inputs(inputs: List[str], stage_times=None) -> list:
+    """PDF, klasör ve arşiv girdilerini PDF listesine çevir
+
+    Klasörler alt klasörleriyle birlikte taranır; arşivlerdeki PDF'ler
+    diske çıkarılmaz, render sırasında doğrudan arşivden okunur.
+    """
+    from .core import ARCHIVE_SUFFIXES, iter_archive_members
+
+    # Arşivler önce paralel listelenir; girdiler yine verilen sırayla eklenir
+    archives = [Path(item) for item in inputs
+                if Path(item).suffix.lower() in ARCHIVE_SUFFIXES and Path(item).is_file()]
+    listed = {archive: (members, error)
+              for archive, members, error in iter_archive_members(archives,
+                                                                  stage_times=stage_times)}
+
+    pdfs = []
+    for item in inputs:
+        path = Path(item)
+        suffix = path.suffix.lower()
+
+        if path.is_dir():
+            found = sorted(p for p in path.rglob('*') if p.suffix.lower() == '.pdf')
+            emit("input", path=str(path), kind="directory", pdfs=len(found))
+            pdfs.extend(found)
+        elif not path.exists():
+            emit("warning", path=str(path), message="Dosya bulunamadı")
+        elif suffix == '.pdf':
+            pdfs.append(path)
+        elif suffix in ARCHIVE_SUFFIXES:
+            members, error = listed[path]
+            if error is not None:
+                emit("warning", path=str(path), message=str(error))
+                continue
+            members = sorted(members, key=lambda m: m.member)
+            emit("input", path=str(path), kind="archive", pdfs=len(members))
+            pdfs.extend(members)
+        else:
+            emit("warning", path=str(path), message=f"Desteklenmeyen dosya türü: {suffix}")
+
+    return pdfs
+
+
+def positive_int(text: str) -> int:
+    """Pozitif tam sayı argümanı (ör. --printer-dpi)"""
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Tam sayı olmalı: {text}")
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"Sıfırdan büyük olmalı: {text}")
+    return value
+
+
+def dpi_argument(text: str):
+    """--dpi değeri: pozitif sayı ya da 'auto'"""
+    if text.strip().lower() == "auto":
+        return "auto"
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"DPI sayı ya da 'auto' olmalı: {text}")
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"DPI sıfırdan büyük olmalı: {text}")
+    return value
+
+
+def cards_per_page_argument(text: str):
+    """--cards-per-page değeri: en az 1 ya da 'auto' (sayfaya sığan en çok kart)"""
+    if text.strip().lower() == "auto":
+        return "auto"
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Sayfa başı kart sayı ya da 'auto' olmalı: {text}")
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"Sayfa başı kart en az 1 olmalı: {text}")
+    return value
+
+
+def run_batch(args) -> int:
+    """batch komutunu çalıştır"""
+    from .core import (
+        load_config, load_profiles, build_output_path, codec_from_settings, parse_render_dpi,
+        find_duplicates, resolve_worker_count, GenerationJob, StageTimes, Tracer,
+        DEFAULT_PRINTER_DPI, parse_cards_per_page, plan_imposition, imposition_report, AUTO_LAYOUT,
+    )
+
+    config = load_config()
+    profiles = load_profiles()
+    profile_name = args.profile or config.get("last_profile", "Varsayılan")
+    if profile_name not in profiles:
+        emit("error", message=f"Profil bulunamadı: {profile_name}",
+             profiles=list(profiles.keys()))
+        return EXIT_USAGE
+    profile = profiles[profile_name]
+
+    def margins(key: str):
+        values = profile.get(key, {})
+        return tuple(float(values.get(side, 1.27)) for side in ("top", "bottom", "left", "right"))
+
+    render_dpi = (args.dpi if args.dpi is not None
+                  else parse_render_dpi(profile.get("render_dpi", 300)))
+    printer_dpi = (args.printer_dpi if args.printer_dpi is not None
+                   else int(profile.get("printer_dpi", DEFAULT_PRINTER_DPI)))
+    cards_per_page = (args.cards_per_page if args.cards_per_page is not None
+                      else parse_cards_per_page(profile.get("cards_per_page", 8)))
+    card_spacing_cm = (args.card_spacing if args.card_spacing is not None
+                       else float(profile.get("card_spacing_cm", config.get("card_spacing_cm", 0.0))))
+    workers = args.workers if args.workers is not None else int(profile.get("workers", 0))
+    output_format = args.format or config.get("output_format", "docx")
+
+    codec_settings = dict(profile)
+    for key, value in (("image_format", args.image_format),
+                       ("png_compress_level", args.png_level),
+                       ("jpeg_quality", args.jpeg_quality)):
+        if value is not None:
+            codec_settings[key] = value
+    try:
+        codec = codec_from_settings(codec_settings)
+    except ValueError as e:
+        emit("error", message=str(e))
+        return EXIT_USAGE
+
+    card_height_cm = float(profile.get("card_height_cm", 5.81))
+    card_width_cm = float(profile.get("card_width_cm", 9.2))
+    layout = None
+    if cards_per_page == AUTO_LAYOUT:
+        try:
+            layout = plan_imposition(card_height_cm, card_width_cm, margins("front_margins"),
+                                     margins("back_margins"), card_spacing_cm)
+        except ValueError as e:
+            emit("error", message=str(e))
+            return EXIT_USAGE
+
+    if args.output:
+        output_path = Path(args.output)
+    else:
+        output_path = build_output_path(
+            Path(args.output_dir or config.get("output_dir")),
+            config.get("filename_template", "kartlar_{date}_{time}")
+        )
+
+    stage_times = Tracer() if args.trace or config.get("write_trace", False) else StageTimes()
+
+    started = time.perf_counter()
+    pdfs = collect_inputs(args.inputs, stage_times)
+    if not pdfs:
+        emit("error", message="Hiç PDF bulunamadı")
+        return EXIT_NO_INPUT
+
+    duplicates = []
+    if not args.keep_duplicates:
+        pdfs, duplicates, _ = find_duplicates(pdfs, resolve_worker_count(workers))
+        for source, original, reason in duplicates:
+            emit("duplicate", path=describe_source(source), original=describe_source(original),
+                 reason=reason)
+
+    emit("start", profile=profile_name, pdfs=len(pdfs), duplicates=len(duplicates),
+         output=str(output_path), format=output_format, dpi=render_dpi, printer_dpi=printer_dpi,
+         cards_per_page=cards_per_page, card_spacing_cm=card_spacing_cm)
+    if layout is not None:
+        emit("imposition", **imposition_report(layout, len(pdfs)))
+
+    job = GenerationJob.create(pdfs, {
+        "card_height_cm": card_height_cm,
+        "card_width_cm": card_width_cm,
+        "front_margins": list(margins("front_margins")),
+        "back_margins": list(margins("back_margins")),
+        "render_dpi": render_dpi,
+        "printer_dpi": printer_dpi,
+        "cards_per_page": cards_per_page,
+        "card_spacing_cm": card_spacing_cm,
+        "output_path": str(output_path),
+        "output_format": output_format,
+        "workers": workers,
+        "codec": codec,
+    }, resumable=not args.no_resume)
+    return execute_job(job, args, config, started, stage_times)
+
+
+def execute_job(job, args, config, started: float, stage_times=None) -> int:
+    """Bir üretim işini çalıştır (batch ve resume ortak); olayları yaz"""
+    from .core import (
+        create_render_cache, EncodeStats, GenerationCancelled, StageTimes, Tracer, trace_path_for,
+    )
+
+    if stage_times is None:
+        write_trace = args.trace or config.get("write_trace", False)
+        stage_times = Tracer() if write_trace else StageTimes()
+    encode_stats = EncodeStats()
+
+    # Atlanan kartlar; "both" biçiminde aynı kart iki çıktıda da bildirilir
+    failed = {}
+
+    def card_failed(source, error):
+        if source in failed:
+            return
+        failed[source] = str(error)
+        emit("error", path=describe_source(source), message=str(error))
+
+    try:
+        outputs = job.run(
+            cache=None if args.no_cache else create_render_cache(config),
+            progress_callback=lambda value: emit("progress", percent=round(value, 1)),
+            status_callback=lambda text: emit("status", message=text),
+            encode_stats=encode_stats,
+            stage_times=stage_times,
+            error_callback=card_failed,
+        )
+    except (GenerationCancelled, KeyboardInterrupt):
+        emit("cancelled", job=job.job_id, resumable=job.resumable,
+             groups_done=job.progress["groups_done"],
+             groups_total=job.progress["groups_total"],
+             elapsed_s=round(time.perf_counter() - started, 3))
+        return EXIT_CANCELLED
+    except Exception as e:
+        emit("error", message=str(e), job=job.job_id,
+             elapsed_s=round(time.perf_counter() - started, 3))
+        return EXIT_FAILED
+
+    emit("encode", codec=job.settings["codec"], formats=encode_stats.by_format())
+    auto_dpi = encode_stats.auto_dpi()
+    if auto_dpi:
+        emit("auto_dpi", **auto_dpi)
+    if args.encode_report:
+        with open(args.encode_report, 'w', encoding='utf-8') as f:
+            json.dump({"codec": job.settings["codec"], "images": encode_stats.records,
+                       "auto_dpi": encode_stats.dpi_records},
+                      f, indent=2, ensure_ascii=False)
+
+    emit("stages", stages=stage_times.as_dict())
+    if isinstance(stage_times, Tracer):
+        trace_path = stage_times.write_chrome_trace(trace_path_for(outputs[0]))
+        emit("trace", path=str(trace_path), events=len(stage_times.events))
+
+    emit("done", outputs=[str(path) for path in outputs], pdfs=len(job.sources),
+         ok=len(job.sources) - len(failed), failed=len(failed),
+         elapsed_s=round(time.perf_counter() - started, 3))
+    return EXIT_PARTIAL if failed else EXIT_OK
+
+
+def run_resume(args) -> int:
+    """resume komutu: bekleyen işleri listele ya da birini sürdür"""
+    from .core import load_config, list_resumable_jobs
+
+    jobs = list_resumable_jobs()
+    if not args.job_id:
+        for job in jobs:
+            emit("job", job=job.job_id, status=job.status, pdfs=len(job.sources),
+                 progress=job.progress, output=job.settings.get("output_path"),
+                 description=job.describe())
+        return EXIT_OK
+
+    job = next((job for job in jobs if job.job_id == args.job_id), None)
+    if job is None:
+        emit("error", message=f"Devam ettirilecek iş bulunamadı: {args.job_id}",
+             jobs=[job.job_id for job in jobs])
+        return EXIT_USAGE
+
+    if args.discard:
+        job.discard()
+        emit("discarded", job=job.job_id)
+        return EXIT_OK
+
+    emit("resume", job=job.job_id, pdfs=len(job.sources), progress=job.progress,
+         output=job.settings.get("output_path"))
+    return execute_job(job, args, load_config(), time.perf_counter())
+
+
+def run_watch(args) -> int:
+    """watch komutu: sıcak klasörü izle"""
+    from .core import (
+        load_config, load_profiles, create_render_cache, profile_generation_settings, FolderWatcher,
+    )
+
+    config = load_config()
+    profiles = load_profiles()
+    directory = args.directory or config.get("watch_dir")
+    if not directory or not Path(directory).is_dir():
+        emit("error", message=f"İzlenecek klasör bulunamadı: {directory or '-'}")
+        return EXIT_USAGE
+    directory = Path(directory)
+
+    profile_name = args.profile or config.get("watch_profile") or config.get("last_profile", "Varsayılan")
+    if profile_name not in profiles:
+        emit("error", message=f"Profil bulunamadı: {profile_name}", profiles=list(profiles.keys()))
+        return EXIT_USAGE
+    try:
+        generation = profile_generation_settings(profiles[profile_name])
+    except ValueError as e:
+        emit("error", message=str(e))
+        return EXIT_USAGE
+    if args.workers is not None:
+        generation["workers"] = args.workers
+
+    def option(value, key):
+        return value if value is not None else config.get(key)
+
+    watcher = FolderWatcher(
+        directory,
+        generation,
+        output_dir=Path(args.output_dir or config.get("output_dir")),
+        filename_template=config.get("filename_template", "kartlar_{date}_{time}"),
+        batch_size=option(args.batch_size, "watch_batch_size"),
+        batch_timeout_s=option(args.batch_timeout, "watch_batch_timeout_s"),
+        stable_s=option(args.stable, "watch_stable_s"),
+        poll_s=option(args.poll, "watch_poll_s"),
+        done_dir=args.done_dir,
+        failed_dir=args.failed_dir,
+        cache=None if args.no_cache else create_render_cache(config),
+        on_event=emit,
+    )
+    try:
+        watcher.run(flush_on_idle=args.once)
+    except KeyboardInterrupt:
+        emit("stopped", batches=watcher.batches, processed=watcher.processed, failed=watcher.failed)
+    return EXIT_OK if not watcher.failed else EXIT_FAILED
+
+
+def run_serve(args) -> int:
+    """serve komutu: HTTP üretim servisini çalıştır"""
+    from .core import load_config, create_render_cache
+    from .server import create_server
+
+    config = load_config()
+    try:
+        server = create_server(
+            args.host, args.port,
+            workers=args.workers,
+            queue_size=args.queue,
+            max_upload_mb=args.max_upload_mb,
+            cache=None if args.no_cache else create_render_cache(config),
+            job_workers=args.job_workers,
+            on_event=emit,
+        )
+    except OSError as e:
+        emit("error", message=f"Sunucu başlatılamadı: {e}")
+        return EXIT_FAILED
+
+    host, port = server.server_address[:2]
+    emit("serve", url=f"http://{host}:{port}", workers=args.workers, queue=args.queue)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.service.shutdown()
+    emit("stopped", **server.service.status())
+    return EXIT_OK
+
+
+# Ayrı bir Python sürecinde çalıştırılan başlangıç ölçümü. Son stdout satırına
+# JSON yazar; içe aktarma dökümü -X importtime ile stderr'e düşer.
+STARTUP_PROBE = """
+import json, time
+start = time.perf_counter()
+import medar_yakakart.app as app
+imported = time.perf_counter()
+window = None
+try:
+    root = app.create_root()
+    ui = app.YakaKartApp(root)
+    root.update()
+    window = time.perf_counter()
+    root.destroy()
+except Exception:
+    pass
+app.warm_up_imports()
+print(json.dumps({
+    "import_ms": round((imported - start) * 1000, 1),
+    "window_ms": round((window - start) * 1000, 1) if window else None,
+    "lazy_imports_ms": {k: round(v * 1000, 1) for k, v in app.LAZY_IMPORT_TIMES.items()},
+}))
+"""
+
+
+def parse_importtime(stderr: str) -> List[dict]:
+    """python -X importtime çıktısını modül başına kayıtlara çevir"""
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+            modules.append({
+                "module": name.strip(),
+                "depth": (len(name) - len(name.lstrip()) - 1) // 2,
+                "self_ms": round(int(self_us) / 1000, 1),
+                "cumulative_ms": round(int(cumulative_us) / 1000, 1),
+            })
+        except ValueError:
+            continue
+    return modules
+
+
+def run_startup_report(args) -> int:
+    """Başlangıç süresi raporu: içe aktarma dökümü, pencere ve gecikmeli yükleme süreleri"""
+    if getattr(sys, "frozen", False):
+        emit("error", message="Başlangıç raporu paketlenmiş (exe) sürümde çalışmaz; "
+                              "kaynaktan 'python -m medar_yakakart startup-report' kullanın.")
+        return EXIT_USAGE
+
+    env = dict(os.environ)
+    package_root = str(Path(__file__).resolve().parents[1])
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [package_root, env.get("PYTHONPATH")]))
+
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", STARTUP_PROBE],
+                            capture_output=True, text=True, env=env)
+    if result.returncode != 0 or not result.stdout.strip():
+        emit("error", message=result.stderr.strip().splitlines()[-1:] or "Ölçüm başarısız")
+        return EXIT_FAILED
+
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+    modules = parse_importtime(result.stderr)
+    # Yalnızca doğrudan içe aktarılanlar (derinlik 0) — iç içe modüller üsttekinin içindedir
+    top = sorted((m for m in modules if m["depth"] == 0),
+                 key=lambda m: -m["cumulative_ms"])[:args.top]
+    emit("startup", **report, modules=top)
+    return EXIT_OK
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Komut satırı ayrıştırıcısını oluştur"""
+    parser = argparse.ArgumentParser(
+        prog="medar-yakakart",
+        description="PDF yaka kartlarını dupleks baskıya uygun Word çıktısına dönüştürür. "
+                    "Komut verilmezse masaüstü uygulaması açılır."
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    batch = subparsers.add_parser("batch", help="Pencere açmadan toplu üretim yap")
+    batch.add_argument("inputs", nargs="+", help="PDF dosyaları, klasörler veya ZIP/RAR/7Z arşivleri")
+    batch.add_argument("-p", "--profile", help="profiles.json içindeki profil adı (varsayılan: son profil)")
+    batch.add_argument("-o", "--output", help="Çıktı dosyası yolu (uzantı biçime göre ayarlanır)")
+    batch.add_argument("--output-dir", help="Çıktı klasörü (dosya adı config şablonundan)")
+    batch.add_argument("--format", choices=["docx", "pdf", "both"],
+                       help="Çıktı biçimi (varsayılan: config output_format)")
+    batch.add_argument("--dpi", type=dpi_argument,
+                       help="Profildeki DPI değerini geçersiz kıl; 'auto' = sayfa içeriğine göre")
+    batch.add_argument("--printer-dpi", type=positive_int,
+                       help="Otomatik DPI için yazıcı çözünürlüğü (varsayılan: profil ya da 600)")
+    batch.add_argument("--cards-per-page", type=cards_per_page_argument,
+                       help="Profildeki sayfa başı kartı geçersiz kıl; 'auto' = sayfaya sığan en çok kart")
+    batch.add_argument("--card-spacing", type=float,
+                       help="Otomatik yerleşimde kartlar arası boşluk, cm (varsayılan: profil ya da config)")
+    batch.add_argument("--workers", type=int, help="Paralel işçi sayısı (0 = otomatik)")
+    batch.add_argument("--image-format", choices=["png", "jpeg", "auto"],
+                       help="Görüntü kodlama biçimi (varsayılan: profil)")
+    batch.add_argument("--png-level", type=int, help="PNG sıkıştırma seviyesi (0-9)")
+    batch.add_argument("--jpeg-quality", type=int, help="JPEG kalitesi (1-100)")
+    batch.add_argument("--encode-report", help="Görüntü başına kodlama süresi/boyutu JSON dosyası")
+    batch.add_argument("--no-cache", action="store_true", help="Render önbelleğini kullanma")
+    batch.add_argument("--trace", action="store_true",
+                       help="Çıktının yanına Chrome trace (.trace.json) yaz (config: write_trace)")
+    batch.add_argument("--keep-duplicates", action="store_true",
+                       help="İçeriği ya da görünümü aynı PDF'leri çıkarma")
+    batch.add_argument("--no-resume", action="store_true",
+                       help="İş kaydı tutma; kesilen ya da hata veren iş sürdürülemez "
+                            "(zamanlanmış görevler için)")
+    batch.set_defaults(handler=run_batch)
+
+    resume = subparsers.add_parser("resume", help="İptal edilen ya da yarıda kalan işi sürdür")
+    resume.add_argument("job_id", nargs="?", help="İş kimliği (verilmezse bekleyen işler listelenir)")
+    resume.add_argument("--discard", action="store_true", help="İşi sürdürmek yerine kaydını sil")
+    resume.add_argument("--no-cache", action="store_true",
+                        help="Render önbelleğini kullanma (işe özel önbellek kullanılır)")
+    resume.add_argument("--trace", action="store_true", help="Chrome trace (.trace.json) yaz")
+    resume.add_argument("--encode-report", help="Görüntü başına kodlama süresi/boyutu JSON dosyası")
+    resume.set_defaults(handler=run_resume)
+
+    watch = subparsers.add_parser("watch", help="Klasörü izle, gelen PDF'leri toplu işle (sıcak klasör)")
+    watch.add_argument("directory", nargs="?", help="İzlenecek klasör (varsayılan: config watch_dir)")
+    watch.add_argument("-p", "--profile", help="Profil adı (varsayılan: config watch_profile)")
+    watch.add_argument("--output-dir", help="Çıktı klasörü (varsayılan: config output_dir)")
+    watch.add_argument("--batch-size", type=int, help="Bu kadar PDF birikince üret (config: watch_batch_size)")
+    watch.add_argument("--batch-timeout", type=float,
+                       help="İlk hazır PDF bu kadar saniye bekleyince üret (config: watch_batch_timeout_s)")
+    watch.add_argument("--stable", type=float,
+                       help="Dosya bu kadar saniye değişmezse yazımı bitmiş say (config: watch_stable_s)")
+    watch.add_argument("--poll", type=float, help="Tarama aralığı, saniye (config: watch_poll_s)")
+    watch.add_argument("--done-dir", type=Path, help="İşlenen PDF'lerin klasörü (varsayılan: <klasör>/done)")
+    watch.add_argument("--failed-dir", type=Path, help="İşlenemeyen PDF'lerin klasörü (varsayılan: <klasör>/failed)")
+    watch.add_argument("--workers", type=int, help="Paralel işçi sayısı (0 = otomatik)")
+    watch.add_argument("--no-cache", action="store_true", help="Render önbelleğini kullanma")
+    watch.add_argument("--once", action="store_true",
+                       help="Klasördeki PDF'leri işle ve çık (zaman aşımı beklenmez; zamanlanmış görevler için)")
+    watch.set_defaults(handler=run_watch)
+
+    serve = subparsers.add_parser("serve", help="Yerel HTTP üretim servisini başlat")
+    serve.add_argument("--host", default="127.0.0.1",
+                       help="Dinlenecek adres (varsayılan: %(default)s; ağa açmak için 0.0.0.0)")
+    serve.add_argument("--port", type=int, default=8765, help="Port (varsayılan: %(default)s)")
+    serve.add_argument("--workers", type=int, default=2,
+                       help="Aynı anda çalışan üretim sayısı (varsayılan: %(default)s)")
+    serve.add_argument("--queue", type=int, default=8,
+                       help="Bunlara ek bekleyebilecek istek sayısı; aşılırsa 503 (varsayılan: %(default)s)")
+    serve.add_argument("--job-workers", type=int,
+                       help="Üretim başına paralel işçi sayısı (varsayılan: çekirdek sayısı / --workers)")
+    serve.add_argument("--max-upload-mb", type=int, default=200,
+                       help="En büyük istek gövdesi, MB (varsayılan: %(default)s)")
+    serve.add_argument("--no-cache", action="store_true", help="Render önbelleğini kullanma")
+    serve.set_defaults(handler=run_serve)
+
+    startup = subparsers.add_parser("startup-report",
+                                    help="Başlangıç süresini ve içe aktarma dökümünü ölç")
+    startup.add_argument("--top", type=int, default=15, help="Listelenecek modül sayısı")
+    startup.set_defaults(handler=run_startup_report)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    # PyInstaller tek dosya derlemesinde işçi süreçleri için gerekli
+    multiprocessing.freeze_support()
+
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        from .app import main as run_gui
+        run_gui()
+        return EXIT_OK
+
+    args = build_parser().parse_args(argv)
+    if not getattr(args, "handler", None):
+        build_parser().print_help()
+        return EXIT_USAGE
+    return args.handler(args)
@@ -0,0 +1,3352 @@
+# -*- coding: utf-8 -*-
+"""
+Medar Yaka Kart Otomasyonu - Çekirdek
+=====================================
+Arayüzden bağımsız işlemler: ayarlar, arşiv çıkarma, PDF render ve Word
+çıktısı. Bu modül tkinter içe aktarmaz; masaüstü uygulaması, komut satırı
+ve işçi süreçler tarafından ortak kullanılır.
+
+Ağır bağımlılıklar (PyMuPDF, python-docx, Pillow, rarfile) ilk kullanımda
+yüklenir; 7-Zip/rarfile yoklaması da ilk ihtiyaçta yapılır. Böylece pencere,
+bu modüller yüklenmeden açılabilir.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from io import BytesIO
+import os
+import re
+import sys
+import math
+import zipfile
+import shutil
+import tempfile
+import json
+import hashlib
+import itertools
+import subprocess
+import time
+import threading
+import importlib
+import multiprocessing
+import importlib.util
+from functools import lru_cache
+from collections import deque, OrderedDict
+from contextlib import contextmanager, nullcontext
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
+from typing import List, Tuple, Optional, Dict, Any, Callable, Union
+
+# ================== GECİKMELİ İÇE AKTARMA ==================
+
+# İlk kullanımda yüklenen modüllerin yüklenme süreleri (saniye)
+LAZY_IMPORT_TIMES: Dict[str, float] = {}
+
+
+class LazyImport:
+    """İlk kullanımda içe aktarılan modül ya da modül özniteliği vekili
+
+    Bir özniteliğine erişildiğinde veya çağrıldığında loader çalıştırılır;
+    sonraki erişimler doğrudan yüklenen nesneye yönlendirilir. Loader'lar
+    gerçek import ifadeleri içerir, böylece PyInstaller bağımlılıkları yine görür.
+    """
+
+    _SLOTS = ("_name", "_loader", "_target", "_lock")
+
+    def __init__(self, name: str, loader: Callable[[], Any]):
+        self._name = name
+        self._loader = loader
+        self._target = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if self._target is None:
+            with self._lock:
+                if self._target is None:
+                    start = time.perf_counter()
+                    target = self._loader()
+                    LAZY_IMPORT_TIMES.setdefault(self._name, time.perf_counter() - start)
+                    self._target = target
+        return self._target
+
+    @property
+    def loaded(self) -> bool:
+        return self._target is not None
+
+    def __getattr__(self, name):
+        if name in LazyImport._SLOTS:
+            raise AttributeError(name)
+        return getattr(self._load(), name)
+
+    def __call__(self, *args, **kwargs):
+        return self._load()(*args, **kwargs)
+
+    def __repr__(self):
+        return f"<LazyImport {self._name} ({'yüklü' if self.loaded else 'yüklenmedi'})>"
+
+
+def _load_fitz():
+    try:
+        import pymupdf  # PyMuPDF >= 1.24.3
+        return pymupdf
+    except ImportError:
+        import fitz  # PyMuPDF (eski sürümler)
+        return fitz
+
+
+def _load_docx():
+    import docx
+    import docx.shared
+    import docx.image.image
+    return docx
+
+
+def _load_pil_image():
+    from PIL import Image
+    return Image
+
+
+def _load_rarfile():
+    import rarfile
+    return rarfile
+
+
+fitz = LazyImport("pymupdf", _load_fitz)
+Document = LazyImport("docx", lambda: _load_docx().Document)
+Cm = LazyImport("docx", lambda: _load_docx().shared.Cm)
+Emu = LazyImport("docx", lambda: _load_docx().shared.Emu)
+DocxImage = LazyImport("docx", lambda: _load_docx().image.image.Image)
+Image = LazyImport("PIL.Image", _load_pil_image)
+rarfile = LazyImport("rarfile", _load_rarfile)
+
+
+def warm_up_imports():
+    """Ağır modülleri önceden yükle (pencere açıldıktan sonra arka planda çağrılır)"""
+    for proxy in (fitz, Image, Document):
+        proxy._load()
+
+# ================== GENEL AYARLAR ==================
+
+if getattr(sys, "frozen", False):
+    BASE_DIR = Path(sys.executable).resolve().parent
+else:
+    BASE_DIR = Path(__file__).resolve().parent
+
+# Yapılandırma dosyaları
+CONFIG_FILE = BASE_DIR / "config.json"
+PROFILES_FILE = BASE_DIR / "profiles.json"
+STATS_FILE = BASE_DIR / "stats.json"
+
+# Render önbelleği (config.json ile aynı klasörde)
+RENDER_CACHE_DIR = BASE_DIR / "render_cache"
+
+# 7-Zip / rarfile desteği: başlangıçta değil, ilk ihtiyaçta yoklanır (sonuç saklanır)
+
+@lru_cache(maxsize=None)
+def find_7zip() -> Optional[str]:
+    """7-Zip'i sistemde bul; bulunamazsa None"""
+    possible_paths = [
+        BASE_DIR / "7z.exe",
+        Path("C:/Program Files/7-Zip/7z.exe"),
+        Path("C:/Program Files (x86)/7-Zip/7z.exe"),
+    ]
+    
+    for path in possible_paths:
+        if path.exists():
+            return str(path)
+    
+    return shutil.which("7z.exe") or shutil.which("7z")
+
+
+def seven_zip_supported() -> bool:
+    return find_7zip() is not None
+
+
+@lru_cache(maxsize=None)
+def rar_supported() -> bool:
+    """rarfile modülü kurulu mu (içe aktarmadan bakılır)"""
+    return importlib.util.find_spec("rarfile") is not None
+
+
+def probe_archive_tools() -> Dict[str, Any]:
+    """Arşiv araçlarını yokla (arayüz bunu pencere açıldıktan sonra arka planda çağırır)"""
+    return {"seven_zip": find_7zip(), "rarfile": rar_supported()}
+
+# ================== VARSAYILAN AYARLAR ==================
+
+DEFAULT_CONFIG = {
+    "card_height_cm": 5.81,
+    "card_width_cm": 9.2,
+    "front_margins": {
+        "top": 1.27,
+        "bottom": 1.27,
+        "left": 1.27,
+        "right": 1.27
+    },
+    "back_margins": {
+        "top": 1.27,
+        "bottom": 1.27,
+        "left": 0.7,
+        "right": 1.27
+    },
+    "render_dpi": 300,  # ya da "auto": sayfa içeriğine ve yazıcı DPI'ına göre
+    "printer_dpi": 600,  # otomatik DPI'da hedef yazıcı çözünürlüğü
+    "cards_per_page": 8,
+    "card_spacing_cm": 0.0,
+    "workers": 0,  # 0 = otomatik (çekirdek sayısı - 1)
+    "render_cache_mb": 512,  # 0 = önbellek kapalı
+    "output_dir": str(BASE_DIR / "output"),
+    "output_format": "docx",  # docx, pdf, both
+    "write_trace": False,  # çıktının yanına .trace.json (Chrome trace) yaz
+    "max_concurrent_jobs": 1,  # kuyrukta aynı anda çalışan iş sayısı
+    "watch_dir": "",  # izlenen sıcak klasör
+    "watch_profile": "Varsayılan",
+    "watch_batch_size": 50,  # bu kadar kart birikince hemen üret
+    "watch_batch_timeout_s": 60,  # ya da ilk kart bu kadar bekleyince
+    "watch_stable_s": 5,  # dosya bu süre değişmezse yazımı bitmiş sayılır
+    "watch_poll_s": 2,
+    "filename_template": "kartlar_{date}_{time}",
+    "theme": "light",
+    "last_profile": "Varsayılan"
+}
+
+DEFAULT_PROFILES = {
+    "Varsayılan": {
+        "card_height_cm": 5.81,
+        "card_width_cm": 9.2,
+        "front_margins": {"top": 1.27, "bottom": 1.27, "left": 1.27, "right": 1.27},
+        "back_margins": {"top": 1.27, "bottom": 1.27, "left": 0.7, "right": 1.27},
+        "render_dpi": 300,
+        "cards_per_page": 8,
+        "workers": 0,
+        "image_format": "png",
+        "png_compress_level": 6,
+        "jpeg_quality": 90,
+        "jpeg_subsampling": "4:2:0"
+    },
+    "Personel Kartı": {
+        "card_height_cm": 5.5,
+        "card_width_cm": 8.5,
+        "front_margins": {"top": 1.0, "bottom": 1.0, "left": 1.0, "right": 1.0},
+        "back_margins": {"top": 1.0, "bottom": 1.0, "left": 0.8, "right": 1.0},
+        "render_dpi": 300,
+        "cards_per_page": 8,
+        "workers": 0,
+        "image_format": "png",
+        "png_compress_level": 6,
+        "jpeg_quality": 90,
+        "jpeg_subsampling": "4:2:0"
+    },
+    "Ziyaretçi Kartı": {
+        "card_height_cm": 5.0,
+        "card_width_cm": 8.0,
+        "front_margins": {"top": 1.5, "bottom": 1.5, "left": 1.5, "right": 1.5},
+        "back_margins": {"top": 1.5, "bottom": 1.5, "left": 1.2, "right": 1.5},
+        "render_dpi": 250,
+        "cards_per_page": 8,
+        "workers": 0,
+        "image_format": "png",
+        "png_compress_level": 6,
+        "jpeg_quality": 90,
+        "jpeg_subsampling": "4:2:0"
+    }
+}
+
+DEFAULT_STATS = {
+    "total_cards": 0,
+    "total_sessions": 0,
+    "last_session_date": None,
+    "last_session_cards": 0
+}
+
+# ================== YARDIMCI FONKSİYONLAR ==================
+
+def load_config() -> Dict[str, Any]:
+    """Yapılandırmayı yükle"""
+    try:
+        if CONFIG_FILE.exists():
+            with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
+                config = json.load(f)
+                # Eksik anahtarları varsayılanlarla doldur
+                for key, value in DEFAULT_CONFIG.items():
+                    if key not in config:
+                        config[key] = value
+                return config
+    except Exception:
+        pass
+    return DEFAULT_CONFIG.copy()
+
+
+def save_config(config: Dict[str, Any]):
+    """Yapılandırmayı kaydet"""
+    try:
+        with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
+            json.dump(config, f, indent=2, ensure_ascii=False)
+    except Exception as e:
+        print(f"Config kaydetme hatası: {e}")
+
+
+def load_profiles() -> Dict[str, Dict]:
+    """Profilleri yükle"""
+    try:
+        if PROFILES_FILE.exists():
+            with open(PROFILES_FILE, 'r', encoding='utf-8') as f:
+                profiles = json.load(f)
+                # Varsayılan profilleri ekle
+                for name, profile in DEFAULT_PROFILES.items():
+                    if name not in profiles:
+                        profiles[name] = profile
+                return profiles
+    except Exception:
+        pass
+    return DEFAULT_PROFILES.copy()
+
+
+def save_profiles(profiles: Dict[str, Dict]):
+    """Profilleri kaydet"""
+    try:
+        with open(PROFILES_FILE, 'w', encoding='utf-8') as f:
+            json.dump(profiles, f, indent=2, ensure_ascii=False)
+    except Exception as e:
+        print(f"Profil kaydetme hatası: {e}")
+
+
+def load_stats() -> Dict[str, Any]:
+    """İstatistikleri yükle"""
+    try:
+        if STATS_FILE.exists():
+            with open(STATS_FILE, 'r', encoding='utf-8') as f:
+                return json.load(f)
+    except Exception:
+        pass
+    return DEFAULT_STATS.copy()
+
+
+def save_stats(stats: Dict[str, Any]):
+    """İstatistikleri kaydet"""
+    try:
+        with open(STATS_FILE, 'w', encoding='utf-8') as f:
+            json.dump(stats, f, indent=2, ensure_ascii=False)
+    except Exception as e:
+        print(f"İstatistik kaydetme hatası: {e}")
+
+
+def update_stats(cards_created: int):
+    """İstatistikleri güncelle"""
+    stats = load_stats()
+    stats["total_cards"] += cards_created
+    stats["total_sessions"] += 1
+    stats["last_session_date"] = datetime.now().strftime("%Y-%m-%d %H:%M")
+    stats["last_session_cards"] = cards_created
+    save_stats(stats)
+    return stats
+
+
+def build_output_path(output_dir: Path, template: str, extension: str = ".docx") -> Path:
+    """Dosya adı şablonundan ({date}, {time}) çıktı yolunu oluştur"""
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    now = datetime.now()
+    filename = template.replace("{date}", now.strftime("%Y%m%d"))
+    filename = filename.replace("{time}", now.strftime("%H%M%S"))
+
+    return output_dir / f"{filename}{extension}"
+
+
+# ================== AŞAMA SÜRELERİ ==================
+
+class StageTimes:
+    """Aşama başına toplam süre ve çağrı sayısı (render, encode, layout, save...)
+
+    İşçi süreçlerde toplanan süreler ana süreçteki örneğe merge ile eklenir;
+    bu yüzden paralel çalışmada aşama toplamı duvar saatini aşabilir.
+    """
+
+    def __init__(self):
+        self.seconds: Dict[str, float] = {}
+        self.calls: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        # İşçi süreçten dönerken kilit taşınamaz
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def add(self, stage: str, seconds: float, calls: int = 1):
+        with self._lock:
+            self.seconds[stage] = self.seconds.get(stage, 0.0) + seconds
+            self.calls[stage] = self.calls.get(stage, 0) + calls
+
+    @contextmanager
+    def measure(self, stage: str, **args):
+        """Aşamayı ölç; args (dosya adı vb.) yalnızca Tracer tarafından saklanır"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stage, time.perf_counter() - start)
+
+    def merge(self, other: "StageTimes"):
+        for stage, seconds in other.seconds.items():
+            self.add(stage, seconds, other.calls.get(stage, 0))
+
+    def as_dict(self) -> Dict[str, Dict[str, float]]:
+        return {stage: {"seconds": round(seconds, 4), "calls": self.calls[stage]}
+                for stage, seconds in self.seconds.items()}
+
+    def summary(self) -> str:
+        """Log için tek satırlık özet (en uzun aşama önce)"""
+        if not self.seconds:
+            return "Aşama ölçümü yok"
+        parts = [f"{stage} {seconds:.2f} sn ({self.calls[stage]})"
+                 for stage, seconds in sorted(self.seconds.items(), key=lambda item: -item[1])]
+        return "Aşamalar → " + " | ".join(parts)
+
+
+class Tracer(StageTimes):
+    """Aşama sürelerine ek olarak her ölçümü zaman çizelgesi olayı olarak saklar
+
+    Olaylar süreç/thread kimliği ve dosya adıyla birlikte Chrome trace
+    biçiminde yazılır; chrome://tracing veya ui.perfetto.dev ile açılabilir.
+    İşçi süreçlerin olayları merge ile ana sürecin çizelgesine eklenir.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.events: List[Dict[str, Any]] = []
+
+    @contextmanager
+    def measure(self, stage: str, **args):
+        start_us = time.time_ns() // 1000  # süreçler arası ortak saat
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            self.add(stage, seconds)
+            event = {"name": stage, "cat": "yakakart", "ph": "X", "ts": start_us,
+                     "dur": round(seconds * 1_000_000, 1),
+                     "pid": os.getpid(), "tid": threading.get_native_id()}
+            if args:
+                event["args"] = args
+            with self._lock:
+                self.events.append(event)
+
+    def merge(self, other: StageTimes):
+        super().merge(other)
+        if isinstance(other, Tracer):
+            with self._lock:
+                self.events.extend(other.events)
+
+    def write_chrome_trace(self, path: Path) -> Path:
+        """Olayları Chrome trace (Perfetto) JSON dosyasına yaz"""
+        main_pid = os.getpid()
+        names = [
+            {"name": "process_name", "ph": "M", "pid": pid, "tid": 0,
+             "args": {"name": "ana süreç" if pid == main_pid else f"işçi {pid}"}}
+            for pid in sorted({event["pid"] for event in self.events})
+        ]
+        path = Path(path)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({"traceEvents": names + self.events, "displayTimeUnit": "ms"}, f,
+                      ensure_ascii=False)
+        return path
+
+
+def measure(stage_times: Optional[StageTimes], stage: str, **args):
+    """stage_times verilmişse aşamayı ölç, verilmemişse hiçbir şey yapma"""
+    return stage_times.measure(stage, **args) if stage_times is not None else nullcontext()
+
+
+def trace_path_for(output_path: Path) -> Path:
+    """Çıktının yanına yazılacak iz dosyasının yolu (kartlar.docx → kartlar.trace.json)"""
+    return Path(output_path).with_suffix(".trace.json")
+
+
+# ================== ARŞİV FONKSİYONLARI ==================
+
+ARCHIVE_SUFFIXES = ('.zip', '.rar', '.7z')
+
+
+class ArchiveMember:
+    """Arşiv içindeki bir PDF
+
+    Diske çıkarılmaz; render sırasında doğrudan arşivden belleğe okunur.
+    Kimliği (arşiv yolu, üye adı) çiftidir, bu yüzden farklı arşivlerdeki
+    aynı adlı dosyalar birbirine karışmaz. İşçi süreçlere gönderilebilir
+    (pickle) ve dosya listesinde Path ile yan yana durabilir.
+    """
+
+    suffix = '.pdf'
+
+    def __init__(self, archive_path: Path, member: str, kind: str):
+        self.archive_path = Path(archive_path)
+        self.member = member
+        self.kind = kind  # zip, rar, 7z
+
+    @property
+    def name(self) -> str:
+        return self.member.replace('\\', '/').rsplit('/', 1)[-1]
+
+    @property
+    def label(self) -> str:
+        return f"{self.archive_path.name} › {self.member}"
+
+    def read_bytes(self) -> bytes:
+        """Üyenin içeriğini arşivden oku"""
+        if self.kind == 'zip':
+            with _ZIP_HANDLES.use(self.archive_path) as zip_ref:
+                return zip_ref.read(self.member)
+        if self.kind == 'rar':
+            with rarfile.RarFile(self.archive_path, 'r') as rar_ref:
+                return rar_ref.read(self.member)
+        with _SEVEN_ZIP_ARCHIVES.use(self.archive_path) as archive:
+            return archive.read(self.member)
+
+    def _key(self):
+        return (str(self.archive_path), self.member)
+
+    def __eq__(self, other):
+        return isinstance(other, ArchiveMember) and self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __repr__(self):
+        return f"ArchiveMember({str(self.archive_path)!r}, {self.member!r})"
+
+
+class ArchiveHandles:
+    """Süreç başına açık tutulan arşiv okuyucuları (LRU, kullanım sayaçlı)
+
+    Her üye okumasında arşivin yeniden açılıp dizininin ayrıştırılmaması için
+    az sayıda okuyucu açık tutulur. Okuyucu use() bloğunda kullanılır; LRU'dan
+    düşen ya da close() ile kapatılan okuyucu, o sırada onu okuyan thread
+    bitince kapanır.
+
+    Fork ile açılan işçi süreçler ebeveynin dosya tanıtıcısını ve dosya
+    konumunu paylaşır; eşzamanlı seek/read birbirini bozar. Bu yüzden çocuk
+    süreçte devralınan okuyucular bırakılır ve her süreç kendi okuyucusunu açar.
+    """
+
+    def __init__(self, opener: Callable, limit: int = 8):
+        self.opener = opener
+        self.limit = limit
+        self._entries: "OrderedDict[Tuple[str, int], list]" = OrderedDict()
+        self._lock = threading.Lock()
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._after_fork)
+
+    def _after_fork(self):
+        # Çocukta ebeveyn thread'leri yoktur; kilit o an tutuluyor olabilir
+        self._lock = threading.Lock()
+        entries, self._entries = self._entries, OrderedDict()
+        for key, entry in entries.items():
+            if getattr(entry[0], "fork_safe", False) and not entry[2]:
+                # Konumdan okuyan (pread) okuyucular paylaşılabilir
+                self._entries[key] = [entry[0], 0, False]
+                continue
+            try:
+                entry[0].close()  # yalnızca çocuğun tanıtıcı kopyası kapanır
+            except Exception:
+                pass
+
+    def _retire(self, entry: list):
+        entry[2] = True
+        if entry[1] == 0:
+            entry[0].close()
+
+    @contextmanager
+    def use(self, archive_path: Path):
+        archive_path = Path(archive_path)
+        key = (str(archive_path), archive_path.stat().st_mtime_ns)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = [self.opener(archive_path), 0, False]  # okuyucu, kullanan, emekli
+                self._entries[key] = entry
+                if len(self._entries) > self.limit:
+                    self._retire(self._entries.popitem(last=False)[1])
+            else:
+                self._entries.move_to_end(key)
+            entry[1] += 1
+        try:
+            yield entry[0]
+        finally:
+            with self._lock:
+                entry[1] -= 1
+                if entry[2] and entry[1] == 0:
+                    entry[0].close()
+
+    def close(self, directory: Optional[Path] = None):
+        """Okuyucuları kapat (directory verilirse yalnızca altındaki arşivlerinkini)"""
+        prefix = str(Path(directory)) if directory is not None else None
+        with self._lock:
+            for key in list(self._entries):
+                if prefix is None or Path(key[0]).is_relative_to(prefix):
+                    self._retire(self._entries.pop(key))
+
+
+class SevenZipArchive:
+    """7-Zip ile tek geçişte açılmış arşiv; üyeler geçici dosyadaki konumlarından okunur
+
+    Katı (solid) 7z/RAR arşivlerinde her üyeyi ayrı bir `7z e` ile okumak
+    arşivi her seferinde o üyeye kadar yeniden açar; N kart O(N²) çözme
+    demektir. Bunun yerine `7z x -so` tüm dosyaları arşiv sırasıyla tek
+    akışta verir. Akış adsız bir geçici dosyaya yazılır ve listedeki
+    boyutlarla üyelere bölünür. Akış listeyle uyuşmazsa (ör. farklı 7-Zip
+    sürümü) üyeler tek tek `7z e` ile okunur.
+
+    Okuma os.pread ile dosya konumu kullanılmadan yapılır; fork ile açılan
+    işçiler arşivi yeniden çıkarmadan aynı dosyadan okuyabilir.
+    """
+
+    fork_safe = hasattr(os, "pread")
+
+    def __init__(self, archive_path: Path):
+        self.archive_path = Path(archive_path)
+        self._lock = threading.Lock()
+        self._file = tempfile.TemporaryFile(prefix="yakakart_7z_")
+        self._members: Optional[Dict[str, Tuple[int, int]]] = None
+        try:
+            self._extract()
+        except Exception:
+            self.close()
+            raise
+
+    def _extract(self):
+        if not seven_zip_supported():
+            raise RuntimeError("7-Zip bulunamadı")
+        entries = list_7zip_entries(self.archive_path)
+        proc = subprocess.Popen(
+            [find_7zip(), 'x', '-so', str(self.archive_path)],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            creationflags=_subprocess_flags()
+        )
+        with proc.stdout:
+            shutil.copyfileobj(proc.stdout, self._file, 1024 * 1024)
+        if proc.wait() != 0:
+            raise RuntimeError(f"7-Zip hata kodu: {proc.returncode}")
+
+        if any(size is None for _, size in entries) or \
+                sum(size for _, size in entries) != self._file.tell():
+            return  # akış bölünemiyor; read() üyeleri tek tek okur
+        members, offset = {}, 0
+        for path, size in entries:
+            members[path] = (offset, size)
+            offset += size
+        self._members = members
+
+    def read(self, member: str) -> bytes:
+        if self._members is None or member not in self._members:
+            return read_with_7zip(self.archive_path, member)
+        offset, size = self._members[member]
+        if self.fork_safe:
+            data = os.pread(self._file.fileno(), size, offset)
+        else:
+            with self._lock:
+                self._file.seek(offset)
+                data = self._file.read(size)
+        if len(data) != size:
+            raise RuntimeError(f"7-Zip ile okuma hatası ({member}): eksik veri")
+        return data
+
+    def close(self):
+        self._file.close()
+
+
+_ZIP_HANDLES = ArchiveHandles(lambda archive_path: zipfile.ZipFile(archive_path, 'r'))
+_SEVEN_ZIP_ARCHIVES = ArchiveHandles(SevenZipArchive)
+
+
+def prepare_archive_reads(sources: list):
+    """İşçi süreçler fork ile açılacaksa 7-Zip arşivlerini önce ebeveynde bir kez çıkar
+
+    Çıkarılmış arşiv fork'ta devralınır; işçilerin her biri arşivi yeniden
+    çıkarmaz. Diğer başlatma yöntemlerinde her işçi arşivi bir kez çıkarır.
+    """
+    if not SevenZipArchive.fork_safe or multiprocessing.get_context().get_start_method() != "fork":
+        return
+    archives = {source.archive_path for source in sources
+                if isinstance(source, ArchiveMember) and source.kind == '7z'}
+    for archive_path in list(archives)[:_SEVEN_ZIP_ARCHIVES.limit]:
+        try:
+            with _SEVEN_ZIP_ARCHIVES.use(archive_path):
+                pass
+        except Exception:
+            pass  # hata, kartın okunduğu yerde raporlanır
+
+
+def close_archive_handles(directory: Optional[Path] = None):
+    """Açık tutulan arşiv okuyucularını kapat (directory verilirse yalnızca altındakileri)
+
+    Geçici klasördeki arşivler silinmeden önce çağrılır; Windows'ta açık
+    dosya silinemez.
+    """
+    _ZIP_HANDLES.close(directory)
+    _SEVEN_ZIP_ARCHIVES.close(directory)
+
+
+def source_label(source) -> str:
+    """Dosya listesi ve loglar için kaynak adı"""
+    return source.label if isinstance(source, ArchiveMember) else source.name
+
+
+def read_pdf_bytes(source) -> bytes:
+    """Kaynağın (dosya yolu veya arşiv üyesi) içeriğini oku"""
+    if isinstance(source, ArchiveMember):
+        return source.read_bytes()
+    return Path(source).read_bytes()
+
+
+def open_pdf(source, data: Optional[bytes] = None):
+    """Kaynağı PyMuPDF belgesi olarak aç (arşiv üyeleri bellekten açılır)"""
+    if data is None and not isinstance(source, ArchiveMember):
+        return fitz.open(str(source))
+    if data is None:
+        data = source.read_bytes()
+    return fitz.open(stream=data, filetype="pdf")
+
+
+def _subprocess_flags() -> int:
+    return subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
+
+
+def list_7zip_entries(archive_path: Path) -> List[Tuple[str, Optional[int]]]:
+    """7-Zip ile arşivdeki dosyaları (yol, boyut) olarak arşiv sırasıyla listele (klasörler hariç)"""
+    result = subprocess.run(
+        [find_7zip(), 'l', '-slt', str(archive_path)],
+        capture_output=True, text=True, encoding='utf-8', errors='replace',
+        creationflags=_subprocess_flags()
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"7-Zip hata kodu: {result.returncode}")
+
+    # "----------" satırından sonra her üye boş satırla ayrılmış "Anahtar = Değer" bloğudur
+    listing = result.stdout.split('----------', 1)[-1]
+    entries = []
+    for block in listing.split('\n\n'):
+        fields = {}
+        for line in block.splitlines():
+            key, sep, value = line.partition(' = ')
+            if sep:
+                fields[key.strip()] = value
+        path = fields.get('Path', '')
+        if not path or fields.get('Folder') == '+' or fields.get('Attributes', '').startswith('D'):
+            continue
+        size = fields.get('Size', '').strip()
+        entries.append((path, int(size) if size.isdigit() else None))
+    return entries
+
+
+def list_with_7zip(archive_path: Path) -> List[ArchiveMember]:
+    """7-Zip ile arşivdeki PDF'leri listele (çıkarmadan)"""
+    return [ArchiveMember(archive_path, path, '7z')
+            for path, _ in list_7zip_entries(archive_path)
+            if path.lower().endswith('.pdf')]
+
+
+def read_with_7zip(archive_path: Path, member: str) -> bytes:
+    """7-Zip ile tek bir üyeyi stdout üzerinden belleğe oku"""
+    if not seven_zip_supported():
+        raise RuntimeError("7-Zip bulunamadı")
+
+    result = subprocess.run(
+        [find_7zip(), 'e', '-so', '-spd', str(archive_path), member],
+        capture_output=True, creationflags=_subprocess_flags()
+    )
+    if result.returncode != 0 or not result.stdout:
+        raise RuntimeError(f"7-Zip ile okuma hatası ({member}): {result.returncode}")
+    return result.stdout
+
+
+def list_with_zipfile(archive_path: Path) -> List[ArchiveMember]:
+    """Python zipfile ile ZIP içindeki PDF'leri listele"""
+    with _ZIP_HANDLES.use(archive_path) as zip_ref:
+        return [
+            ArchiveMember(archive_path, info.filename, 'zip')
+            for info in zip_ref.infolist()
+            if not info.is_dir() and info.filename.lower().endswith('.pdf')
+        ]
+
+
+def list_with_rarfile(archive_path: Path) -> List[ArchiveMember]:
+    """rarfile ile RAR içindeki PDF'leri listele"""
+    if not rar_supported():
+        raise RuntimeError("rarfile modülü yüklü değil")
+
+    with rarfile.RarFile(archive_path, 'r') as rar_ref:
+        return [
+            ArchiveMember(archive_path, info.filename, 'rar')
+            for info in rar_ref.infolist()
+            if not info.is_dir() and info.filename.lower().endswith('.pdf')
+        ]
+
+
+def list_archive_members(archive_path: Path) -> List[ArchiveMember]:
+    """Arşivdeki PDF'leri çıkarmadan, girdi olarak kullanılabilir üyeler halinde listele"""
+    archive_path = Path(archive_path)
+    suffix = archive_path.suffix.lower()
+
+    try:
+        if suffix == '.zip':
+            return list_with_zipfile(archive_path)
+
+        elif suffix == '.rar':
+            if rar_supported():
+                return list_with_rarfile(archive_path)
+            if seven_zip_supported():
+                return list_with_7zip(archive_path)
+            raise RuntimeError("RAR desteği yok! 7-Zip kurun.")
+
+        elif suffix == '.7z':
+            if seven_zip_supported():
+                return list_with_7zip(archive_path)
+            raise RuntimeError("7Z desteği yok! 7-Zip kurun.")
+
+        else:
+            raise ValueError(f"Desteklenmeyen format: {archive_path.suffix}")
+
+    except Exception as e:
+        raise RuntimeError(f"{archive_path.name} okunurken hata: {str(e)}")
+
+
+# Aynı anda listelenecek en fazla arşiv (7-Zip alt süreci / zip-rar okuyucusu)
+ARCHIVE_WORKERS = 4
+
+
+def iter_archive_members(archive_paths: List[Path], workers: int = ARCHIVE_WORKERS,
+                         stage_times: Optional[StageTimes] = None):
+    """Arşivleri paralel listele, sonuçları verilen sırayla döndür
+
+    Her eleman (arşiv, üyeler, None) ya da hata durumunda (arşiv, None, hata)
+    olur. Her arşiv yalnızca kendi PDF'lerini raporlar.
+    """
+    archive_paths = [Path(p) for p in archive_paths]
+
+    def list_members(archive_path: Path) -> List[ArchiveMember]:
+        with measure(stage_times, "archive", file=archive_path.name):
+            return list_archive_members(archive_path)
+
+    if workers <= 1 or len(archive_paths) <= 1:
+        for archive_path in archive_paths:
+            try:
+                yield archive_path, list_members(archive_path), None
+            except Exception as e:
+                yield archive_path, None, e
+        return
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(archive_paths))) as executor:
+        futures = [(archive_path, executor.submit(list_members, archive_path))
+                   for archive_path in archive_paths]
+        for archive_path, future in futures:
+            try:
+                yield archive_path, future.result(), None
+            except Exception as e:
+                yield archive_path, None, e
+
+
+# ================== RENDER ÖNBELLEĞİ ==================
+
+# Önbellek biçimi değişirse eski kayıtların kullanılmaması için artırılır
+RENDER_CACHE_VERSION = 1
+
+
+def file_digest(path: Path) -> str:
+    """Dosya içeriğinin SHA-256 özetini al"""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def bytes_digest(data: bytes) -> str:
+    """Bellekteki içeriğin SHA-256 özetini al (file_digest ile aynı değer)"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def _tmp_tag() -> str:
+    """Geçici dosya eki; aynı süreçte eşzamanlı çalışan işler de çakışmaz"""
+    return f"{os.getpid()}.{threading.get_ident()}"
+
+
+class RenderCache:
+    """Render edilmiş ve kodlanmış sayfa görüntüleri için disk önbelleği
+
+    Kayıtlar PDF içerik özeti, sayfa, DPI ve döndürme açısıyla anahtarlanır;
+    dosya adı veya sırası değişse de aynı kart yeniden render edilmez.
+    Boyut sınırı aşıldığında en uzun süredir kullanılmayan kayıtlar silinir.
+    """
+
+    def __init__(self, directory: Path = RENDER_CACHE_DIR, max_mb: int = 512):
+        self.directory = Path(directory)
+        self.max_bytes = max_mb * 1024 * 1024
+
+    @staticmethod
+    def make_key(file_hash: str, page_index: int, dpi, rotation: int, variant: str = "png") -> str:
+        """Önbellek anahtarını oluştur"""
+        raw = f"v{RENDER_CACHE_VERSION}:{file_hash}:{page_index}:{dpi}:{rotation}:{variant}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.bin"
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Kaydı oku (yoksa None)"""
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+            os.utime(path)  # LRU için son kullanım zamanı
+            return data
+        except OSError:
+            return None
+
+    def put(self, key: str, data: bytes):
+        """Kaydı yaz (yarım kalmış dosya bırakmamak için önce geçici dosyaya)"""
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{_tmp_tag()}.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+    def prune(self) -> int:
+        """Boyut sınırını aşan eski kayıtları sil, silinen kayıt sayısını döndür"""
+        if not self.directory.exists():
+            return 0
+
+        entries = []
+        total = 0
+        for path in self.directory.glob("*/*.bin"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+            total += st.st_size
+
+        removed = 0
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+                total -= size
+                removed += 1
+            except OSError:
+                pass
+        return removed
+
+    def clear(self):
+        """Önbelleği tamamen temizle"""
+        if self.directory.exists():
+            shutil.rmtree(self.directory, ignore_errors=True)
+
+
+def create_render_cache(config: Dict[str, Any]) -> Optional[RenderCache]:
+    """Ayarlara göre önbelleği oluştur (kapalıysa None)"""
+    max_mb = int(config.get("render_cache_mb", 0) or 0)
+    if max_mb <= 0:
+        return None
+    return RenderCache(RENDER_CACHE_DIR, max_mb)
+
+
+# ================== ARTIMLI ÜRETİM ==================
+
+class GenerationCancelled(Exception):
+    """Üretim kullanıcı tarafından iptal edildi"""
+
+
+class NoValidCardsError(RuntimeError):
+    """Girdilerin hiçbiri okunup render edilemedi"""
+
+
+def check_cancelled(cancel_event: Optional[threading.Event]):
+    if cancel_event is not None and cancel_event.is_set():
+        raise GenerationCancelled("İşlem iptal edildi")
+
+
+# Sayfa grubu paketinin biçimi değişirse eski paketlerin kullanılmaması için artırılır
+SHEET_CACHE_VERSION = 1
+
+
+class DigestIndex:
+    """Dosya boyutu/değişiklik zamanına göre içerik özeti belleği
+
+    Boyutu ve mtime'ı değişmemiş bir PDF yeniden okunmadan önceki özetiyle
+    tanınır. Kayıtlar önbellek klasöründe digests.json olarak saklanır.
+    """
+
+    FILE_NAME = "digests.json"
+    MAX_ENTRIES = 20000
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.entries: Dict[str, list] = {}
+        self.dirty = False
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            pass
+
+    @classmethod
+    def for_cache(cls, cache: RenderCache) -> "DigestIndex":
+        return cls(cache.directory / cls.FILE_NAME)
+
+    @staticmethod
+    def _stat_key(source) -> Tuple[str, list]:
+        """Kaynağın anahtarı ve [boyut, mtime_ns] imzası (arşiv üyelerinde arşivin imzası)"""
+        if isinstance(source, ArchiveMember):
+            st = source.archive_path.stat()
+            return f"{source.archive_path}::{source.member}", [st.st_size, st.st_mtime_ns]
+        st = Path(source).stat()
+        return str(source), [st.st_size, st.st_mtime_ns]
+
+    def digest(self, source) -> Optional[str]:
+        """Kaynağın SHA-256 özeti; imza değişmediyse dosya okunmaz, okunamazsa None
+
+        Bozuk arşiv üyeleri (BadZipFile, 7-Zip hataları vb.) de None döndürür;
+        grup yeniden kullanılamaz sayılır, hata kart render edilirken raporlanır.
+        """
+        try:
+            key, signature = self._stat_key(source)
+            entry = self.entries.get(key)
+            if entry is not None and entry[:2] == signature:
+                return entry[2]
+
+            digest = bytes_digest(read_pdf_bytes(source))
+        except Exception:
+            return None
+
+        self.entries.pop(key, None)
+        self.entries[key] = signature + [digest]
+        self.dirty = True
+        return digest
+
+    def save(self):
+        if not self.dirty:
+            return
+        # En eski kayıtlar (ekleme sırasına göre) atılır
+        overflow = len(self.entries) - self.MAX_ENTRIES
+        if overflow > 0:
+            for key in list(itertools.islice(self.entries, overflow)):
+                del self.entries[key]
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f"{self.path.name}.{_tmp_tag()}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f)
+            os.replace(tmp_path, self.path)
+            self.dirty = False
+        except OSError:
+            pass
+
+
+def sheet_group_key(digests: List[Optional[str]], dpi: int, card_height_cm: float,
+                    codec: Optional[Dict[str, Any]], layout_tag: str = "") -> Optional[str]:
+    """Bir ön/arka sayfa çiftinin anahtarı: sıralı girdi özetleri + render ayarları
+
+    Kenar boşlukları ve sütun düzeni anahtarda yoktur; paket yalnızca kodlanmış
+    görüntüleri tutar, sayfa düzeni her çalıştırmada yeniden kurulur.
+    layout_tag görüntüleri değiştiren yerleşim farkını (ör. döndürme) ayırır.
+    """
+    if not digests or any(d is None for d in digests):
+        return None
+    raw = (f"sheet-v{SHEET_CACHE_VERSION}:{dpi}:{card_height_cm}:{codec_variant(codec)}:"
+           + (f"{layout_tag}:" if layout_tag else "")
+           + ",".join(digests))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def pack_sheet_group(cards: List[Tuple[bytes, bytes]]) -> bytes:
+    """Grubun kodlanmış ön/arka görüntülerini tek kayıtta birleştir"""
+    header = json.dumps([[len(front), len(back)] for front, back in cards]).encode("ascii")
+    return len(header).to_bytes(4, "big") + header + b"".join(front + back for front, back in cards)
+
+
+def unpack_sheet_group(data: bytes) -> List[Tuple[bytes, bytes]]:
+    """pack_sheet_group ile birleştirilen kaydı ayır"""
+    header_len = int.from_bytes(data[:4], "big")
+    offset = 4 + header_len
+    cards = []
+    for front_len, back_len in json.loads(data[4:offset]):
+        front = data[offset:offset + front_len]
+        offset += front_len
+        back = data[offset:offset + back_len]
+        offset += back_len
+        cards.append((front, back))
+    if offset != len(data):
+        raise ValueError("Bozuk sayfa grubu kaydı")
+    return cards
+
+
+# ================== PDF İŞLEME FONKSİYONLARI ==================
+
+def pixmap_to_image(pix) -> Image.Image:
+    """RGB (alpha=False) PyMuPDF pixmap'ini PIL görüntüsüne çevir
+
+    Pikseller samples_mv bellek görünümünden tek kopyayla okunur; pix.samples'ın
+    oluşturduğu ara bytes kopyası yoktur.
+    """
+    return Image.frombuffer("RGB", (pix.width, pix.height), pix.samples_mv,
+                            "raw", "RGB", pix.stride, 1)
+
+
+def pdf_to_front_back(pdf_path: Path, dpi: int = 300) -> Tuple[Image.Image, Image.Image]:
+    """PDF'den ön ve arka görüntüleri al"""
+    doc = open_pdf(pdf_path)
+    if len(doc) < 2:
+        doc.close()
+        raise ValueError(f"{source_label(pdf_path)} içinde 2 sayfa yok.")
+
+    zoom = dpi / 72
+    mat = fitz.Matrix(zoom, zoom)
+
+    def page_to_image(page):
+        return pixmap_to_image(page.get_pixmap(matrix=mat, alpha=False))
+
+    front = page_to_image(doc[0])
+    back = page_to_image(doc[1])
+    doc.close()
+    return front, back
+
+
+# Arayüzde sunulan render çözünürlükleri
+DPI_CHOICES = (150, 200, 250, 300, 350, 400)
+
+# Sayfadaki döndürme açıları (long-edge dupleks için ön 90°, arka 270°)
+FRONT_ROTATION = 90
+BACK_ROTATION = 270
+
+
+# ================== OTOMATİK DPI ==================
+
+# render_dpi yerine verilirse çözünürlük her sayfa için içeriğe ve yazıcıya göre seçilir
+AUTO_DPI = "auto"
+PRINTER_DPI_CHOICES = (300, 600, 1200)
+DEFAULT_PRINTER_DPI = 600
+
+# Kenar yumuşatmalı metin/çizgide ve tramlı (~150 lpi) fotoğraf baskısında
+# bu çözünürlüğün üstündeki pikseller baskıda ayırt edilmez
+AUTO_DPI_VECTOR = 300
+AUTO_DPI_PHOTO = 300
+# Düşük çözünürlüklü gömülü görüntülerde bile bunun altına inilmez
+AUTO_DPI_MIN = DPI_CHOICES[0]
+# Kazanılan pikseller "garanti olsun" diye seçilen en yüksek DPI'ya göre raporlanır
+AUTO_DPI_BASELINE = DPI_CHOICES[-1]
+
+
+def parse_render_dpi(value) -> Union[int, str]:
+    """Ayar/komut satırı değerini render DPI'ına çevir: sayı ya da AUTO_DPI"""
+    if str(value).strip().lower() == AUTO_DPI:
+        return AUTO_DPI
+    return int(value)
+
+
+def page_content_dpi(page, rotation: int, card_height_cm: Optional[float],
+                     printer_dpi: int) -> Tuple[int, str]:
+    """Sayfanın tam baskı kalitesi için gereken en düşük DPI'ı ve içerik türünü bul
+
+    Metin ve vektörel çizimler yazıcı çözünürlüğüyle (en fazla AUTO_DPI_VECTOR),
+    gömülü görüntüler baskı boyutundaki kendi çözünürlükleriyle (en fazla
+    AUTO_DPI_PHOTO) sınırlanır. İçerik türü: vector, photo, mixed ya da empty.
+    """
+    side_pt = page.rect.width if rotation % 180 else page.rect.height
+    inch_per_pt = card_height_cm / 2.54 / side_pt if card_height_cm else 1 / 72
+
+    vector = bool(page.get_text("text").strip()) or bool(page.get_cdrawings())
+    photo_ppi = 0.0
+    for info in page.get_image_info():
+        bbox = fitz.Rect(info["bbox"])
+        if bbox.is_empty or not bbox.intersects(page.rect):
+            continue
+        # Alan üzerinden: sayfada döndürülerek yerleştirilmiş görüntülerde de doğru
+        printed_in2 = bbox.width * bbox.height * inch_per_pt ** 2
+        photo_ppi = max(photo_ppi, math.sqrt(info["width"] * info["height"] / printed_in2))
+
+    needed = 0
+    if vector:
+        needed = min(printer_dpi, AUTO_DPI_VECTOR)
+    if photo_ppi:
+        needed = max(needed, min(math.ceil(photo_ppi), printer_dpi, AUTO_DPI_PHOTO))
+
+    if vector and photo_ppi:
+        content = "mixed"
+    elif vector:
+        content = "vector"
+    else:
+        content = "photo" if photo_ppi else "empty"
+    return max(AUTO_DPI_MIN, needed), content
+
+
+class AutoDpi:
+    """Otomatik DPI ayarı; render aşamasında sayfa başına page_content_dpi ile çözülür
+
+    Önbellek anahtarlarında str() ile ("auto600") kullanılır. Seçim yalnızca PDF
+    içeriğine, kart yüksekliğine ve yazıcı DPI'ına bağlı olduğundan aynı anahtar
+    her zaman aynı render'ı verir.
+    """
+
+    def __init__(self, printer_dpi: int = DEFAULT_PRINTER_DPI):
+        self.printer_dpi = int(printer_dpi)
+
+    def __str__(self):
+        return f"{AUTO_DPI}{self.printer_dpi}"
+
+    __repr__ = __str__
+
+    def for_page(self, page, rotation: int, card_height_cm: Optional[float]) -> Tuple[int, str]:
+        return page_content_dpi(page, rotation, card_height_cm, self.printer_dpi)
+
+
+def resolve_render_dpi(render_dpi, printer_dpi: int = DEFAULT_PRINTER_DPI) -> Union[int, AutoDpi]:
+    """render_dpi ayarını render fonksiyonlarının beklediği değere çevir"""
+    if isinstance(render_dpi, AutoDpi):
+        return render_dpi
+    render_dpi = parse_render_dpi(render_dpi)
+    return AutoDpi(printer_dpi) if render_dpi == AUTO_DPI else render_dpi
+
+
+# ================== GÖRÜNTÜ KODLAMA ==================
+
+IMAGE_FORMATS = ("png", "jpeg", "auto")
+JPEG_SUBSAMPLINGS = ("4:4:4", "4:2:2", "4:2:0")
+
+# png: kayıpsız; jpeg: fotoğraf için küçük ve hızlı; auto: içeriğe göre seçer
+DEFAULT_CODEC = {
+    "image_format": "png",
+    "png_compress_level": 6,
+    "jpeg_quality": 90,
+    "jpeg_subsampling": "4:2:0",
+}
+
+# auto modu: küçültülmüş görüntüde en sık 32 renk dışında kalan piksel oranı
+# bu değeri aşarsa görüntü fotoğraf sayılır (düz grafik/metin az renklidir)
+PHOTO_PIXEL_RATIO = 0.3
+
+
+def codec_from_settings(settings: Dict[str, Any]) -> Dict[str, Any]:
+    """Profil/ayar sözlüğünden kodlama ayarlarını al"""
+    codec = {key: settings.get(key, value) for key, value in DEFAULT_CODEC.items()}
+    if codec["image_format"] not in IMAGE_FORMATS:
+        raise ValueError(f"Desteklenmeyen görüntü biçimi: {codec['image_format']}")
+    if codec["jpeg_subsampling"] not in JPEG_SUBSAMPLINGS:
+        raise ValueError(f"Desteklenmeyen JPEG alt örnekleme: {codec['jpeg_subsampling']}")
+    codec["png_compress_level"] = min(9, max(0, int(codec["png_compress_level"])))
+    codec["jpeg_quality"] = min(100, max(1, int(codec["jpeg_quality"])))
+    return codec
+
+
+def codec_variant(codec: Optional[Dict[str, Any]]) -> str:
+    """Kodlama ayarlarının önbellek anahtarında kullanılan kısa gösterimi"""
+    codec = codec or DEFAULT_CODEC
+    png = f"png{codec['png_compress_level']}"
+    jpeg = f"jpeg{codec['jpeg_quality']}-{codec['jpeg_subsampling'].replace(':', '')}"
+    if codec["image_format"] == "png":
+        return png
+    if codec["image_format"] == "jpeg":
+        return jpeg
+    return f"auto-{png}-{jpeg}"
+
+
+def looks_like_photo(img: Image.Image) -> bool:
+    """Görüntü fotoğraf mı (çok renkli), düz grafik/metin mi?"""
+    if img.mode != "RGB":
+        img = img.convert("RGB")
+    small = img.resize((128, 128), Image.Resampling.NEAREST)
+    counts = sorted((count for count, _ in small.getcolors(128 * 128)), reverse=True)
+    dominant = sum(counts[:32])
+    return 1 - dominant / (128 * 128) > PHOTO_PIXEL_RATIO
+
+
+def encode_image(img: Image.Image, codec: Optional[Dict[str, Any]] = None) -> Tuple[bytes, str]:
+    """Görüntüyü seçili biçimde kodla, (veri, biçim) döndür"""
+    codec = codec or DEFAULT_CODEC
+    fmt = codec["image_format"]
+    if fmt == "auto":
+        fmt = "jpeg" if looks_like_photo(img) else "png"
+
+    buf = BytesIO()
+    if fmt == "jpeg":
+        if img.mode != "RGB":
+            img = img.convert("RGB")
+        img.save(buf, format="JPEG", quality=codec["jpeg_quality"],
+                 subsampling=codec["jpeg_subsampling"], optimize=False)
+    else:
+        img.save(buf, format="PNG", compress_level=codec["png_compress_level"])
+    return buf.getvalue(), fmt
+
+
+class EncodeStats:
+    """Görüntü başına kodlama süresi ve boyut kayıtları (ayarları karşılaştırmak için)"""
+
+    def __init__(self):
+        self.records: List[Dict[str, Any]] = []
+        # Otomatik DPI'da render edilen her yüz için seçilen DPI ve piksel sayıları
+        self.dpi_records: List[Dict[str, Any]] = []
+
+    def extend(self, records: List[Dict[str, Any]]):
+        self.records.extend(records)
+
+    def extend_dpi(self, records: List[Dict[str, Any]]):
+        self.dpi_records.extend(records)
+
+    def auto_dpi(self) -> Optional[Dict[str, Any]]:
+        """Otomatik DPI özeti (içerik türüne göre sayfa/ortalama DPI ve kazanılan pikseller)"""
+        if not self.dpi_records:
+            return None
+        by_content = {}
+        for record in self.dpi_records:
+            entry = by_content.setdefault(record["content"], {"pages": 0, "dpi": 0})
+            entry["pages"] += 1
+            entry["dpi"] += record["dpi"]
+        for entry in by_content.values():
+            entry["dpi"] = round(entry["dpi"] / entry["pages"])
+
+        pixels = sum(record["pixels"] for record in self.dpi_records)
+        baseline = sum(record["baseline_pixels"] for record in self.dpi_records)
+        return {
+            "baseline_dpi": AUTO_DPI_BASELINE,
+            "by_content": by_content,
+            "pixels": pixels,
+            "baseline_pixels": baseline,
+            "pixels_saved": baseline - pixels,
+            "saved_ratio": round(1 - pixels / baseline, 3) if baseline else 0.0,
+        }
+
+    def by_format(self) -> Dict[str, Dict[str, Any]]:
+        """Biçim bazında toplamlar"""
+        totals = {}
+        for record in self.records:
+            entry = totals.setdefault(record["format"], {"images": 0, "seconds": 0.0, "bytes": 0})
+            entry["images"] += 1
+            entry["seconds"] += record["seconds"]
+            entry["bytes"] += record["bytes"]
+        return totals
+
+    def summary(self) -> str:
+        """Log için tek satırlık özet"""
+        if not self.records:
+            return "Kodlama yapılmadı (tüm görüntüler önbellekten)"
+        parts = []
+        for fmt, entry in sorted(self.by_format().items()):
+            avg_ms = entry["seconds"] / entry["images"] * 1000
+            parts.append(f"{fmt}: {entry['images']} görüntü, ort. {avg_ms:.0f} ms, "
+                         f"{entry['bytes'] / 1024 / 1024:.1f} MB")
+        text = "Kodlama → " + " | ".join(parts)
+
+        auto = self.auto_dpi()
+        if auto:
+            pages = ", ".join(f"{content} {entry['pages']} yüz @ {entry['dpi']} DPI"
+                              for content, entry in sorted(auto["by_content"].items()))
+            text += (f" | Otomatik DPI: {pages}; {auto['baseline_dpi']} DPI'ya göre "
+                     f"{auto['pixels_saved'] / 1e6:.1f} MP (%{auto['saved_ratio'] * 100:.0f}) daha az piksel")
+        return text
+
+
+# Süreç içi kodlama belleği: aynı piksellere sahip görüntüler (çoğunlukla ortak
+# arka yüz) her işçi süreçte yalnızca bir kez döndürülüp kodlanır.
+_ENCODED_BY_PIXELS: "OrderedDict[str, bytes]" = OrderedDict()
+_ENCODED_BY_PIXELS_LIMIT = 16
+
+
+def _pixels_digest(mode: str, size: Tuple[int, int], rotation: int,
+                   codec: Optional[Dict[str, Any]], pixels) -> str:
+    """Kodlama belleği anahtarı; pixels bytes ya da bellek görünümü olabilir"""
+    h = hashlib.blake2b(digest_size=20)
+    h.update(f"{mode}:{size}:{rotation}:{codec_variant(codec)}:".encode("ascii"))
+    h.update(pixels)
+    return h.hexdigest()
+
+
+def _remembered_encoding(digest: str) -> Optional[bytes]:
+    data = _ENCODED_BY_PIXELS.get(digest)
+    if data is not None:
+        _ENCODED_BY_PIXELS.move_to_end(digest)
+    return data
+
+
+def encode_rotated(img: Image.Image, rotation: int, codec: Optional[Dict[str, Any]] = None,
+                   encode_log: Optional[list] = None, label: str = "",
+                   digest: Optional[str] = None) -> bytes:
+    """Görüntüyü döndürüp kodla; aynı pikseller için önceki sonucu kullan
+
+    encode_log verilirse gerçekten yapılan her kodlama için süre ve boyut kaydı eklenir.
+    digest, piksellerin özeti önceden biliniyorsa (encode_pixmap) verilir.
+    """
+    if digest is None:
+        digest = _pixels_digest(img.mode, img.size, rotation, codec, img.tobytes())
+    data = _remembered_encoding(digest)
+    if data is not None:
+        return data
+
+    rotated = img.rotate(rotation, expand=True) if rotation else img
+    started = time.perf_counter()
+    data, fmt = encode_image(rotated, codec)
+    if encode_log is not None:
+        encode_log.append({
+            "file": label,
+            "rotation": rotation,
+            "format": fmt,
+            "width": rotated.width,
+            "height": rotated.height,
+            "seconds": round(time.perf_counter() - started, 4),
+            "bytes": len(data),
+        })
+    _ENCODED_BY_PIXELS[digest] = data
+    if len(_ENCODED_BY_PIXELS) > _ENCODED_BY_PIXELS_LIMIT:
+        _ENCODED_BY_PIXELS.popitem(last=False)
+    return data
+
+
+def render_pixmap_rotated(page, rotation: int, dpi: int, card_height_cm: Optional[float] = None):
+    """Sayfayı döndürülmüş olarak ve baskı boyutunda tek adımda render et (RGB pixmap)
+
+    Döndürme PyMuPDF matrisine katılır (PIL rotate ile aynı yön), ayrı bir
+    döndürme kopyası oluşmaz. card_height_cm verilirse yakınlaştırma,
+    döndürülmüş görüntünün yüksekliği seçili DPI'da tam card_height_cm olacak
+    şekilde hesaplanır; Word'ün zaten küçülteceği fazla pikseller render edilmez.
+    """
+    if card_height_cm:
+        target_px = card_height_cm / 2.54 * dpi
+        side_pt = page.rect.width if rotation % 180 else page.rect.height
+        zoom = target_px / side_pt
+    else:
+        zoom = dpi / 72
+
+    mat = fitz.Matrix(zoom, zoom).prerotate(-rotation)
+    return page.get_pixmap(matrix=mat, alpha=False)
+
+
+def render_page_rotated(page, rotation: int, dpi: int,
+                        card_height_cm: Optional[float] = None) -> Image.Image:
+    """render_pixmap_rotated'in PIL görüntüsü döndüren biçimi"""
+    return pixmap_to_image(render_pixmap_rotated(page, rotation, dpi, card_height_cm))
+
+
+def encode_pixmap(pix, codec: Optional[Dict[str, Any]] = None,
+                  encode_log: Optional[list] = None, label: str = "") -> bytes:
+    """Render edilmiş pixmap'i kodla; PIL görüntüsü yalnızca gerçekten kodlanacaksa oluşur
+
+    Kodlama belleği anahtarı pixmap belleği üzerinden kopyasız hesaplanır
+    (encode_rotated ile aynı anahtar); ortak arka yüz gibi daha önce kodlanmış
+    görüntülerde PIL'e hiç geçilmez. Aksi halde pikseller tek kopyayla PIL'e
+    aktarılır ve kodlanır; böylece her kart yüzü için pixmap dışında en fazla
+    bir raster ayrılır.
+    """
+    size = (pix.width, pix.height)
+    digest = _pixels_digest("RGB", size, 0, codec, pix.samples_mv)
+    data = _remembered_encoding(digest)
+    if data is not None:
+        return data
+    return encode_rotated(pixmap_to_image(pix), 0, codec, encode_log, label, digest)
+
+
+def render_card_sides(pdf_path: Path, dpi: Union[int, AutoDpi] = 300,
+                      cache: Optional[RenderCache] = None,
+                      codec: Optional[Dict[str, Any]] = None,
+                      encode_log: Optional[list] = None,
+                      card_height_cm: Optional[float] = None,
+                      stage_times: Optional[StageTimes] = None,
+                      dpi_log: Optional[list] = None,
+                      rotations: Tuple[int, int] = (FRONT_ROTATION, BACK_ROTATION)) -> Tuple[bytes, bytes]:
+    """Kartın ön ve arka yüzünü sayfaya yerleşecek şekilde döndürülmüş ve kodlanmış al
+
+    Önbellek verilmişse önce orada aranır; yalnızca eksik yüzler render edilip yazılır.
+    PDF (dosya ya da arşiv üyesi) bir kez belleğe okunur; özet ve render aynı
+    baytlardan yapılır. dpi AutoDpi ise her sayfa kendi içeriğine göre seçilen
+    DPI'da render edilir ve dpi_log'a seçim kaydı eklenir. rotations ön ve
+    arka yüzün döndürme açılarıdır (bkz. SheetLayout.rotations).
+    """
+    keys = [None, None]
+    sides = [None, None]
+    label = source_label(pdf_path)
+    with measure(stage_times, "read", file=label):
+        data = read_pdf_bytes(pdf_path)
+
+    if cache is not None:
+        with measure(stage_times, "cache", file=label):
+            digest = bytes_digest(data)
+            size_key = f"{dpi}@{card_height_cm}cm" if card_height_cm else dpi
+            for page_index, rotation in enumerate(rotations):
+                keys[page_index] = cache.make_key(digest, page_index, size_key, rotation,
+                                                  codec_variant(codec))
+                sides[page_index] = cache.get(keys[page_index])
+        if all(sides):
+            return sides[0], sides[1]
+
+    with measure(stage_times, "open", file=label):
+        doc = open_pdf(pdf_path, data)
+    try:
+        if len(doc) < 2:
+            raise ValueError(f"{label} içinde 2 sayfa yok.")
+
+        for page_index, rotation in enumerate(rotations):
+            if sides[page_index] is None:
+                page = doc[page_index]
+                page_dpi = dpi
+                if isinstance(dpi, AutoDpi):
+                    with measure(stage_times, "auto_dpi", file=label, page=page_index):
+                        page_dpi, content = dpi.for_page(page, rotation, card_height_cm)
+                # Döndürme render matrisinde yapılır; ayrı bir döndürme aşaması yoktur
+                with measure(stage_times, "render", file=label, page=page_index):
+                    pix = render_pixmap_rotated(page, rotation, page_dpi, card_height_cm)
+                if isinstance(dpi, AutoDpi) and dpi_log is not None:
+                    pixels = pix.width * pix.height
+                    dpi_log.append({
+                        "file": label,
+                        "page": page_index,
+                        "content": content,
+                        "dpi": page_dpi,
+                        "pixels": pixels,
+                        "baseline_pixels": round(pixels * (AUTO_DPI_BASELINE / page_dpi) ** 2),
+                    })
+                with measure(stage_times, "encode", file=label, page=page_index):
+                    sides[page_index] = encode_pixmap(pix, codec, encode_log, label)
+                del pix
+                if cache is not None:
+                    with measure(stage_times, "cache", file=label):
+                        cache.put(keys[page_index], sides[page_index])
+    finally:
+        doc.close()
+
+    return sides[0], sides[1]
+
+
+def get_card_thumbnails(pdf_path: Path, max_size: Tuple[int, int] = (180, 120),
+                        cache: Optional[RenderCache] = None) -> Tuple[Image.Image, Image.Image]:
+    """Önizleme için ön ve arka yüz küçük resimlerini al (önbellekli)"""
+    variant = f"thumb{max_size[0]}x{max_size[1]}"
+    keys = [None, None]
+    data = read_pdf_bytes(pdf_path)
+
+    if cache is not None:
+        digest = bytes_digest(data)
+        keys = [cache.make_key(digest, page_index, 22, 0, variant) for page_index in (0, 1)]
+        cached = [cache.get(key) for key in keys]
+        if all(cached):
+            thumbnails = tuple(Image.open(BytesIO(data)) for data in cached)
+            for img in thumbnails:
+                img.load()  # çözme işi çağıran (arka plan) thread'de yapılsın
+            return thumbnails
+
+    doc = open_pdf(pdf_path, data)
+    try:
+        if len(doc) < 2:
+            raise ValueError(f"{source_label(pdf_path)} içinde 2 sayfa yok.")
+
+        thumbnails = []
+        for page_index in (0, 1):
+            pix = doc[page_index].get_pixmap(matrix=fitz.Matrix(0.3, 0.3), alpha=False)
+            img = pixmap_to_image(pix)
+            img.thumbnail(max_size, Image.Resampling.LANCZOS)
+            if cache is not None:
+                cache.put(keys[page_index], pil_to_stream(img).getvalue())
+            thumbnails.append(img)
+    finally:
+        doc.close()
+
+    return thumbnails[0], thumbnails[1]
+
+
+def resolve_worker_count(workers: int) -> int:
+    """İşçi sayısını belirle (0 = otomatik)"""
+    if workers and workers > 0:
+        return workers
+    return max(1, (os.cpu_count() or 2) - 1)
+
+
+def _render_card_job(pdf_path: Path, dpi: Union[int, AutoDpi], cache: Optional[RenderCache],
+                     codec: Optional[Dict[str, Any]], card_height_cm: Optional[float],
+                     trace: bool = False,
+                     rotations: Tuple[int, int] = (FRONT_ROTATION, BACK_ROTATION)):
+    """İşçi süreçte kartı render et, kodlama/DPI kayıtları ve aşama süreleriyle birlikte döndür"""
+    encode_log = []
+    dpi_log = []
+    stage_times = Tracer() if trace else StageTimes()
+    sides = render_card_sides(pdf_path, dpi, cache, codec, encode_log, card_height_cm,
+                              stage_times, dpi_log, rotations)
+    return sides, encode_log, dpi_log, stage_times
+
+
+def iter_rendered_cards(pdf_paths: List[Path], dpi: Union[int, AutoDpi] = 300, workers: int = 1,
+                        cache: Optional[RenderCache] = None,
+                        codec: Optional[Dict[str, Any]] = None,
+                        encode_stats: Optional[EncodeStats] = None,
+                        card_height_cm: Optional[float] = None,
+                        stage_times: Optional[StageTimes] = None,
+                        rotations: Tuple[int, int] = (FRONT_ROTATION, BACK_ROTATION)):
+    """PDF'leri işçi süreçlerde görüntüye çevir, sonuçları liste sırasıyla döndür
+
+    Her eleman (pdf, (ön, arka), None) ya da hata durumunda (pdf, None, hata) olur;
+    ön/arka, render_card_sides'ın döndürdüğü kodlanmış görüntülerdir.
+    PyMuPDF thread'ler arasında paylaşılamadığı için paralellik süreç havuzuyla
+    sağlanır; bellekte aynı anda en fazla workers * 2 kart bekler.
+    """
+    def unpack(result):
+        sides, encode_log, dpi_log, job_times = result
+        if encode_stats is not None:
+            encode_stats.extend(encode_log)
+            encode_stats.extend_dpi(dpi_log)
+        if stage_times is not None:
+            stage_times.merge(job_times)
+        return sides
+
+    trace = isinstance(stage_times, Tracer)
+    if workers <= 1 or len(pdf_paths) <= 1:
+        for pdf in pdf_paths:
+            try:
+                yield pdf, unpack(_render_card_job(pdf, dpi, cache, codec, card_height_cm,
+                                                   trace, rotations)), None
+            except Exception as e:
+                yield pdf, None, e
+        return
+
+    workers = min(workers, len(pdf_paths))
+    prepare_archive_reads(pdf_paths)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        remaining = iter(pdf_paths)
+        pending = deque(
+            (pdf, executor.submit(_render_card_job, pdf, dpi, cache, codec, card_height_cm, trace,
+                                  rotations))
+            for pdf in itertools.islice(remaining, workers * 2)
+        )
+
+        try:
+            while pending:
+                pdf, future = pending.popleft()
+                for next_pdf in itertools.islice(remaining, 1):
+                    pending.append((next_pdf, executor.submit(_render_card_job, next_pdf, dpi,
+                                                              cache, codec, card_height_cm, trace,
+                                                              rotations)))
+                try:
+                    yield pdf, unpack(future.result()), None
+                except Exception as e:
+                    yield pdf, None, e
+        finally:
+            # Erken kapatılırsa (iptal) henüz başlamamış işler beklenmez
+            for _, future in pending:
+                future.cancel()
+
+
+def get_pdf_preview(pdf_path: Path, max_size: Tuple[int, int] = (200, 150)) -> Optional[Image.Image]:
+    """PDF'in önizleme görüntüsünü al"""
+    try:
+        doc = open_pdf(pdf_path)
+        if len(doc) < 1:
+            doc.close()
+            return None
+        
+        page = doc[0]
+        pix = page.get_pixmap(matrix=fitz.Matrix(0.5, 0.5), alpha=False)
+        img = pixmap_to_image(pix)
+        doc.close()
+        
+        # Boyutlandır
+        img.thumbnail(max_size, Image.Resampling.LANCZOS)
+        return img
+    except Exception:
+        return None
+
+
+def pil_to_stream(img: Image.Image, codec: Optional[Dict[str, Any]] = None) -> BytesIO:
+    """PIL Image'ı BytesIO stream'e çevir (varsayılan: PNG)"""
+    if codec is None:
+        buf = BytesIO()
+        img.save(buf, format="PNG")
+        buf.seek(0)
+        return buf
+    return BytesIO(encode_image(img, codec)[0])
+
+
+# ================== SAYFA YERLEŞİMİ (İMPOZİSYON) ==================
+
+# A4 sayfa boyutu ve cm → PDF puanı dönüşümü
+A4_WIDTH_CM = 21.0
+A4_HEIGHT_CM = 29.7
+CM_TO_PT = 72 / 2.54
+
+# cards_per_page yerine verilirse satır × sütun ve yön kart boyutuna göre hesaplanır
+AUTO_LAYOUT = "auto"
+CARDS_PER_PAGE_CHOICES = (4, 6, 8)
+# Otomatik yerleşimin kazancı bu sabit düzene (2 sütun, sayfa başı 8) göre raporlanır
+FIXED_CARDS_PER_PAGE = 8
+
+
+def parse_cards_per_page(value) -> Union[int, str]:
+    """Ayar/komut satırı değerini sayfa başı karta çevir: sayı ya da AUTO_LAYOUT"""
+    if str(value).strip().lower() == AUTO_LAYOUT:
+        return AUTO_LAYOUT
+    return int(value)
+
+
+class SheetLayout:
+    """Bir sayfadaki kartların satır × sütun düzeni, yönü ve ön/arka konumları
+
+    Kartlar ön yüzde sol üst kenar boşluğundan başlayarak card_spacing_cm
+    aralıkla dizilir. Long-edge dupleks baskıda kâğıt dikey ekseni etrafında
+    döndüğü için arka yüz, ön yüzün yatay aynasıdır: her kart, ön yüzdeki
+    konumunun fiziksel karşılığına yerleşir. Arka yüz kenar boşlukları bu
+    aynaya göre kaydırma (yazıcı dupleks kalibrasyonu) olarak uygulanır:
+    yatayda sol arka boşluk - sağ ön boşluk, dikeyde üst arka - üst ön.
+
+    Yatay yerleşimde kart 90° döndürülür (arka yüz 270°); dikey yerleşimde
+    kart döndürülmez ve uzun kenar etrafında çevrildiği için arka yüz de 0°'dir.
+    """
+
+    def __init__(self, rows: int, cols: int, landscape: bool,
+                 card_height_cm: float, card_width_cm: float, spacing_cm: float,
+                 front_margins: Tuple, back_margins: Tuple,
+                 sheet_cm: Tuple[float, float] = (A4_WIDTH_CM, A4_HEIGHT_CM)):
+        self.rows = rows
+        self.cols = cols
+        self.landscape = landscape
+        self.spacing_cm = spacing_cm
+        self.front_margins = tuple(front_margins)
+        self.back_margins = tuple(back_margins)
+        self.sheet_cm = tuple(sheet_cm)
+        # Kartın sayfadaki kapladığı alan (genişlik, yükseklik)
+        if landscape:
+            self.slot_cm = (card_width_cm, card_height_cm)
+        else:
+            self.slot_cm = (card_height_cm, card_width_cm)
+
+    @property
+    def cards_per_sheet(self) -> int:
+        return self.rows * self.cols
+
+    @property
+    def rotations(self) -> Tuple[int, int]:
+        """(ön, arka) döndürme açıları"""
+        return (FRONT_ROTATION, BACK_ROTATION) if self.landscape else (0, 0)
+
+    @property
+    def placed_height_cm(self) -> float:
+        """Döndürülmüş kart görüntüsünün sayfadaki yüksekliği"""
+        return self.slot_cm[1]
+
+    @property
+    def orientation(self) -> str:
+        """Kartın sayfadaki görünüşü"""
+        return "yatay" if self.slot_cm[0] >= self.slot_cm[1] else "dikey"
+
+    def position(self, index: int, width_cm: float, back: bool = False) -> Tuple[float, float]:
+        """index'inci kartın sol üst köşesi (cm); width_cm kart görüntüsünün genişliği"""
+        row, col = divmod(index, self.cols)
+        x = self.front_margins[2] + col * (self.slot_cm[0] + self.spacing_cm)
+        y = self.front_margins[0] + row * (self.slot_cm[1] + self.spacing_cm)
+        if back:
+            x = self.sheet_cm[0] - x - width_cm + (self.back_margins[2] - self.front_margins[3])
+            y += self.back_margins[0] - self.front_margins[0]
+        return x, y
+
+    def describe(self) -> str:
+        return f"{self.rows} × {self.cols} {self.orientation} ({self.cards_per_sheet} kart/sayfa)"
+
+
+def plan_imposition(card_height_cm: float, card_width_cm: float,
+                    front_margins: Tuple, back_margins: Tuple, spacing_cm: float = 0.0,
+                    sheet_cm: Tuple[float, float] = (A4_WIDTH_CM, A4_HEIGHT_CM)) -> SheetLayout:
+    """Kenar boşlukları içine en çok kart sığdıran satır × sütun ve yönü bul
+
+    Eşitlikte mevcut düzenin yönü (yatay) tercih edilir.
+    """
+    usable_w = sheet_cm[0] - front_margins[2] - front_margins[3]
+    usable_h = sheet_cm[1] - front_margins[0] - front_margins[1]
+
+    best = None
+    for landscape in (True, False):
+        layout = SheetLayout(0, 0, landscape, card_height_cm, card_width_cm, spacing_cm,
+                             front_margins, back_margins, sheet_cm)
+        slot_w, slot_h = layout.slot_cm
+        # Kayan nokta: tam sığan kartlar (ör. 2 × 9,23 = 18,46) dışarıda kalmasın
+        layout.cols = max(0, int((usable_w + spacing_cm + 1e-6) // (slot_w + spacing_cm)))
+        layout.rows = max(0, int((usable_h + spacing_cm + 1e-6) // (slot_h + spacing_cm)))
+        if best is None or layout.cards_per_sheet > best.cards_per_sheet:
+            best = layout
+
+    if not best.cards_per_sheet:
+        raise ValueError("Kart, kenar boşlukları içinde sayfaya sığmıyor.")
+    return best
+
+
+def imposition_report(layout: SheetLayout, cards: int,
+                      fixed_cards_per_page: int = FIXED_CARDS_PER_PAGE) -> Dict[str, Any]:
+    """Otomatik yerleşimin sayfa sayısı ve sabit düzene göre kazancı"""
+    sheets = math.ceil(cards / layout.cards_per_sheet)
+    fixed_sheets = math.ceil(cards / fixed_cards_per_page)
+    return {
+        "rows": layout.rows,
+        "cols": layout.cols,
+        "orientation": layout.orientation,
+        "cards_per_sheet": layout.cards_per_sheet,
+        "sheets": sheets,
+        "fixed_cards_per_sheet": fixed_cards_per_page,
+        "fixed_sheets": fixed_sheets,
+        "sheets_saved": fixed_sheets - sheets,
+    }
+
+
+def resolve_sheet_layout(cards_per_page: Union[int, str], card_height_cm: float, card_width_cm: float,
+                         front_margins: Tuple, back_margins: Tuple, spacing_cm: float = 0.0,
+                         cards: int = 0, status_callback=None) -> Tuple[int, Optional[SheetLayout]]:
+    """cards_per_page AUTO_LAYOUT ise yerleşimi planla ve raporla
+
+    (sayfa başı kart, yerleşim) döndürür; sabit düzende yerleşim None'dır.
+    """
+    if cards_per_page != AUTO_LAYOUT:
+        return cards_per_page, None
+    layout = plan_imposition(card_height_cm, card_width_cm, front_margins, back_margins, spacing_cm)
+    if status_callback:
+        status_callback(imposition_message(imposition_report(layout, cards)))
+    return layout.cards_per_sheet, layout
+
+
+def imposition_message(report: Dict[str, Any]) -> str:
+    """Log için tek satırlık yerleşim özeti"""
+    return (f"Yerleşim: {report['rows']} × {report['cols']} {report['orientation']} "
+            f"({report['cards_per_sheet']} kart/sayfa) → {report['sheets']} sayfa; "
+            f"sabit düzende ({report['fixed_cards_per_sheet']} kart/sayfa) {report['fixed_sheets']} sayfa, "
+            f"{report['sheets_saved']} sayfa tasarruf")
+
+
+# ================== AKIŞLI DOCX YAZICI ==================
+
+DOCX_IMAGE_RELTYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/image"
+# document.xml gövdesi bu boyuta kadar bellekte, sonrasında geçici dosyada biriktirilir
+DOCX_BODY_SPOOL_BYTES = 8 * 1024 * 1024
+
+# python-docx'in add_table / add_picture ile ürettiği XML'in birebir metin kalıpları
+_DOCX_TABLE_START = (
+    '<w:tbl><w:tblPr><w:tblW w:type="auto" w:w="0"/><w:tblLayout w:type="fixed"/>'
+    '<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" w:lastRow="0" '
+    'w:noHBand="0" w:noVBand="1" w:val="04A0"/></w:tblPr><w:tblGrid>'
+)
+_DOCX_CELL_START = '<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="%d"/></w:tcPr>'
+_DOCX_PICTURE = (
+    '<w:p><w:r><w:drawing><wp:inline xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" '
+    'xmlns:pic="http://schemas.openxmlformats.org/drawingml/2006/picture">'
+    '<wp:extent cx="%(cx)d" cy="%(cy)d"/><wp:docPr id="%(id)d" name="Picture %(id)d"/>'
+    '<wp:cNvGraphicFramePr><a:graphicFrameLocks noChangeAspect="1"/></wp:cNvGraphicFramePr>'
+    '<a:graphic><a:graphicData uri="http://schemas.openxmlformats.org/drawingml/2006/picture">'
+    '<pic:pic><pic:nvPicPr><pic:cNvPr id="0" name="%(filename)s"/><pic:cNvPicPr/></pic:nvPicPr>'
+    '<pic:blipFill><a:blip r:embed="%(rId)s"/><a:stretch><a:fillRect/></a:stretch></pic:blipFill>'
+    '<pic:spPr><a:xfrm><a:off x="0" y="0"/><a:ext cx="%(cx)d" cy="%(cy)d"/></a:xfrm>'
+    '<a:prstGeom prst="rect"/></pic:spPr></pic:pic></a:graphicData></a:graphic>'
+    '</wp:inline></w:drawing></w:r></w:p>'
+)
+# Sayfaya göre mutlak konumlu (yüzen) resim; otomatik yerleşimde kullanılır
+_DOCX_ANCHORED_PICTURE = (
+    '<w:r><w:drawing><wp:anchor distT="0" distB="0" distL="0" distR="0" simplePos="0" '
+    'relativeHeight="%(id)d" behindDoc="0" locked="1" layoutInCell="1" allowOverlap="1" '
+    'xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" '
+    'xmlns:pic="http://schemas.openxmlformats.org/drawingml/2006/picture">'
+    '<wp:simplePos x="0" y="0"/>'
+    '<wp:positionH relativeFrom="page"><wp:posOffset>%(x)d</wp:posOffset></wp:positionH>'
+    '<wp:positionV relativeFrom="page"><wp:posOffset>%(y)d</wp:posOffset></wp:positionV>'
+    '<wp:extent cx="%(cx)d" cy="%(cy)d"/><wp:effectExtent l="0" t="0" r="0" b="0"/><wp:wrapNone/>'
+    '<wp:docPr id="%(id)d" name="Picture %(id)d"/>'
+    '<wp:cNvGraphicFramePr><a:graphicFrameLocks noChangeAspect="1"/></wp:cNvGraphicFramePr>'
+    '<a:graphic><a:graphicData uri="http://schemas.openxmlformats.org/drawingml/2006/picture">'
+    '<pic:pic><pic:nvPicPr><pic:cNvPr id="0" name="%(filename)s"/><pic:cNvPicPr/></pic:nvPicPr>'
+    '<pic:blipFill><a:blip r:embed="%(rId)s"/><a:stretch><a:fillRect/></a:stretch></pic:blipFill>'
+    '<pic:spPr><a:xfrm><a:off x="0" y="0"/><a:ext cx="%(cx)d" cy="%(cy)d"/></a:xfrm>'
+    '<a:prstGeom prst="rect"/></pic:spPr></pic:pic></a:graphicData></a:graphic>'
+    '</wp:anchor></w:drawing></w:r>'
+)
+
+
+@lru_cache(maxsize=1)
+def _docx_template() -> Dict[str, Any]:
+    """python-docx'in boş belgesinden sabit parçalar ve document.xml kalıpları"""
+    buf = BytesIO()
+    Document().save(buf)
+    with zipfile.ZipFile(buf) as zf:
+        parts = {name: zf.read(name) for name in zf.namelist()}
+
+    document = parts.pop("word/document.xml").decode("utf-8")
+    rels = parts.pop("word/_rels/document.xml.rels").decode("utf-8")
+    content_types = parts.pop("[Content_Types].xml").decode("utf-8")
+
+    body_start = document.index("<w:body>") + len("<w:body>")
+    sect_pr = re.search(r"<w:sectPr\b.*?</w:sectPr>", document, re.S).group(0)
+    return {
+        "parts": parts,
+        "document_head": document[:body_start],
+        "document_tail": "</w:body></w:document>",
+        "sect_pr": sect_pr,
+        # Sayfa sonu paragraflarındaki kopyalarda rsid öznitelikleri bulunmaz
+        "section_break_pr": re.sub(r' w:rsid\w*="[^"]*"', "", sect_pr),
+        "page_width_twips": int(re.search(r'<w:pgSz\b[^>]*w:w="(\d+)"', sect_pr).group(1)),
+        "page_height_twips": int(re.search(r'<w:pgSz\b[^>]*w:h="(\d+)"', sect_pr).group(1)),
+        "rels": rels,
+        "next_rid": max(int(n) for n in re.findall(r'Id="rId(\d+)"', rels)) + 1,
+        "content_types": content_types,
+    }
+
+
+def _docx_section_twips(margins: Tuple, page_size_cm: Optional[Tuple[float, float]],
+                        template: Dict[str, Any]) -> Dict[str, int]:
+    """(üst, alt, sol, sağ) cm ve sayfa boyutu → sectPr twips değerleri
+
+    Değerler python-docx Cm birimiyle yuvarlanır; sayfa boyutu verilmezse
+    şablonunki kullanılır.
+    """
+    top, bottom, left, right = (Cm(value).twips for value in margins)
+    if page_size_cm:
+        width, height = (Cm(value).twips for value in page_size_cm)
+    else:
+        width, height = template["page_width_twips"], template["page_height_twips"]
+    return {"top": top, "bottom": bottom, "left": left, "right": right,
+            "w": width, "h": height}
+
+
+class DocxStreamWriter:
+    """python-docx nesne ağacı kurmadan .docx yazan akışlı yazıcı
+
+    Kart sayfalarını (bölüm kenar boşlukları, tablo ızgarası, arka yüzde ters
+    sıra) doğrudan XML metni olarak üretir. Görüntü
+    parçaları grup eklenir eklenmez zip'e yazılır ve içerik özetine göre
+    paylaşılır; document.xml gövdesi geçici dosyada biriktirilip close()
+    sırasında ilişkiler ve içerik türleriyle birlikte yazılır. Böylece süre ve
+    bellek kart sayısıyla doğrusal ve küçük kalır.
+
+    Çıktı önce geçici bir dosyaya yazılır; abort() ya da hata durumunda
+    mevcut çıktı dosyası bozulmaz.
+    """
+
+    def __init__(self, output_path: Path):
+        self.output_path = Path(output_path)
+        self.template = _docx_template()
+        self._tmp_path = self.output_path.with_name(f"{self.output_path.name}.{_tmp_tag()}.tmp")
+        self._zip = zipfile.ZipFile(self._tmp_path, "w", zipfile.ZIP_DEFLATED)
+        self._body = tempfile.SpooledTemporaryFile(max_size=DOCX_BODY_SPOOL_BYTES)
+        self._images: Dict[str, Tuple[str, Any]] = {}
+        self._rels: List[str] = []
+        self._defaults: Dict[str, str] = {}
+        self._next_rid = self.template["next_rid"]
+        self._next_shape_id = 1
+        self._margins: Optional[Dict[str, int]] = None
+        self.pictures = 0
+
+    @property
+    def unique(self) -> int:
+        return len(self._images)
+
+    def _sect_pr(self, section: Dict[str, int], final: bool) -> str:
+        sect_pr = self.template["sect_pr" if final else "section_break_pr"]
+
+        def replace(match):
+            return f'w:{match.group(1)}="{section[match.group(1)]}"'
+
+        pg_sz = re.search(r"<w:pgSz\b[^>]*/>", sect_pr).group(0)
+        pg_mar = re.search(r"<w:pgMar\b[^>]*/>", sect_pr).group(0)
+        sect_pr = sect_pr.replace(pg_sz, re.sub(r'w:(w|h)="\d+"', replace, pg_sz))
+        return sect_pr.replace(pg_mar, re.sub(r'w:(top|bottom|left|right)="\d+"', replace, pg_mar))
+
+    def start_section(self, margins: Tuple, page_size_cm: Optional[Tuple[float, float]] = None):
+        """Yeni sayfa bölümü başlat (ilk çağrı belgenin ilk bölümünü ayarlar)"""
+        if self._margins is not None:
+            self._write(f"<w:p><w:pPr>{self._sect_pr(self._margins, final=False)}</w:pPr></w:p>")
+        self._margins = _docx_section_twips(margins, page_size_cm, self.template)
+
+    def _write(self, text: str):
+        self._body.write(text.encode("utf-8"))
+
+    def _image(self, data: bytes) -> Tuple[str, Any]:
+        """Görüntü parçasını (ilk kez görülüyorsa) zip'e yaz, (rId, görüntü bilgisi) döndür"""
+        key = hashlib.sha1(data).hexdigest()
+        entry = self._images.get(key)
+        if entry is None:
+            image = DocxImage.from_blob(data)
+            rId = f"rId{self._next_rid}"
+            self._next_rid += 1
+            target = f"media/image{len(self._images) + 1}.{image.ext}"
+            # PNG/JPEG zaten sıkıştırılmış; tekrar deflate etmek yalnızca zaman kaybı
+            self._zip.writestr(f"word/{target}", data, compress_type=zipfile.ZIP_STORED)
+            self._rels.append(f'<Relationship Id="{rId}" Type="{DOCX_IMAGE_RELTYPE}" Target="{target}"/>')
+            self._defaults.setdefault(image.ext, image.content_type)
+            entry = (rId, image)
+            self._images[key] = entry
+        return entry
+
+    def _picture(self, data: bytes, height) -> str:
+        rId, image = self._image(data)
+        cx, cy = image.scaled_dimensions(None, height)
+        xml = _DOCX_PICTURE % {"cx": cx, "cy": cy, "id": self._next_shape_id,
+                               "filename": image.filename, "rId": rId}
+        self._next_shape_id += 1
+        self.pictures += 1
+        return xml
+
+    def add_grid_page(self, images: List, rotate_degrees: int,
+                      card_height_cm: float, card_width_cm: float,
+                      cards_per_row: int = 2, reverse_rows: bool = False):
+        """Görüntüleri tablo olarak geçerli bölüme ekle"""
+        if not images:
+            return
+        if self._margins is None:
+            raise RuntimeError("Önce start_section çağrılmalı")
+
+        margins = self._margins
+        block_width = (margins["w"] - margins["left"] - margins["right"]) * 635
+        grid_col = f'<w:gridCol w:w="{Emu(block_width // cards_per_row).twips}"/>'
+        cell_start = _DOCX_CELL_START % Cm(card_width_cm + 0.5).twips
+        height = Cm(card_height_cm)
+
+        xml = [_DOCX_TABLE_START, grid_col * cards_per_row, "</w:tblGrid>"]
+        for start in range(0, len(images), cards_per_row):
+            cells = ["<w:p/>"] * cards_per_row
+            columns = range(cards_per_row - 1, -1, -1) if reverse_rows else range(cards_per_row)
+            for c, item in zip(columns, images[start:start + cards_per_row]):
+                if not isinstance(item, bytes):
+                    item = pil_to_stream(item.rotate(rotate_degrees, expand=True)).getvalue()
+                cells[c] = self._picture(item, height)
+            xml.append("<w:tr>")
+            for cell in cells:
+                xml.extend((cell_start, cell, "</w:tc>"))
+            xml.append("</w:tr>")
+        xml.append("</w:tbl>")
+        self._write("".join(xml))
+
+    def add_card_group(self, group: List[Tuple], card_height_cm: float, card_width_cm: float,
+                       front_margins: Tuple, back_margins: Tuple):
+        """Bir kart grubunu ön ve arka yüz sayfası olarak ekle"""
+        self.start_section(front_margins)
+        self.add_grid_page([f for (f, _) in group], FRONT_ROTATION, card_height_cm, card_width_cm,
+                           reverse_rows=False)
+        self.start_section(back_margins)
+        self.add_grid_page([b for (_, b) in group], BACK_ROTATION, card_height_cm, card_width_cm,
+                           reverse_rows=True)
+
+    def add_positioned_page(self, images: List, rotate_degrees: int, layout: SheetLayout,
+                            back: bool = False):
+        """Görüntüleri yerleşimdeki mutlak konumlarına (sayfaya göre) yerleştir"""
+        if not images:
+            return
+        if self._margins is None:
+            raise RuntimeError("Önce start_section çağrılmalı")
+
+        height = Cm(layout.placed_height_cm)
+        xml = ["<w:p>"]
+        for index, item in enumerate(images):
+            if not isinstance(item, bytes):
+                item = pil_to_stream(item.rotate(rotate_degrees, expand=True)).getvalue()
+            rId, image = self._image(item)
+            cx, cy = image.scaled_dimensions(None, height)
+            x_cm, y_cm = layout.position(index, cx / Cm(1), back)
+            xml.append(_DOCX_ANCHORED_PICTURE % {
+                "x": Cm(x_cm), "y": Cm(y_cm), "cx": cx, "cy": cy,
+                "id": self._next_shape_id, "filename": image.filename, "rId": rId,
+            })
+            self._next_shape_id += 1
+            self.pictures += 1
+        xml.append("</w:p>")
+        self._write("".join(xml))
+
+    def add_imposed_group(self, group: List[Tuple], layout: SheetLayout):
+        """Bir kart grubunu otomatik yerleşimle ön ve arka yüz sayfası olarak ekle"""
+        front_rotation, back_rotation = layout.rotations
+        self.start_section(layout.front_margins, layout.sheet_cm)
+        self.add_positioned_page([f for (f, _) in group], front_rotation, layout)
+        self.start_section(layout.back_margins, layout.sheet_cm)
+        self.add_positioned_page([b for (_, b) in group], back_rotation, layout, back=True)
+
+    def _content_types(self) -> str:
+        content_types = self.template["content_types"]
+        defaults = dict(re.findall(r'<Default Extension="([^"]+)" ContentType="([^"]+)"/>', content_types))
+        for ext, content_type in self._defaults.items():
+            defaults.setdefault(ext, content_type)
+
+        head = content_types[:content_types.index("<Default ")]
+        tail = content_types[content_types.index("<Override "):]
+        return head + "".join(f'<Default Extension="{ext}" ContentType="{defaults[ext]}"/>'
+                              for ext in sorted(defaults)) + tail
+
+    def close(self) -> Path:
+        """document.xml, ilişkiler ve sabit parçaları yazıp dosyayı tamamla"""
+        if self._margins is None:
+            raise RuntimeError("Belgeye hiç sayfa eklenmedi")
+
+        template = self.template
+        try:
+            with self._zip.open("word/document.xml", "w") as f:
+                f.write(template["document_head"].encode("utf-8"))
+                self._body.seek(0)
+                shutil.copyfileobj(self._body, f)
+                f.write((self._sect_pr(self._margins, final=True)
+                         + template["document_tail"]).encode("utf-8"))
+
+            rels = template["rels"].replace("</Relationships>",
+                                            "".join(self._rels) + "</Relationships>")
+            self._zip.writestr("word/_rels/document.xml.rels", rels)
+            self._zip.writestr("[Content_Types].xml", self._content_types())
+            for name, data in template["parts"].items():
+                self._zip.writestr(name, data)
+            self._zip.close()
+            self._body.close()
+            os.replace(self._tmp_path, self.output_path)
+        except BaseException:
+            self.abort()
+            raise
+        return self.output_path
+
+    def abort(self):
+        """Yarım kalan yazımı bırak, geçici dosyayı sil"""
+        self._zip.close()
+        self._body.close()
+        try:
+            self._tmp_path.unlink()
+        except OSError:
+            pass
+
+
+def generate_doc_from_pdfs(pdf_paths: List[Path], card_height_cm: float, card_width_cm: float,
+                           front_margins: Tuple, back_margins: Tuple,
+                           render_dpi: Union[int, str] = 300, cards_per_page: int = 8,
+                           output_path: Path = None,
+                           progress_callback=None, status_callback=None,
+                           workers: int = 1, cache: Optional[RenderCache] = None,
+                           codec: Optional[Dict[str, Any]] = None,
+                           encode_stats: Optional[EncodeStats] = None,
+                           stage_times: Optional[StageTimes] = None,
+                           cancel_event: Optional[threading.Event] = None,
+                           checkpoint_callback=None, error_callback=None,
+                           printer_dpi: int = DEFAULT_PRINTER_DPI,
+                           card_spacing_cm: float = 0.0) -> Path:
+    """PDF'lerden Word dosyası oluştur
+
+    Kartlar cards_per_page'lik gruplar halinde işlenir: her grup görüntüye
+    çevrilip sayfaya eklendikten sonra bitmap'ler bırakılır. Böylece bellek
+    kullanımı toplu iş boyutuna değil grup boyutuna bağlı kalır. Belge
+    DocxStreamWriter ile yazılır; görüntüler gruplar tamamlandıkça dosyaya
+    aktarılır.
+
+    Önbellek verilmişse her ön/arka sayfa çiftinin görüntüleri, girdi
+    özetleri ve render ayarlarıyla anahtarlanıp saklanır. Yeniden üretimde
+    girdileri ve sırası değişmemiş gruplar PDF'ler okunmadan bu kayıttan
+    alınır; yalnızca değişen gruplar render edilir.
+
+    cancel_event kurulursa kart/grup aralarında GenerationCancelled fırlatılır.
+    checkpoint_callback(tamamlanan grup, toplam grup, işlenen kart) her grup
+    önbelleğe yazıldıktan sonra çağrılır; yarıda kalan iş bu gruplarla devam eder.
+    error_callback(kaynak, hata) işlenemeyip atlanan her kart için çağrılır.
+
+    render_dpi "auto" ise her sayfa içeriğine ve printer_dpi'a göre gereken en
+    düşük DPI'da render edilir (bkz. page_content_dpi).
+
+    cards_per_page "auto" ise sayfaya sığan en çok kart, card_spacing_cm
+    aralıkla ve uygun yönde yerleştirilir (bkz. plan_imposition).
+    """
+
+    workers = resolve_worker_count(workers)
+    render_dpi = resolve_render_dpi(render_dpi, printer_dpi)
+    cards_per_page, layout = resolve_sheet_layout(cards_per_page, card_height_cm, card_width_cm,
+                                                  front_margins, back_margins, card_spacing_cm,
+                                                  len(pdf_paths), status_callback)
+    if layout is not None:
+        rotations, render_height_cm = layout.rotations, layout.placed_height_cm
+    else:
+        rotations, render_height_cm = (FRONT_ROTATION, BACK_ROTATION), card_height_cm
+    # Yatay yerleşimin görüntüleri sabit düzeninkiyle aynıdır; önbellek paylaşılır
+    layout_tag = "" if rotations == (FRONT_ROTATION, BACK_ROTATION) else f"rot{rotations[0]}"
+    if status_callback:
+        status_callback(f"PDF'ler okunuyor... ({workers} işçi)")
+
+    output_dir = output_path.parent if output_path else BASE_DIR / "output"
+    output_dir.mkdir(exist_ok=True, parents=True)
+    
+    if not output_path:
+        output_path = output_dir / "kartlar.docx"
+
+    groups_written = 0
+    total_pdfs = len(pdf_paths)
+    planned = [pdf_paths[i:i + cards_per_page] for i in range(0, total_pdfs, cards_per_page)]
+
+    # Önceki çalıştırmalardan kullanılabilecek gruplar
+    group_keys = [None] * len(planned)
+    reused: Dict[int, List[Tuple[bytes, bytes]]] = {}
+    if cache is not None:
+        digest_index = DigestIndex.for_cache(cache)
+        with measure(stage_times, "reuse"):
+            for idx, sources in enumerate(planned):
+                group_keys[idx] = sheet_group_key([digest_index.digest(src) for src in sources],
+                                                  render_dpi, render_height_cm, codec, layout_tag)
+                data = cache.get(group_keys[idx]) if group_keys[idx] else None
+                if data is not None:
+                    try:
+                        reused[idx] = unpack_sheet_group(data)
+                    except ValueError:
+                        pass
+        digest_index.save()
+        if reused and status_callback:
+            status_callback(f"{len(reused)}/{len(planned)} sayfa grubu önceki çalıştırmadan kullanılıyor")
+
+    to_render = [src for idx, sources in enumerate(planned) if idx not in reused for src in sources]
+    rendered = iter_rendered_cards(to_render, dpi=render_dpi, workers=workers, cache=cache,
+                                   codec=codec, encode_stats=encode_stats,
+                                   card_height_cm=render_height_cm, stage_times=stage_times,
+                                   rotations=rotations)
+    writer = DocxStreamWriter(output_path)
+    processed = 0
+    try:
+        for idx, sources in enumerate(planned):
+            check_cancelled(cancel_event)
+            if idx in reused:
+                group = reused.pop(idx)
+                processed += len(sources)
+                if status_callback:
+                    status_callback(f"Değişmedi: {len(sources)} kart ({processed}/{total_pdfs})")
+                if progress_callback:
+                    progress_callback(processed / total_pdfs * 100)
+            else:
+                # Hatalı kart, sonraki gruplar kaymasın diye yalnızca kendi grubunda boşluk bırakır
+                group = []
+                for pdf, card, error in itertools.islice(rendered, len(sources)):
+                    check_cancelled(cancel_event)
+                    processed += 1
+                    if error is None:
+                        group.append(card)
+
+                        if status_callback:
+                            status_callback(f"Yüklendi: {source_label(pdf)} ({processed}/{total_pdfs})")
+                    else:
+                        if status_callback:
+                            status_callback(f"HATA: {source_label(pdf)} → {error}")
+                        if error_callback:
+                            error_callback(pdf, error)
+
+                    if progress_callback:
+                        progress_callback(processed / total_pdfs * 100)
+
+                if group_keys[idx] and len(group) == len(sources):
+                    cache.put(group_keys[idx], pack_sheet_group(group))
+
+            if group:
+                with measure(stage_times, "layout", group=groups_written, cards=len(group)):
+                    if layout is not None:
+                        writer.add_imposed_group(group, layout)
+                    else:
+                        writer.add_card_group(group, card_height_cm, card_width_cm,
+                                              front_margins, back_margins)
+                groups_written += 1
+
+            if checkpoint_callback:
+                checkpoint_callback(idx + 1, len(planned), processed)
+
+        check_cancelled(cancel_event)
+
+        if not groups_written:
+            raise NoValidCardsError("Hiç geçerli PDF işlenemedi.")
+    except BaseException:
+        writer.abort()
+        raise
+    finally:
+        rendered.close()
+
+    if status_callback:
+        status_callback(f"Word dosyası kaydediliyor... "
+                        f"({writer.unique} benzersiz görüntü / {writer.pictures} kart yüzü)")
+
+    with measure(stage_times, "save", file=Path(output_path).name):
+        writer.close()
+
+    if cache is not None:
+        cache.prune()
+    return output_path
+
+
+# ================== YİNELENEN KART TESPİTİ ==================
+
+# Görünüm özeti için render ölçeği (72 DPI); tek rakamlık metin farkları da ayırt edilir
+FINGERPRINT_ZOOM = 1.0
+
+DUPLICATE_SAME_BYTES = "aynı dosya"
+DUPLICATE_SAME_PAGES = "aynı görünüm"
+
+
+def content_fingerprint(source) -> Tuple[str, Optional[str]]:
+    """Kaynağın bayt özeti ve ön/arka sayfalarının görünüm özeti
+
+    Görünüm özeti, meta verisi ya da iç yapısı farklı olsa da aynı render
+    edilen PDF'leri yakalar. 2 sayfadan az olan PDF'lerde None'dır.
+    """
+    data = read_pdf_bytes(source)
+    doc = open_pdf(source, data)
+    try:
+        if len(doc) < 2:
+            return bytes_digest(data), None
+
+        h = hashlib.blake2b(digest_size=20)
+        mat = fitz.Matrix(FINGERPRINT_ZOOM, FINGERPRINT_ZOOM)
+        for page_index in (0, 1):
+            pix = doc[page_index].get_pixmap(matrix=mat, alpha=False)
+            h.update(f"{pix.width}x{pix.height};".encode())
+            h.update(pix.samples_mv)
+        return bytes_digest(data), h.hexdigest()
+    finally:
+        doc.close()
+
+
+def _fingerprint_job(source):
+    """İşçi süreçte özet çıkar; hata, toplu işlemi durdurmasın diye metin olarak döner"""
+    try:
+        return content_fingerprint(source), None
+    except Exception as e:
+        return None, str(e)
+
+
+def iter_fingerprints(sources: list, workers: int = 1):
+    """Kaynakların özetlerini (kaynak, özet, hata) olarak liste sırasıyla döndür"""
+    if workers <= 1 or len(sources) <= 1:
+        for source in sources:
+            yield (source, *_fingerprint_job(source))
+        return
+
+    prepare_archive_reads(sources)
+    with ProcessPoolExecutor(max_workers=min(workers, len(sources))) as executor:
+        for source, result in zip(sources, executor.map(_fingerprint_job, sources, chunksize=8)):
+            yield (source, *result)
+
+
+class DuplicateIndex:
+    """Girdi PDF'leri için içerik özeti dizini
+
+    Her özet ilk görülen kaynağa (asıl) bağlanır. Sonra gelen, baytları ya da
+    render edilmiş sayfaları aynı olan kaynaklar yinelenen olarak raporlanır.
+    """
+
+    def __init__(self):
+        self._fingerprints: Dict[Any, Tuple[str, Optional[str]]] = {}
+        self._by_bytes: Dict[str, Any] = {}
+        self._by_pages: Dict[str, Any] = {}
+
+    def __contains__(self, source) -> bool:
+        return source in self._fingerprints
+
+    def __len__(self) -> int:
+        return len(self._fingerprints)
+
+    def add(self, source, fingerprint: Tuple[str, Optional[str]]) -> Optional[Tuple[Any, str]]:
+        """Özeti kaydet; kaynak yineleniyorsa (asıl, neden) döndür"""
+        byte_digest, page_digest = fingerprint
+        self._fingerprints[source] = fingerprint
+
+        original = self._by_bytes.setdefault(byte_digest, source)
+        if original != source:
+            return original, DUPLICATE_SAME_BYTES
+
+        if page_digest is not None:
+            original = self._by_pages.setdefault(page_digest, source)
+            if original != source:
+                return original, DUPLICATE_SAME_PAGES
+        return None
+
+    def discard(self, source):
+        """Kaynağı dizinden çıkar; asılsa yerine aynı özetli başka bir kaynak geçer"""
+        self.discard_many([source])
+
+    def discard_many(self, sources):
+        """Kaynakları dizinden çıkar; asılların yerine geçecek kaynaklar tek geçişte bulunur"""
+        orphaned = ([], [])
+        for source in sources:
+            fingerprint = self._fingerprints.pop(source, None)
+            if fingerprint is None:
+                continue
+            for position, table in enumerate((self._by_bytes, self._by_pages)):
+                digest = fingerprint[position]
+                if digest is not None and table.get(digest) == source:
+                    del table[digest]
+                    orphaned[position].append(digest)
+
+        if not orphaned[0] and not orphaned[1]:
+            return
+        wanted = (set(orphaned[0]), set(orphaned[1]))
+        for other, other_fingerprint in self._fingerprints.items():
+            for position, table in enumerate((self._by_bytes, self._by_pages)):
+                digest = other_fingerprint[position]
+                if digest in wanted[position]:
+                    table.setdefault(digest, other)
+
+    def clear(self):
+        self._fingerprints.clear()
+        self._by_bytes.clear()
+        self._by_pages.clear()
+
+
+def find_duplicates(sources: list, workers: int = 1, index: Optional[DuplicateIndex] = None):
+    """Kaynakları dizine ekle; (benzersizler, [(kopya, asıl, neden)], [(kaynak, hata)]) döndür
+
+    Özeti çıkarılamayan kaynaklar benzersiz kabul edilir; hatası render sırasında raporlanır.
+    """
+    index = DuplicateIndex() if index is None else index
+    unique, duplicates, errors = [], [], []
+    for source, fingerprint, error in iter_fingerprints(sources, workers):
+        if error is not None:
+            unique.append(source)
+            errors.append((source, error))
+            continue
+        match = index.add(source, fingerprint)
+        if match is None:
+            unique.append(source)
+        else:
+            duplicates.append((source, *match))
+    return unique, duplicates, errors
+
+
+# ================== DOSYA LİSTESİ ==================
+
+@lru_cache(maxsize=1024)
+def _resolved_dir(directory: str) -> str:
+    return os.path.realpath(directory)
+
+
+def _resolved_path(path) -> str:
+    # Klasör bir kez çözümlenir; aynı klasördeki binlerce dosya için tekrar disk sorgusu yapılmaz
+    directory, name = os.path.split(os.path.abspath(path))
+    return os.path.normcase(os.path.join(_resolved_dir(directory), name))
+
+
+def source_key(source) -> str:
+    """Dosya listesi anahtarı: çözümlenmiş dosya yolu (arşiv üyesinde arşiv yolu + üye adı)
+
+    Aynı dosyaya farklı yazılışlarla (göreli yol, '..', bağlı klasör) verilen
+    yollar aynı anahtarı alır.
+    """
+    if isinstance(source, ArchiveMember):
+        return f"{_resolved_path(source.archive_path)}::{source.member}"
+    return _resolved_path(source)
+
+
+def source_details(source) -> Tuple[int, int]:
+    """Kaynağın boyutu (bayt) ve sayfa sayısı"""
+    if isinstance(source, ArchiveMember):
+        data = source.read_bytes()
+        size = len(data)
+    else:
+        data = None
+        size = Path(source).stat().st_size
+    doc = open_pdf(source, data)
+    try:
+        return size, len(doc)
+    finally:
+        doc.close()
+
+
+class SourceList:
+    """Sıralı ve source_key ile dizinli kart dosyası listesi
+
+    Üyelik sorgusu ve ekleme O(1)'dir. Sıra ayrı bir anahtar listesinde
+    tutulur: komşu takası O(1), toplu silme tek geçişte O(n) sürer. Anahtar
+    → sıra dizini yalnızca gerektiğinde yeniden kurulur.
+    """
+
+    def __init__(self, sources: list = ()):
+        self._sources: Dict[str, Any] = {}
+        self._order: List[str] = []
+        self._positions: Optional[Dict[str, int]] = None
+        self.add(sources)
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __bool__(self) -> bool:
+        return bool(self._order)
+
+    def __iter__(self):
+        return (self._sources[key] for key in self._order)
+
+    def __contains__(self, source) -> bool:
+        return source_key(source) in self._sources
+
+    def sources(self) -> list:
+        """Kaynakları liste sırasıyla döndür"""
+        return [self._sources[key] for key in self._order]
+
+    def keys(self) -> List[str]:
+        return list(self._order)
+
+    def get(self, key: str):
+        return self._sources.get(key)
+
+    def key_at(self, index: int) -> str:
+        return self._order[index]
+
+    def index(self, key: str) -> int:
+        if self._positions is None:
+            self._positions = {k: i for i, k in enumerate(self._order)}
+        return self._positions[key]
+
+    def add(self, sources) -> List[Tuple[str, Any]]:
+        """Listede olmayan kaynakları sona ekle; eklenen (anahtar, kaynak) çiftlerini döndür"""
+        added = []
+        for source in sources:
+            key = source_key(source)
+            if key in self._sources:
+                continue
+            self._sources[key] = source
+            if self._positions is not None:
+                self._positions[key] = len(self._order)
+            self._order.append(key)
+            added.append((key, source))
+        return added
+
+    def remove(self, keys) -> list:
+        """Anahtarları çıkar; çıkarılan kaynakları döndür"""
+        removed = [self._sources.pop(key) for key in set(keys) if key in self._sources]
+        if removed:
+            self._order = [key for key in self._order if key in self._sources]
+            self._positions = None
+        return removed
+
+    def clear(self):
+        self._sources.clear()
+        self._order.clear()
+        self._positions = None
+
+    def move(self, keys, offset: int) -> List[Tuple[str, int]]:
+        """Anahtarları birlikte bir sıra (−1 yukarı, +1 aşağı) taşı
+
+        Kenara dayanan ya da önündeki seçili öğe kıpırdayamayan öğeler yerinde
+        kalır. Yapılan her komşu takası için (yukarı çıkan anahtar, yeni sırası)
+        döndürülür; görünüm aynı sırayla yalnızca bu öğeleri taşıyarak eşitlenir.
+        """
+        selected = set(keys)
+        positions = sorted((self.index(key) for key in selected), reverse=offset > 0)
+        blocked = set()
+        swaps = []
+        for position in positions:
+            target = position + offset
+            if not 0 <= target < len(self._order) or self._order[target] in blocked:
+                blocked.add(self._order[position])
+                continue
+            order = self._order
+            order[position], order[target] = order[target], order[position]
+            self._positions[order[position]] = position
+            self._positions[order[target]] = target
+            upper = min(position, target)
+            swaps.append((order[upper], upper))
+        return swaps
+
+
+# ================== PDF ÇIKTI ==================
+
+# Word tablosundaki sütun genişliği kart genişliğinden bu kadar fazladır
+COLUMN_PADDING_CM = 0.5
+
+
+def add_pdf_grid_page(out_doc, pages: List[Tuple[Any, int]], rotate_degrees: int,
+                      card_height_cm: float, card_width_cm: float, margins: Tuple,
+                      cards_per_row: int = 2, reverse_rows: bool = False):
+    """Kaynak PDF sayfalarını raster'a çevirmeden A4 sayfaya grid halinde yerleştir
+
+    Yerleşim DocxStreamWriter.add_grid_page ile aynıdır: sütun genişliği kart genişliği + 0,5 cm,
+    kart yüksekliği card_height_cm; reverse_rows ile sütunlar sağdan sola dizilir.
+    """
+    page = out_doc.new_page(width=A4_WIDTH_CM * CM_TO_PT, height=A4_HEIGHT_CM * CM_TO_PT)
+
+    for idx, (src_doc, page_index) in enumerate(pages):
+        row, slot = divmod(idx, cards_per_row)
+        col = cards_per_row - 1 - slot if reverse_rows else slot
+
+        src_rect = src_doc[page_index].rect
+        if rotate_degrees % 180:
+            aspect = src_rect.height / src_rect.width
+        else:
+            aspect = src_rect.width / src_rect.height
+
+        height = card_height_cm * CM_TO_PT
+        width = height * aspect
+        x0 = (margins[2] + col * (card_width_cm + COLUMN_PADDING_CM)) * CM_TO_PT
+        y0 = (margins[0] + row * card_height_cm) * CM_TO_PT
+
+        page.show_pdf_page(fitz.Rect(x0, y0, x0 + width, y0 + height),
+                           src_doc, page_index, rotate=rotate_degrees)
+
+
+def add_pdf_positioned_page(out_doc, pages: List[Tuple[Any, int]], rotate_degrees: int,
+                            layout: SheetLayout, back: bool = False):
+    """Kaynak PDF sayfalarını yerleşimdeki mutlak konumlarına raster'a çevirmeden yerleştir"""
+    page = out_doc.new_page(width=layout.sheet_cm[0] * CM_TO_PT, height=layout.sheet_cm[1] * CM_TO_PT)
+
+    height_cm = layout.placed_height_cm
+    for idx, (src_doc, page_index) in enumerate(pages):
+        src_rect = src_doc[page_index].rect
+        if rotate_degrees % 180:
+            aspect = src_rect.height / src_rect.width
+        else:
+            aspect = src_rect.width / src_rect.height
+
+        width_cm = height_cm * aspect
+        x_cm, y_cm = layout.position(idx, width_cm, back)
+        x0, y0 = x_cm * CM_TO_PT, y_cm * CM_TO_PT
+        page.show_pdf_page(fitz.Rect(x0, y0, x0 + width_cm * CM_TO_PT, y0 + height_cm * CM_TO_PT),
+                           src_doc, page_index, rotate=rotate_degrees)
+
+
+def generate_pdf_from_pdfs(pdf_paths: List[Path], card_height_cm: float, card_width_cm: float,
+                           front_margins: Tuple, back_margins: Tuple,
+                           cards_per_page: int = 8, output_path: Path = None,
+                           progress_callback=None, status_callback=None,
+                           stage_times: Optional[StageTimes] = None,
+                           cancel_event: Optional[threading.Event] = None,
+                           card_spacing_cm: float = 0.0, error_callback=None) -> Path:
+    """PDF'lerden dupleks baskıya hazır vektörel PDF oluştur
+
+    Kart sayfaları görüntüye çevrilmeden gömülür; metin tam keskinlikte kalır.
+    Ön/arka sayfa düzeni ve kenar boşlukları Word çıktısıyla aynıdır.
+    error_callback(kaynak, hata) açılamayıp atlanan her kart için çağrılır.
+    """
+    if status_callback:
+        status_callback("PDF çıktısı oluşturuluyor...")
+    cards_per_page, layout = resolve_sheet_layout(cards_per_page, card_height_cm, card_width_cm,
+                                                  front_margins, back_margins, card_spacing_cm,
+                                                  len(pdf_paths), status_callback)
+
+    output_dir = output_path.parent if output_path else BASE_DIR / "output"
+    output_dir.mkdir(exist_ok=True, parents=True)
+
+    if not output_path:
+        output_path = output_dir / "kartlar.pdf"
+
+    out_doc = fitz.open()
+    group = []
+    groups_written = 0
+    total_pdfs = len(pdf_paths)
+
+    def write_group():
+        if layout is not None:
+            front_rotation, back_rotation = layout.rotations
+            add_pdf_positioned_page(out_doc, [(src, 0) for src in group], front_rotation, layout)
+            add_pdf_positioned_page(out_doc, [(src, 1) for src in group], back_rotation, layout,
+                                    back=True)
+        else:
+            add_pdf_grid_page(out_doc, [(src, 0) for src in group], FRONT_ROTATION,
+                              card_height_cm, card_width_cm, front_margins, reverse_rows=False)
+            add_pdf_grid_page(out_doc, [(src, 1) for src in group], BACK_ROTATION,
+                              card_height_cm, card_width_cm, back_margins, reverse_rows=True)
+        for src in group:
+            src.close()
+
+    try:
+        for i, pdf in enumerate(pdf_paths):
+            check_cancelled(cancel_event)
+            try:
+                with measure(stage_times, "open", file=source_label(pdf)):
+                    src = open_pdf(pdf)
+                if len(src) < 2:
+                    src.close()
+                    raise ValueError(f"{source_label(pdf)} içinde 2 sayfa yok.")
+                group.append(src)
+
+                if status_callback:
+                    status_callback(f"Yüklendi: {source_label(pdf)} ({i+1}/{total_pdfs})")
+            except Exception as e:
+                if status_callback:
+                    status_callback(f"HATA: {source_label(pdf)} → {e}")
+                if error_callback:
+                    error_callback(pdf, e)
+
+            if len(group) == cards_per_page or (i + 1 == total_pdfs and group):
+                with measure(stage_times, "layout", group=groups_written, cards=len(group)):
+                    write_group()
+                groups_written += 1
+                group = []
+
+            if progress_callback:
+                progress_callback((i + 1) / total_pdfs * 100)
+
+        if not groups_written:
+            raise NoValidCardsError("Hiç geçerli PDF işlenemedi.")
+
+        if status_callback:
+            status_callback("PDF dosyası kaydediliyor...")
+
+        # garbage=3 aynı içerikli nesneleri (ör. ortak arka yüzler) birleştirir
+        with measure(stage_times, "save", file=Path(output_path).name):
+            out_doc.save(str(output_path), garbage=3, deflate=True)
+    finally:
+        for src in group:
+            src.close()
+        out_doc.close()
+
+    return output_path
+
+
+OUTPUT_FORMATS = ("docx", "pdf", "both")
+
+
+def generate_outputs(pdf_paths: List[Path], card_height_cm: float, card_width_cm: float,
+                     front_margins: Tuple, back_margins: Tuple,
+                     render_dpi: Union[int, str] = 300, cards_per_page: int = 8,
+                     output_path: Path = None, output_format: str = "docx",
+                     progress_callback=None, status_callback=None,
+                     workers: int = 1, cache: Optional[RenderCache] = None,
+                     codec: Optional[Dict[str, Any]] = None,
+                     encode_stats: Optional[EncodeStats] = None,
+                     stage_times: Optional[StageTimes] = None,
+                     cancel_event: Optional[threading.Event] = None,
+                     checkpoint_callback=None,
+                     printer_dpi: int = DEFAULT_PRINTER_DPI,
+                     card_spacing_cm: float = 0.0, error_callback=None) -> List[Path]:
+    """Seçili çıktı biçimine (docx, pdf, both) göre dosyaları oluştur
+
+    error_callback(kaynak, hata) atlanan kartlar için her çıktı biçiminde
+    ayrı çağrılır; "both" biçiminde aynı kart iki kez bildirilebilir.
+    """
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Desteklenmeyen çıktı biçimi: {output_format}")
+
+    if not output_path:
+        output_path = BASE_DIR / "output" / "kartlar.docx"
+
+    steps = []
+    if output_format in ("docx", "both"):
+        steps.append("docx")
+    if output_format in ("pdf", "both"):
+        steps.append("pdf")
+
+    outputs = []
+    for step_idx, step in enumerate(steps):
+        def step_progress(value, step_idx=step_idx):
+            if progress_callback:
+                progress_callback((step_idx * 100 + value) / len(steps))
+
+        if step == "docx":
+            outputs.append(generate_doc_from_pdfs(
+                pdf_paths, card_height_cm, card_width_cm, front_margins, back_margins,
+                render_dpi=render_dpi, cards_per_page=cards_per_page,
+                output_path=output_path.with_suffix(".docx"),
+                progress_callback=step_progress, status_callback=status_callback,
+                workers=workers, cache=cache, codec=codec, encode_stats=encode_stats,
+                stage_times=stage_times, cancel_event=cancel_event,
+                checkpoint_callback=checkpoint_callback, printer_dpi=printer_dpi,
+                card_spacing_cm=card_spacing_cm, error_callback=error_callback
+            ))
+        else:
+            outputs.append(generate_pdf_from_pdfs(
+                pdf_paths, card_height_cm, card_width_cm, front_margins, back_margins,
+                cards_per_page=cards_per_page,
+                output_path=output_path.with_suffix(".pdf"),
+                progress_callback=step_progress, status_callback=status_callback,
+                stage_times=stage_times, cancel_event=cancel_event,
+                card_spacing_cm=card_spacing_cm, error_callback=error_callback
+            ))
+
+    return outputs
+
+
+# ================== İŞLER (İPTAL / DEVAM) ==================
+
+JOBS_DIR = BASE_DIR / "jobs"
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_CANCELLED = "cancelled"
+JOB_FAILED = "failed"
+JOB_DONE = "done"
+
+# Kontrol noktası kaydı en fazla bu sıklıkta yazılır (saniye)
+CHECKPOINT_INTERVAL_S = 1.0
+# Bu süreden uzun süredir güncellenmeyen "running" iş, çökmüş bir oturumdan kalmıştır
+STALE_JOB_AFTER_S = 120
+# Render önbelleği kapalıyken kullanılan işe özel önbelleğin üst sınırı (MB)
+JOB_CACHE_MAX_MB = 512
+
+
+def source_to_json(source):
+    """Girdiyi (dosya yolu ya da arşiv üyesi) iş kaydına yazılabilir biçime çevir"""
+    if isinstance(source, ArchiveMember):
+        return {"archive": str(source.archive_path), "member": source.member, "kind": source.kind}
+    return str(source)
+
+
+def source_from_json(data):
+    if isinstance(data, dict):
+        return ArchiveMember(Path(data["archive"]), data["member"], data["kind"])
+    return Path(data)
+
+
+class GenerationJob:
+    """Kaldığı yerden devam ettirilebilen üretim işi
+
+    Girdi listesi ve ayarların anlık görüntüsü jobs/<id>.json dosyasında
+    tutulur. Tamamlanan sayfa grupları render önbelleğine (önbellek kapalıysa
+    en fazla JOB_CACHE_MAX_MB büyüklüğündeki işe özel jobs/<id>/ önbelleğine)
+    yazıldığından, iptal edilen ya da uygulama kapanınca yarıda kalan iş
+    yeniden çalıştırıldığında yalnızca eksik gruplar render edilir. İş
+    başarıyla bittiğinde ya da hiçbir kart okunamadığı için başarısız
+    olduğunda (sürdürmek bir şey değiştirmez) kaydı silinir.
+
+    resumable=False ise kayıt hiç yazılmaz ve işe özel önbellek her durumda
+    silinir (ör. zamanlanmış toplu çalıştırmalar).
+    """
+
+    def __init__(self, job_id: str, sources: list, settings: Dict[str, Any],
+                 status: str = JOB_RUNNING, progress: Optional[Dict[str, Any]] = None,
+                 created: Optional[str] = None, error: Optional[str] = None,
+                 directory: Path = JOBS_DIR, resumable: bool = True):
+        self.job_id = job_id
+        self.sources = list(sources)
+        self.settings = settings
+        self.status = status
+        self.progress = progress or {"groups_done": 0, "groups_total": 0, "cards_done": 0}
+        self.created = created or datetime.now().strftime("%Y-%m-%d %H:%M")
+        self.error = error
+        self.directory = Path(directory)
+        self.resumable = resumable
+        self.updated = time.time()
+        self._last_checkpoint = 0.0
+
+        # Çalışma anındaki durum (kayda yazılmaz)
+        self.cancel_event = threading.Event()
+        self.percent = 0.0
+        self.message = ""
+        self.outputs: List[Path] = []
+        self.encode_stats = EncodeStats()
+        self.stage_times = Tracer() if settings.get("write_trace") else StageTimes()
+
+    @classmethod
+    def create(cls, sources: list, settings: Dict[str, Any], directory: Path = JOBS_DIR,
+               resumable: bool = True) -> "GenerationJob":
+        job_id = datetime.now().strftime("%Y%m%d_%H%M%S_") + os.urandom(3).hex()
+        job = cls(job_id, sources, settings, directory=directory, resumable=resumable)
+        job.save()
+        return job
+
+    @classmethod
+    def load(cls, path: Path) -> "GenerationJob":
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        job = cls(data["id"], [source_from_json(item) for item in data["sources"]],
+                  data["settings"], data.get("status", JOB_RUNNING), data.get("progress"),
+                  data.get("created"), data.get("error"), Path(path).parent)
+        job.updated = data.get("updated", 0)
+        return job
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.directory / f"{self.job_id}.json"
+
+    @property
+    def cache_dir(self) -> Path:
+        return self.directory / self.job_id
+
+    def save(self):
+        """İş kaydını yaz (yarım dosya bırakmamak için önce geçici dosyaya)"""
+        self.updated = time.time()
+        if not self.resumable:
+            return
+        data = {
+            "id": self.job_id,
+            "created": self.created,
+            "updated": self.updated,
+            "status": self.status,
+            "error": self.error,
+            "progress": self.progress,
+            "settings": self.settings,
+            "sources": [source_to_json(source) for source in self.sources],
+        }
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.manifest_path.with_name(f"{self.manifest_path.name}.{_tmp_tag()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, self.manifest_path)
+
+    def checkpoint(self, groups_done: int, groups_total: int, cards_done: int):
+        """Grup tamamlandığında ilerlemeyi kaydet (en fazla CHECKPOINT_INTERVAL_S'de bir)"""
+        self.progress = {"groups_done": groups_done, "groups_total": groups_total,
+                         "cards_done": cards_done}
+        now = time.monotonic()
+        if now - self._last_checkpoint >= CHECKPOINT_INTERVAL_S or groups_done == groups_total:
+            self._last_checkpoint = now
+            try:
+                self.save()
+            except OSError:
+                pass
+
+    def describe(self) -> str:
+        """Devam sorusu ve listeler için kısa açıklama"""
+        done, total = self.progress.get("groups_done", 0), self.progress.get("groups_total", 0)
+        state = {JOB_QUEUED: "sırada", JOB_CANCELLED: "iptal edildi",
+                 JOB_FAILED: "hata"}.get(self.status, "yarıda kaldı")
+        return (f"{self.created} · {len(self.sources)} kart · {done}/{total or '?'} sayfa grubu · "
+                f"{state} · {Path(self.settings.get('output_path', '')).name}")
+
+    def run(self, cache: Optional[RenderCache] = None, progress_callback=None,
+            status_callback=None, cancel_event: Optional[threading.Event] = None,
+            encode_stats: Optional[EncodeStats] = None,
+            stage_times: Optional[StageTimes] = None, error_callback=None) -> List[Path]:
+        """İşi çalıştır ya da kaldığı yerden sürdür
+
+        error_callback(kaynak, hata) atlanan kartlar için generate_outputs'a iletilir.
+        """
+        if cache is None or self.cache_dir.exists():
+            # Önbellek kapalıyken de tamamlanan gruplar kaybolmasın; iş bitince silinir.
+            # Önceki çalıştırma işe özel önbelleğe yazdıysa devamda da o kullanılır.
+            cache = RenderCache(self.cache_dir, max_mb=JOB_CACHE_MAX_MB)
+
+        settings = self.settings
+        self.status = JOB_RUNNING
+        self.error = None
+        self.save()
+        try:
+            outputs = generate_outputs(
+                self.sources,
+                card_height_cm=settings["card_height_cm"],
+                card_width_cm=settings["card_width_cm"],
+                front_margins=tuple(settings["front_margins"]),
+                back_margins=tuple(settings["back_margins"]),
+                render_dpi=settings["render_dpi"],
+                printer_dpi=settings.get("printer_dpi", DEFAULT_PRINTER_DPI),
+                cards_per_page=settings["cards_per_page"],
+                card_spacing_cm=settings.get("card_spacing_cm", 0.0),
+                output_path=Path(settings["output_path"]),
+                output_format=settings.get("output_format", "docx"),
+                progress_callback=progress_callback,
+                status_callback=status_callback,
+                workers=settings.get("workers", 0),
+                cache=cache,
+                codec=settings.get("codec"),
+                encode_stats=encode_stats,
+                stage_times=stage_times,
+                cancel_event=cancel_event,
+                checkpoint_callback=self.checkpoint,
+                error_callback=error_callback,
+            )
+        except (GenerationCancelled, KeyboardInterrupt):
+            self.status = JOB_CANCELLED
+            self._stopped(keep=True)
+            raise
+        except Exception as e:
+            self.status = JOB_FAILED
+            self.error = str(e)
+            # Hiçbir girdi okunamadıysa sürdürmek aynı hatayı verir
+            self._stopped(keep=not isinstance(e, NoValidCardsError))
+            raise
+
+        self.status = JOB_DONE
+        self.outputs = outputs
+        self.discard()
+        return outputs
+
+    def _stopped(self, keep: bool):
+        """Yarıda kalan işi devam için kaydet; sürdürülemeyecekse kaydını ve önbelleğini sil"""
+        if keep and self.resumable:
+            self.save()
+        else:
+            self.discard()
+
+    def discard(self):
+        """İş kaydını ve işe özel önbelleği sil"""
+        try:
+            self.manifest_path.unlink()
+        except OSError:
+            pass
+        if self.cache_dir.exists():
+            shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+
+def list_resumable_jobs(directory: Path = JOBS_DIR) -> List[GenerationJob]:
+    """Devam ettirilebilecek işler (en yenisi önce)
+
+    Çalışır görünen işler, başka bir oturumda hâlâ sürüyor olabilecekleri için
+    STALE_JOB_AFTER_S boyunca güncellenmemişlerse listelenir.
+    """
+    jobs = []
+    for path in Path(directory).glob("*.json"):
+        try:
+            job = GenerationJob.load(path)
+        except (OSError, ValueError, KeyError):
+            continue
+        if job.status == JOB_RUNNING and time.time() - job.updated < STALE_JOB_AFTER_S:
+            continue
+        jobs.append(job)
+    return sorted(jobs, key=lambda job: job.job_id, reverse=True)
+
+
+# ================== İŞ KUYRUĞU ==================
+
+class JobQueue:
+    """Bekleyen üretim işlerini arka planda çalıştıran zamanlayıcı
+
+    İşler eklendikleri sırayla, aynı anda en fazla max_running tanesi
+    çalışacak şekilde başlatılır. Sıradaki işler taşınabilir, sıradaki ya da
+    çalışan iş iptal edilebilir. Her durum/ilerleme değişikliği
+    on_change(job) ile, biten iş on_finished(job, error) ile bildirilir;
+    çağrılar işçi thread'inden gelir.
+
+    Sıradaki işler "queued" olarak kaydedildiğinden uygulama kapanırsa
+    list_resumable_jobs ile geri alınabilir.
+    """
+
+    FINISHED = (JOB_DONE, JOB_CANCELLED, JOB_FAILED)
+
+    def __init__(self, max_running: int = 1, cache: Optional[RenderCache] = None,
+                 on_change: Optional[Callable] = None, on_finished: Optional[Callable] = None):
+        self.max_running = max(1, int(max_running))
+        self.cache = cache
+        self.on_change = on_change
+        self.on_finished = on_finished
+        self.jobs: List[GenerationJob] = []
+        self._lock = threading.RLock()
+
+    def _notify(self, job: GenerationJob):
+        if self.on_change:
+            self.on_change(job)
+
+    def find(self, job_id: str) -> Optional[GenerationJob]:
+        with self._lock:
+            return next((job for job in self.jobs if job.job_id == job_id), None)
+
+    def active(self) -> List[GenerationJob]:
+        """Sıradaki ve çalışan işler"""
+        with self._lock:
+            return [job for job in self.jobs if job.status in (JOB_QUEUED, JOB_RUNNING)]
+
+    def running(self) -> List[GenerationJob]:
+        with self._lock:
+            return [job for job in self.jobs if job.status == JOB_RUNNING]
+
+    def _reserve_output_path(self, job: GenerationJob):
+        """Aynı çıktı yoluna yazacak başka bir aktif iş varsa dosya adına sıra ekle"""
+        taken = {Path(other.settings["output_path"]).with_suffix("")
+                 for other in self.active() if other is not job}
+        path = Path(job.settings["output_path"])
+        base, n = path.with_suffix(""), 2
+        candidate = base
+        while candidate in taken:
+            candidate = base.with_name(f"{base.name}_{n}")
+            n += 1
+        if candidate != base:
+            job.settings["output_path"] = str(candidate.with_suffix(path.suffix))
+
+    def submit(self, job: GenerationJob):
+        """İşi kuyruğun sonuna ekle"""
+        with self._lock:
+            self._reserve_output_path(job)
+            job.status = JOB_QUEUED
+            job.percent = 0.0
+            job.message = "Sırada"
+            job.cancel_event.clear()
+            job.encode_stats = EncodeStats()
+            job.stage_times = Tracer() if job.settings.get("write_trace") else StageTimes()
+            job.save()
+            self.jobs.append(job)
+        self._notify(job)
+        self._schedule()
+
+    def cancel(self, job_id: str):
+        """Sıradaki işi beklemeye al, çalışan işi durdur (iş kaydı korunur)"""
+        with self._lock:
+            job = self.find(job_id)
+            if job is None:
+                return
+            if job.status == JOB_QUEUED:
+                job.status = JOB_CANCELLED
+                job.message = "İptal edildi"
+                job.save()
+            elif job.status == JOB_RUNNING:
+                job.message = "İptal ediliyor..."
+                job.cancel_event.set()
+            else:
+                return
+        self._notify(job)
+
+    def resubmit(self, job_id: str) -> bool:
+        """İptal edilen ya da hata veren işi kaldığı yerden sürdürmek üzere sona ekle"""
+        with self._lock:
+            job = self.find(job_id)
+            if job is None or job.status not in (JOB_CANCELLED, JOB_FAILED):
+                return False
+            self.jobs.remove(job)
+        self.submit(job)
+        return True
+
+    def cancel_all(self):
+        for job in self.active():
+            self.cancel(job.job_id)
+
+    def move(self, job_id: str, offset: int) -> bool:
+        """Sıradaki işi diğer sıradaki işlere göre offset kadar (−1 yukarı, +1 aşağı) taşı"""
+        with self._lock:
+            queued = [job for job in self.jobs if job.status == JOB_QUEUED]
+            job = self.find(job_id)
+            if job not in queued:
+                return False
+            index = queued.index(job)
+            target = index + offset
+            if not 0 <= target < len(queued):
+                return False
+            other = queued[target]
+            a, b = self.jobs.index(job), self.jobs.index(other)
+            self.jobs[a], self.jobs[b] = other, job
+        self._notify(job)
+        return True
+
+    def remove_finished(self) -> List[GenerationJob]:
+        """Biten işleri listeden çıkar (iptal edilenlerin kaydı diskte kalır)"""
+        with self._lock:
+            finished = [job for job in self.jobs if job.status in self.FINISHED]
+            self.jobs = [job for job in self.jobs if job.status not in self.FINISHED]
+        return finished
+
+    def set_max_running(self, value: int):
+        self.max_running = max(1, int(value))
+        self._schedule()
+
+    def _schedule(self):
+        """Boş yer varsa sıradaki işleri başlat"""
+        with self._lock:
+            free = self.max_running - len(self.running())
+            starting = [job for job in self.jobs if job.status == JOB_QUEUED][:max(0, free)]
+            for job in starting:
+                job.status = JOB_RUNNING
+                job.message = "Başlatılıyor..."
+        for job in starting:
+            self._notify(job)
+            threading.Thread(target=self._run, args=(job,), daemon=True).start()
+
+    def _run(self, job: GenerationJob):
+        def progress(value: float):
+            job.percent = value
+            self._notify(job)
+
+        def status(text: str):
+            job.message = text
+            self._notify(job)
+
+        error = None
+        try:
+            job.run(cache=self.cache, progress_callback=progress, status_callback=status,
+                    cancel_event=job.cancel_event, encode_stats=job.encode_stats,
+                    stage_times=job.stage_times)
+            job.percent = 100.0
+            job.message = "Tamamlandı"
+        except GenerationCancelled as e:
+            error = e
+            job.message = "İptal edildi"
+        except Exception as e:
+            error = e
+            job.message = f"Hata: {e}"
+
+        self._notify(job)
+        if self.on_finished:
+            self.on_finished(job, error)
+        self._schedule()
+
+
+# ================== KLASÖR İZLEME ==================
+
+WATCH_DONE_DIR = "done"
+WATCH_FAILED_DIR = "failed"
+
+
+def profile_generation_settings(profile: Dict[str, Any]) -> Dict[str, Any]:
+    """Profildeki kart/çıktı ayarlarını üretim fonksiyonlarının parametrelerine çevir"""
+    def margins(key: str):
+        values = profile.get(key, {})
+        return tuple(float(values.get(side, 1.27)) for side in ("top", "bottom", "left", "right"))
+
+    return {
+        "card_height_cm": float(profile.get("card_height_cm", 5.81)),
+        "card_width_cm": float(profile.get("card_width_cm", 9.2)),
+        "front_margins": margins("front_margins"),
+        "back_margins": margins("back_margins"),
+        "render_dpi": parse_render_dpi(profile.get("render_dpi", 300)),
+        "printer_dpi": int(profile.get("printer_dpi", DEFAULT_PRINTER_DPI)),
+        "cards_per_page": parse_cards_per_page(profile.get("cards_per_page", 8)),
+        "card_spacing_cm": float(profile.get("card_spacing_cm", 0.0)),
+        "workers": int(profile.get("workers", 0)),
+        "codec": codec_from_settings(profile),
+    }
+
+
+def _move_unique(path: Path, directory: Path) -> Path:
+    """Dosyayı klasöre taşı; aynı adda dosya varsa ada sıra ekle"""
+    directory.mkdir(parents=True, exist_ok=True)
+    target = directory / path.name
+    n = 2
+    while target.exists():
+        target = directory / f"{path.stem}_{n}{path.suffix}"
+        n += 1
+    shutil.move(str(path), str(target))
+    return target
+
+
+class FolderWatcher:
+    """Sıcak klasör: klasöre bırakılan PDF'leri toplayıp kart dosyası üretir
+
+    Klasör poll_s aralıklarla taranır (alt klasörlere inilmez). Boyutu ve
+    değişiklik zamanı stable_s boyunca değişmeyen PDF'ler yazımı bitmiş
+    sayılır. Hazır PDF sayısı batch_size'a ulaşınca ya da ilk hazır PDF
+    batch_timeout_s beklediğinde, en eski batch_size tanesi tek bir Word
+    dosyasına dönüştürülür. İşlenen PDF'ler done/<tarih>/, işlenemeyenler
+    failed/<tarih>/ klasörüne (hata açıklamasıyla) taşınır.
+
+    Olaylar on_event(olay, **alanlar) ile bildirilir; komut satırının emit
+    fonksiyonu doğrudan verilebilir.
+    """
+
+    def __init__(self, directory: Path, generation: Dict[str, Any], output_dir: Path,
+                 filename_template: str = "kartlar_{date}_{time}",
+                 batch_size: int = 50, batch_timeout_s: float = 60, stable_s: float = 5,
+                 poll_s: float = 2, done_dir: Optional[Path] = None,
+                 failed_dir: Optional[Path] = None, cache: Optional[RenderCache] = None,
+                 on_event: Optional[Callable] = None):
+        self.directory = Path(directory)
+        self.generation = generation
+        self.output_dir = Path(output_dir)
+        self.filename_template = filename_template
+        self.batch_size = max(1, int(batch_size))
+        self.batch_timeout_s = batch_timeout_s
+        self.stable_s = stable_s
+        self.poll_s = poll_s
+        self.done_dir = Path(done_dir) if done_dir else self.directory / WATCH_DONE_DIR
+        self.failed_dir = Path(failed_dir) if failed_dir else self.directory / WATCH_FAILED_DIR
+        self.cache = cache
+        self.on_event = on_event
+        self.stop_event = threading.Event()
+
+        # yol -> (boyut, mtime_ns, imzanın ilk görüldüğü an, hazır olduğu an)
+        self.seen: Dict[Path, list] = {}
+        self.batches = 0
+        self.processed = 0
+        self.failed = 0
+
+    def _emit(self, event: str, **fields):
+        if self.on_event:
+            self.on_event(event, **fields)
+
+    def scan(self, now: Optional[float] = None) -> List[Path]:
+        """Klasörü tara, yazımı bitmiş PDF'leri geliş sırasıyla döndür"""
+        now = time.monotonic() if now is None else now
+        present = set()
+        try:
+            entries = list(os.scandir(self.directory))
+        except OSError as e:
+            self._emit("warning", path=str(self.directory), message=str(e))
+            return []
+
+        for entry in entries:
+            if not entry.name.lower().endswith(".pdf") or entry.name.startswith(("~", ".")):
+                continue
+            try:
+                if not entry.is_file():
+                    continue
+                st = entry.stat()
+            except OSError:
+                continue
+            path = Path(entry.path)
+            present.add(path)
+            record = self.seen.get(path)
+            if record is None or record[:2] != [st.st_size, st.st_mtime_ns]:
+                self.seen[path] = [st.st_size, st.st_mtime_ns, now, None]
+            elif record[3] is None and now - record[2] >= self.stable_s:
+                record[3] = now
+
+        for path in list(self.seen):
+            if path not in present:
+                del self.seen[path]
+
+        ready = [(record[3], record[1], path.name, path)
+                 for path, record in self.seen.items() if record[3] is not None]
+        return [path for _, _, _, path in sorted(ready)]
+
+    def poll(self, now: Optional[float] = None, flush: bool = False) -> Optional[Dict[str, Any]]:
+        """Bir tarama yap; toplu iş koşulu sağlandıysa üret ve sonucunu döndür
+
+        flush=True ise zaman aşımı beklenmeden hazır PDF'ler işlenir.
+        """
+        now = time.monotonic() if now is None else now
+        ready = self.scan(now)
+        if not ready:
+            return None
+        oldest = self.seen[ready[0]][3]
+        if len(ready) < self.batch_size and not flush and now - oldest < self.batch_timeout_s:
+            return None
+        return self.run_batch(ready[:self.batch_size])
+
+    def _output_path(self) -> Path:
+        base = build_output_path(self.output_dir, self.filename_template)
+        path, n = base, 2
+        while path.exists():  # aynı saniyede biten toplu işler
+            path = base.with_name(f"{base.stem}_{n}{base.suffix}")
+            n += 1
+        return path
+
+    def run_batch(self, files: List[Path]) -> Dict[str, Any]:
+        """PDF'leri tek dosyaya dönüştür, girdileri done/failed klasörlerine taşı"""
+        started = time.perf_counter()
+        day = datetime.now().strftime("%Y%m%d")
+        output_path = self._output_path()
+        self._emit("batch", pdfs=len(files), output=str(output_path))
+
+        errors: Dict[Path, str] = {}
+        try:
+            generate_doc_from_pdfs(
+                files,
+                output_path=output_path,
+                cache=self.cache,
+                error_callback=lambda source, error: errors.__setitem__(source, str(error)),
+                **self.generation,
+            )
+            batch_error = None
+        except Exception as e:
+            batch_error = str(e)
+            output_path = None
+
+        moved_failed = []
+        for path in files:
+            self.seen.pop(path, None)
+            error = batch_error or errors.get(path)
+            try:
+                if error is None:
+                    _move_unique(path, self.done_dir / day)
+                else:
+                    target = _move_unique(path, self.failed_dir / day)
+                    target.with_name(f"{target.name}.error.txt").write_text(error, encoding="utf-8")
+                    moved_failed.append(path.name)
+            except OSError as e:
+                self._emit("warning", path=str(path), message=f"Taşınamadı: {e}")
+
+        self.batches += 1
+        self.processed += len(files) - len(moved_failed)
+        self.failed += len(moved_failed)
+        result = {
+            "output": str(output_path) if output_path else None,
+            "pdfs": len(files),
+            "failed": moved_failed,
+            "error": batch_error,
+            "elapsed_s": round(time.perf_counter() - started, 3),
+        }
+        self._emit("batch_done", **result)
+        return result
+
+    def run(self, flush_on_idle: bool = False):
+        """stop() çağrılana kadar izle; flush_on_idle ise hazır PDF kalmayınca dön"""
+        self._emit("watch", path=str(self.directory), batch_size=self.batch_size,
+                   batch_timeout_s=self.batch_timeout_s, stable_s=self.stable_s)
+        while not self.stop_event.is_set():
+            result = self.poll(flush=flush_on_idle)
+            if result is not None:
+                continue  # birikmiş PDF varsa beklemeden sonraki toplu işe geç
+            if flush_on_idle and not self.seen:
+                break
+            self.stop_event.wait(self.poll_s)
+        self._emit("stopped", batches=self.batches, processed=self.processed, failed=self.failed)
+
+    def stop(self):
+        self.stop_event.set()
@@ -0,0 +1,368 @@
+# -*- coding: utf-8 -*-
+"""
+Medar Yaka Kart Otomasyonu - HTTP Servisi
+=========================================
+Yerel ağdaki makinelerin kurulum yapmadan kart üretebilmesi için standart
+kütüphaneyle yazılmış küçük bir HTTP servisi:
+
+    medar-yakakart serve --port 8765
+
+    curl -F profile="Personel Kartı" -F file=@kart1.pdf -F file=@kart2.pdf \\
+         http://localhost:8765/generate -o kartlar.docx
+    curl --data-binary @kartlar.zip -H "Content-Type: application/zip" \\
+         "http://localhost:8765/generate?profile=Varsayılan&format=pdf" -o kartlar.pdf
+    curl http://localhost:8765/status
+
+Üretimler sınırlı bir iş havuzunda çalışır; havuz ve bekleme sırası doluysa
+istek 503 (Retry-After) ile reddedilir. Bozuk yüklemeler 4xx, beklenmeyen
+hatalar 500 olarak JSON gövdeyle yanıtlanır. Yüklenen dosyalar ve çıktı geçici
+klasörde tutulur, yanıt gönderildikten sonra silinir.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, Future
+from email.errors import MessageError
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from .core import (
+    close_archive_handles, list_archive_members, load_profiles, profile_generation_settings, generate_outputs,
+    NoValidCardsError, RenderCache,
+)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+# Aynı anda çalışan üretim sayısı ve bunlara ek olarak bekleyebilecek istek sayısı
+DEFAULT_WORKERS = 2
+DEFAULT_QUEUE = 8
+DEFAULT_MAX_UPLOAD_MB = 200
+
+SERVICE_FORMATS = {
+    "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "pdf": "application/pdf",
+}
+RESPONSE_CHUNK = 256 * 1024
+
+
+class ServiceError(Exception):
+    """İstemciye HTTP durum koduyla döndürülen hata"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+# ================== İŞ HAVUZU ==================
+
+def default_job_workers(workers: int) -> int:
+    """Üretim başına render süreci: çekirdekler eşzamanlı üretimler arasında paylaştırılır"""
+    return max(1, (os.cpu_count() or 2) // max(1, workers))
+
+
+class RenderService:
+    """Sınırlı iş havuzu: üretimleri kuyruğa alır, doluluğu ve sayaçları tutar
+
+    İstek gövdesi okunmadan önce reserve() ile yer ayrılır; dolu serviste
+    yükleme hiç okunmadan 503 döner. Her üretim en fazla job_workers render
+    süreci kullanır (varsayılan: çekirdek sayısı / workers), böylece
+    eşzamanlı üretim sınırı CPU kullanımını da sınırlar.
+    """
+
+    def __init__(self, workers: int = DEFAULT_WORKERS, queue_size: int = DEFAULT_QUEUE,
+                 cache: Optional[RenderCache] = None, job_workers: Optional[int] = None):
+        self.workers = max(1, workers)
+        self.queue_size = max(0, queue_size)
+        self.cache = cache
+        self.job_workers = job_workers if job_workers else default_job_workers(self.workers)
+        self.executor = ThreadPoolExecutor(max_workers=self.workers,
+                                           thread_name_prefix="yakakart-render")
+        self.started = time.time()
+        self._lock = threading.Lock()
+        self.pending = 0
+        self.running = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.cards = 0
+
+    def reserve(self):
+        """Üretim için yer ayır; havuz ve sıra doluysa ServiceError(503)"""
+        with self._lock:
+            if self.pending >= self.workers + self.queue_size:
+                self.rejected += 1
+                raise ServiceError(503, "Servis dolu, lütfen biraz sonra tekrar deneyin")
+            self.pending += 1
+
+    def release(self):
+        """submit edilmeyen ayrılmış yeri bırak"""
+        with self._lock:
+            self.pending -= 1
+
+    def submit(self, sources: list, profile_name: str, output_format: str,
+               work_dir: Path) -> Future:
+        """Üretimi reserve() ile ayrılmış yerde havuza ekle
+
+        Hata fırlatırsa yer ayrılmış kalır; çağıran release() etmelidir.
+        """
+        profiles = load_profiles()
+        if profile_name not in profiles:
+            raise ServiceError(400, f"Profil bulunamadı: {profile_name} "
+                                    f"(mevcut: {', '.join(profiles)})")
+        try:
+            settings = profile_generation_settings(profiles[profile_name])
+        except ValueError as e:
+            raise ServiceError(400, str(e))
+        settings["workers"] = self.job_workers
+
+        future = self.executor.submit(self._generate, sources, settings, output_format, work_dir)
+        future.add_done_callback(self._finished)
+        return future
+
+    def _generate(self, sources: list, settings: Dict[str, Any], output_format: str,
+                  work_dir: Path) -> Path:
+        with self._lock:
+            self.running += 1
+        try:
+            outputs = generate_outputs(sources, output_path=work_dir / "kartlar.docx",
+                                       output_format=output_format, cache=self.cache,
+                                       **settings)
+        finally:
+            with self._lock:
+                self.running -= 1
+        with self._lock:
+            self.cards += len(sources)
+        return outputs[0]
+
+    def _finished(self, future: Future):
+        with self._lock:
+            self.pending -= 1
+            if future.exception() is None:
+                self.completed += 1
+            else:
+                self.failed += 1
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "uptime_s": round(time.time() - self.started, 1),
+                "workers": self.workers,
+                "queue_size": self.queue_size,
+                "running": self.running,
+                "queued": self.pending - self.running,
+                "completed": self.completed,
+                "failed": self.failed,
+                "rejected": self.rejected,
+                "cards": self.cards,
+                "profiles": list(load_profiles().keys()),
+                "formats": list(SERVICE_FORMATS),
+            }
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+# ================== İSTEK AYRIŞTIRMA ==================
+
+def parse_uploads(content_type: str, body: bytes) -> Tuple[List[Tuple[str, bytes]], Dict[str, str]]:
+    """İstek gövdesinden (dosya adı, içerik) listesi ve form alanlarını çıkar
+
+    multipart/form-data'da dosya alanları ve metin alanları (profile, format)
+    ayrılır; diğer içerik türlerinde gövde tek bir dosya sayılır.
+    """
+    if not content_type.lower().startswith("multipart/form-data"):
+        return [("upload", body)], {}
+
+    try:
+        message = BytesParser(policy=HTTP).parsebytes(
+            b"Content-Type: " + content_type.encode("latin-1") + b"\r\n\r\n" + body)
+        if not message.is_multipart():
+            raise ServiceError(400, "Geçersiz multipart gövdesi")
+
+        files, fields = [], {}
+        for part in message.iter_parts():
+            name = part.get_param("name", header="content-disposition") or ""
+            data = part.get_payload(decode=True) or b""
+            filename = part.get_filename()
+            if filename is not None:
+                files.append((filename, data))
+            else:
+                fields[name] = data.decode("utf-8", errors="replace").strip()
+    except (ValueError, MessageError) as e:
+        raise ServiceError(400, f"Geçersiz multipart gövdesi: {e}")
+    return files, fields
+
+
+def save_uploads(files: List[Tuple[str, bytes]], work_dir: Path) -> list:
+    """Yüklenen PDF/ZIP dosyalarını geçici klasöre yaz, kart kaynaklarını döndür"""
+    sources = []
+    for index, (filename, data) in enumerate(files):
+        stem = Path(filename).stem or "upload"
+        if data.startswith(b"%PDF"):
+            path = work_dir / f"{index:04d}_{stem}.pdf"
+            path.write_bytes(data)
+            sources.append(path)
+        elif data.startswith(b"PK\x03\x04"):
+            path = work_dir / f"{index:04d}_{stem}.zip"
+            path.write_bytes(data)
+            try:
+                members = sorted(list_archive_members(path), key=lambda m: m.member)
+            except RuntimeError as e:
+                raise ServiceError(400, f"Arşiv okunamadı: {e}")
+            if not members:
+                raise ServiceError(400, f"Arşivde PDF yok: {filename}")
+            sources.extend(members)
+        else:
+            raise ServiceError(415, f"Desteklenmeyen dosya (PDF ya da ZIP olmalı): {filename}")
+    if not sources:
+        raise ServiceError(400, "Yüklenen PDF yok")
+    return sources
+
+
+# ================== HTTP ==================
+
+class RequestHandler(BaseHTTPRequestHandler):
+    """/generate (POST) ve /status (GET) uçları"""
+
+    server_version = "MedarYakaKart/3.0"
+    protocol_version = "HTTP/1.1"
+
+    @property
+    def service(self) -> RenderService:
+        return self.server.service
+
+    def log_message(self, format, *args):
+        if self.server.on_event:
+            self.server.on_event("request", client=self.client_address[0], message=format % args)
+
+    def send_json(self, status: int, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+        if path in ("/status", "/"):
+            self.send_json(200, self.service.status())
+        else:
+            self.send_json(404, {"error": "Bulunamadı", "endpoints": ["GET /status", "POST /generate"]})
+
+    def read_body(self) -> bytes:
+        length = self.headers.get("Content-Length")
+        if length is None:
+            raise ServiceError(411, "Content-Length gerekli")
+        try:
+            length = int(length)
+        except ValueError:
+            raise ServiceError(400, f"Geçersiz Content-Length: {length}")
+        if length < 0:
+            raise ServiceError(400, f"Geçersiz Content-Length: {length}")
+        if length > self.server.max_upload_bytes:
+            raise ServiceError(413, f"Yükleme çok büyük (en fazla "
+                                    f"{self.server.max_upload_bytes // (1024 * 1024)} MB)")
+        return self.rfile.read(length)
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        if url.path != "/generate":
+            self.send_json(404, {"error": "Bulunamadı"})
+            return
+
+        started = time.perf_counter()
+        work_dir = Path(tempfile.mkdtemp(prefix="yakakart_http_"))
+        reserved = False
+        self.response_started = False
+        try:
+            # Dolu serviste yükleme okunmadan reddedilir
+            self.service.reserve()
+            reserved = True
+            body = self.read_body()
+            files, fields = parse_uploads(self.headers.get("Content-Type", ""), body)
+            query = {key: values[0] for key, values in parse_qs(url.query).items()}
+            profile_name = fields.get("profile") or query.get("profile") or "Varsayılan"
+            output_format = fields.get("format") or query.get("format") or "docx"
+            if output_format not in SERVICE_FORMATS:
+                raise ServiceError(400, f"Geçersiz biçim: {output_format} "
+                                        f"({', '.join(SERVICE_FORMATS)})")
+
+            sources = save_uploads(files, work_dir)
+            future = self.service.submit(sources, profile_name, output_format, work_dir)
+            reserved = False  # yer artık üretimin; bitince _finished bırakır
+            try:
+                output_path = future.result()
+            except NoValidCardsError as e:
+                # Yüklenen PDF'lerin hiçbiri açılamadı: istemci hatası
+                raise ServiceError(422, str(e))
+            except Exception as e:
+                raise ServiceError(500, str(e))
+
+            self.send_file(output_path, SERVICE_FORMATS[output_format], {
+                "X-Cards": str(len(sources)),
+                "X-Elapsed-S": f"{time.perf_counter() - started:.3f}",
+            })
+        except ServiceError as e:
+            headers = {"Retry-After": "5"} if e.status == 503 else None
+            # Okunmamış gövde kalmışsa bağlantı yeniden kullanılamaz
+            self.close_connection = True
+            self.send_json(e.status, {"error": str(e)}, headers)
+        except Exception as e:
+            self.close_connection = True
+            if self.server.on_event:
+                self.server.on_event("error", client=self.client_address[0],
+                                     message=f"{type(e).__name__}: {e}")
+            # Yanıt yarıda kaldıysa (ör. istemci koptu) ikinci bir yanıt yazılamaz
+            if not self.response_started:
+                self.send_json(500, {"error": f"Sunucu hatası: {e}"})
+        finally:
+            if reserved:
+                self.service.release()
+            close_archive_handles(work_dir)
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    def send_file(self, path: Path, content_type: str, headers: Dict[str, str]):
+        """Çıktıyı parça parça gönder"""
+        size = path.stat().st_size
+        self.response_started = True
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(size))
+        self.send_header("Content-Disposition", f'attachment; filename="{path.name}"')
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.end_headers()
+        with open(path, 'rb') as f:
+            shutil.copyfileobj(f, self.wfile, RESPONSE_CHUNK)
+
+
+class RenderHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], service: RenderService,
+                 max_upload_mb: int = DEFAULT_MAX_UPLOAD_MB, on_event: Optional[Callable] = None):
+        super().__init__(address, RequestHandler)
+        self.service = service
+        self.max_upload_bytes = max_upload_mb * 1024 * 1024
+        self.on_event = on_event
+
+
+def create_server(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                  workers: int = DEFAULT_WORKERS, queue_size: int = DEFAULT_QUEUE,
+                  max_upload_mb: int = DEFAULT_MAX_UPLOAD_MB, cache: Optional[RenderCache] = None,
+                  job_workers: Optional[int] = None,
+                  on_event: Optional[Callable] = None) -> RenderHTTPServer:
+    """Sunucuyu oluştur (port 0 ise boş bir port seçilir; server_address'ten okunur)"""
+    service = RenderService(workers, queue_size, cache, job_workers)
+    return RenderHTTPServer((host, port), service, max_upload_mb, on_event)
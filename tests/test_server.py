@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""HTTP servisinin localhost üzerinde uçtan uca denemesi"""
+
+import http.client
+import json
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+fitz = pytest.importorskip("pymupdf")
+pytest.importorskip("docx")
+pytest.importorskip("PIL")
+
+from medar_yakakart import server as server_module  # noqa: E402
+from medar_yakakart.server import create_server  # noqa: E402
+
+
+def make_pdf(pages: int = 2) -> bytes:
+    """Ön ve arka yüz sayfalı küçük bir kart PDF'i"""
+    doc = fitz.open()
+    for number in range(pages):
+        page = doc.new_page(width=260, height=165)
+        page.insert_text((20, 40), f"Kart yüzü {number + 1}")
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+@pytest.fixture
+def service_address():
+    httpd = create_server(port=0, workers=1, queue_size=0, max_upload_mb=1, job_workers=1)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield httpd
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+        httpd.service.shutdown()
+
+
+def wait_idle(httpd, timeout: float = 5.0) -> bool:
+    """Yanıttan sonra bırakılan iş yerinin boşalmasını bekle"""
+    deadline = time.monotonic() + timeout
+    while httpd.service.pending and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return httpd.service.pending == 0
+
+
+def post(httpd, body: bytes, headers=None, path: str = "/generate"):
+    host, port = httpd.server_address[:2]
+    conn = http.client.HTTPConnection(host, port, timeout=60)
+    try:
+        conn.request("POST", path, body=body,
+                     headers={"Content-Type": "application/pdf", **(headers or {})})
+        response = conn.getresponse()
+        return response.status, dict(response.getheaders()), response.read()
+    finally:
+        conn.close()
+
+
+def test_generate_returns_docx(service_address):
+    status, headers, body = post(service_address, make_pdf())
+    assert status == 200
+    assert headers["X-Cards"] == "1"
+    assert body.startswith(b"PK")
+    assert service_address.service.status()["completed"] == 1
+
+
+def test_corrupt_zip_is_bad_request(service_address):
+    status, _, body = post(service_address, b"PK\x03\x04" + b"\0" * 64,
+                           {"Content-Type": "application/zip"})
+    assert status == 400
+    assert "error" in json.loads(body)
+    assert wait_idle(service_address)
+
+
+def test_unreadable_pdf_is_client_error(service_address):
+    status, _, body = post(service_address, b"%PDF-1.7 bozuk")
+    assert status == 422
+    assert "error" in json.loads(body)
+
+
+def test_invalid_content_length_is_bad_request(service_address):
+    status, _, _ = post(service_address, b"", {"Content-Length": "-5"})
+    assert status == 400
+
+
+def test_large_upload_is_rejected(service_address):
+    status, _, body = post(service_address, b"%PDF", {"Content-Length": str(2 * 1024 * 1024)})
+    assert status == 413
+    assert "error" in json.loads(body)
+
+
+def test_full_service_is_rejected(service_address):
+    service_address.service.reserve()  # tek iş yeri dolu
+    try:
+        status, headers, _ = post(service_address, make_pdf())
+    finally:
+        service_address.service.release()
+    assert status == 503
+    assert headers["Retry-After"] == "5"
+    assert service_address.service.status()["rejected"] == 1
+
+
+def test_unexpected_error_returns_json(service_address):
+    with mock.patch.object(server_module, "save_uploads", side_effect=KeyError("x")):
+        status, _, body = post(service_address, make_pdf())
+    assert status == 500
+    assert "error" in json.loads(body)
+    assert wait_idle(service_address)